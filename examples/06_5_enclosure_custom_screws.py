@@ -23,7 +23,7 @@ enclosure.add_part_to_face(Face.TOP, "SPST", pf.build_button(), rel_pos=(0, 0))
 #   as its centred at (0,0).
 # This makes adding screws more verbose than it should; see issue #7.
 screw_size_category = "m2"
-screw_size = ScrewBlock().build(screw_size_category, Enclosure.CORNER_LID_SCREWS_THICKNESS, enclosure.size.wall_thickness)["size"]
+screw_size = ScrewBlock.block_size(DefaultScrewProvider, screw_size_category, Enclosure.CORNER_LID_SCREWS_THICKNESS)
 
 sw = screw_size[0]
 sl = screw_size[1]
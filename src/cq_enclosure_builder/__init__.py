@@ -1,12 +1,33 @@
+import importlib
+
 from . import constants
 from .project_info import ProjectInfo
 from .panel_size import PanelSize
 from .part import Part, PartSize
 from .parts_factory import PartFactory
+from .detail_level import DetailLevel
+from .boolean_options import BooleanOptions, Glue
 from .face import Face
 from .panel import Panel
-from .enclosure import Enclosure, EnclosureSize
-from . import parts
-from . import screws
 from . import utils
-from . import layout_builder
\ No newline at end of file
+from . import layout_builder
+
+# Imported on first access, as they pull in cq_warehouse and the parts' modules
+_LAZY_ATTRIBUTES = {
+    "Enclosure": (".enclosure", "Enclosure"),
+    "EnclosureSize": (".enclosure", "EnclosureSize"),
+    "parts": (".parts", None),
+    "screws": (".screws", None),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name, __name__)
+        return getattr(module, attribute) if attribute else module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_LAZY_ATTRIBUTES.keys()))
@@ -0,0 +1,78 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import sys
+import time
+import argparse
+
+from cq_enclosure_builder import PartFactory
+from cq_enclosure_builder.part_cache import CACHE_DIR_ENV_VAR
+
+# Usage: python -m cq_enclosure_builder prefetch manifest.json --cache-dir ~/.cache/cq_enclosure_builder
+#        python -m cq_enclosure_builder prune --cache-dir ~/.cache/cq_enclosure_builder
+
+
+def _enable_disk_cache(args: argparse.Namespace) -> bool:
+    if args.cache_dir is not None:
+        PartFactory.set_disk_cache_dir(args.cache_dir)
+    if PartFactory._disk_cache is None:
+        print(f"ERROR: no cache directory; pass --cache-dir, or set {CACHE_DIR_ENV_VAR}.", file=sys.stderr)
+        return False
+    return True
+
+
+def prefetch(args: argparse.Namespace) -> int:
+    if not _enable_disk_cache(args):
+        return 1
+
+    start_time = time.perf_counter()
+    parts = PartFactory.prefetch(args.manifest, max_workers=args.workers)
+    print(f"{len(parts)} parts prefetched into '{PartFactory._disk_cache.directory}' in {time.perf_counter() - start_time:.1f}s")
+    if args.report:
+        print(PartFactory.build_report())
+    return 0
+
+
+def prune(args: argparse.Namespace) -> int:
+    if not _enable_disk_cache(args):
+        return 1
+
+    pruned = PartFactory.prune_disk_cache()
+    print(f"{pruned} stale entries deleted from '{PartFactory._disk_cache.directory}'")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cq_enclosure_builder")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="Build the parts of a manifest into the on-disk cache.")
+    prefetch_parser.add_argument("manifest", help="JSON or YAML manifest; see PartFactory.save_manifest.")
+    prefetch_parser.add_argument("--cache-dir", default=None, help=f"On-disk cache directory (default: ${CACHE_DIR_ENV_VAR}).")
+    prefetch_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs).")
+    prefetch_parser.add_argument("--report", action="store_true", help="Print the build report at the end.")
+    prefetch_parser.set_defaults(func=prefetch)
+
+    prune_parser = subparsers.add_parser("prune", help="Delete the on-disk cache entries built from an older version of their part.")
+    prune_parser.add_argument("--cache-dir", default=None, help=f"On-disk cache directory (default: ${CACHE_DIR_ENV_VAR}).")
+    prune_parser.set_defaults(func=prune)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
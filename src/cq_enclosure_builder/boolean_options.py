@@ -0,0 +1,93 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from enum import Enum
+from typing import Iterable, Union
+
+import cadquery as cq
+from OCP.BOPAlgo import BOPAlgo_GlueEnum
+from OCP.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCP.TopTools import TopTools_ListOfShape
+
+# Options of the OCCT boolean operations run when assembling the panels and the frame of an enclosure
+#   (see utils/workplane_utils.py's cut_all).
+
+
+class Glue(Enum):
+    OFF = "off"      # no assumption on the shapes
+    SHIFT = "shift"  # the shapes only share faces, or are apart (e.g. a mask flush with a wall); faster
+    FULL = "full"    # the shapes only share whole faces, edges, or vertices; fastest
+
+    @property
+    def occt_value(self) -> BOPAlgo_GlueEnum:
+        return {
+            Glue.OFF: BOPAlgo_GlueEnum.BOPAlgo_GlueOff,
+            Glue.SHIFT: BOPAlgo_GlueEnum.BOPAlgo_GlueShift,
+            Glue.FULL: BOPAlgo_GlueEnum.BOPAlgo_GlueFull,
+        }[self]
+
+
+class BooleanOptions:
+    def __init__(
+        self,
+        run_parallel: bool = True,  # run the boolean operations on several threads
+        fuzzy_value: float = 0.0,   # additional tolerance, e.g. 0.001 to merge near-coincident faces of a mask and a wall
+        glue: Union[Glue, str] = Glue.OFF,
+    ):
+        if fuzzy_value < 0:
+            raise ValueError(f"fuzzy_value must be >= 0, got {fuzzy_value}")
+        try:
+            glue = Glue(glue)
+        except ValueError:
+            raise ValueError(f"Unknown glue option '{glue}'; available: {[g.value for g in Glue]}")
+        self.run_parallel: bool = run_parallel
+        self.fuzzy_value: float = fuzzy_value
+        self.glue: Glue = glue
+
+    def cut(self, shape: cq.Shape, tools: Iterable[cq.Shape]) -> cq.Shape:
+        """`shape` minus all `tools`, in a single boolean operation."""
+        arguments = TopTools_ListOfShape()
+        # Like cadquery, the shapes of a compound are passed separately (they may overlap)
+        for argument in (shape if isinstance(shape, cq.Compound) else (shape,)):
+            arguments.Append(argument.wrapped)
+        tools_list = TopTools_ListOfShape()
+        for tool in tools:
+            tools_list.Append(tool.wrapped)
+
+        operation = BRepAlgoAPI_Cut()
+        operation.SetArguments(arguments)
+        operation.SetTools(tools_list)
+        operation.SetRunParallel(self.run_parallel)
+        if self.fuzzy_value > 0:
+            operation.SetFuzzyValue(self.fuzzy_value)
+        operation.SetGlue(self.glue.occt_value)
+        operation.Build()
+        if not operation.IsDone():
+            raise ValueError(f"Boolean cut failed with {self}")
+        return cq.Shape.cast(operation.Shape())
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, BooleanOptions)
+                and (self.run_parallel, self.fuzzy_value, self.glue) == (other.run_parallel, other.fuzzy_value, other.glue))
+
+    def __hash__(self) -> int:
+        return hash((self.run_parallel, self.fuzzy_value, self.glue))
+
+    def __repr__(self) -> str:
+        return f"BooleanOptions(run_parallel={self.run_parallel}, fuzzy_value={self.fuzzy_value}, glue={self.glue.value!r})"
+
+
+DEFAULT_BOOLEAN_OPTIONS: BooleanOptions = BooleanOptions()
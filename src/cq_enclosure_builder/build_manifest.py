@@ -0,0 +1,159 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import os
+import json
+import types
+import importlib
+from enum import Enum
+from typing import List, Dict, Tuple, Any, Union
+
+# Build manifests: lists of parts to build, used by PartFactory.prefetch to warm the caches up before a run.
+#
+# A manifest is a JSON (or YAML, if PyYAML is installed) list of entries, each either:
+#   - {"category": "jack", "part_type": "6.35mm PJ-612A", "kwargs": {"enclosure_wall_thickness": 2}}
+#   - ["jack", "6.35mm PJ-612A", {"enclosure_wall_thickness": 2}]
+#
+# Parameters that aren't plain JSON values are tagged, so that they can be recreated:
+#   {"__tuple__": [...]}, {"__enum__": "<module>.<Enum>", "name": ...}, {"__type__": "<module>.<class>"},
+#   and {"__object__": "<module>.<class>", "fields": {...}} for plain value objects such as KnobOrCap.
+
+YAML_EXTENSIONS: List[str] = [".yaml", ".yml"]
+
+
+class UnencodableParameter(ValueError):
+    """A parameter (e.g. a lambda) that can't be written to a manifest."""
+
+
+def load_manifest(manifest: Union[str, os.PathLike, List[Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Read a manifest (a path, or the already-parsed list of entries) as (category, kwargs) tuples for PartFactory.build_many."""
+    if isinstance(manifest, (str, os.PathLike)):
+        manifest = _read_file(os.fspath(manifest))
+    if not isinstance(manifest, list):
+        raise ValueError(f"A manifest should be a list of parts, got {type(manifest).__name__}.")
+
+    specs = []
+    for entry in manifest:
+        if isinstance(entry, dict):
+            entry = dict(entry)
+            category = entry.pop("category")
+            part_type = entry.pop("part_type", None)
+            kwargs = entry.pop("kwargs", {})
+            kwargs.update(entry)  # parameters can also be given next to the category
+        elif isinstance(entry, (list, tuple)) and len(entry) in (2, 3):
+            category, part_type = entry[0], entry[1]
+            kwargs = entry[2] if len(entry) == 3 else {}
+        else:
+            raise ValueError(f"Invalid manifest entry: {entry!r}; expected a dict, or a [category, part_type, kwargs] list.")
+        kwargs = {name: decode_parameter(value) for name, value in kwargs.items()}
+        if part_type is not None:
+            kwargs["part_type"] = part_type
+        specs.append((category, kwargs))
+    return specs
+
+
+def save_manifest(path: Union[str, os.PathLike], entries: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+    """
+    Write (category, part_type, kwargs) entries to `path` (YAML if its extension is .yaml or .yml, JSON otherwise).
+    Entries with a parameter that can't be encoded are skipped with a warning. Returns the number of entries written.
+    """
+    encoded_entries = []
+    for category, part_type, kwargs in entries:
+        try:
+            encoded_kwargs = {name: encode_parameter(value) for name, value in kwargs.items()}
+        except UnencodableParameter as e:
+            print(f"WARNING: {category}/{part_type} not added to the manifest: {e}")
+            continue
+        encoded_entries.append({"category": category, "part_type": part_type, "kwargs": encoded_kwargs})
+
+    path = os.fspath(path)
+    with open(path, "w") as f:
+        if os.path.splitext(path)[1].lower() in YAML_EXTENSIONS:
+            _yaml().safe_dump(encoded_entries, f, sort_keys=False)
+        else:
+            json.dump(encoded_entries, f, indent=2)
+    return len(encoded_entries)
+
+
+def encode_parameter(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {"__enum__": _type_path(type(value)), "name": value.name}
+    if isinstance(value, type):
+        return {"__type__": _type_path(value)}
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode_parameter(v) for v in value]}
+    if isinstance(value, list):
+        return [encode_parameter(v) for v in value]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {k: encode_parameter(v) for k, v in value.items()}
+    if not callable(value) and not isinstance(value, types.ModuleType) and hasattr(value, "__dict__") and "<" not in type(value).__qualname__:
+        # Plain value objects, e.g. KnobOrCap
+        return {"__object__": _type_path(type(value)), "fields": {k: encode_parameter(v) for k, v in vars(value).items()}}
+    raise UnencodableParameter(f"can't encode {value!r}")
+
+
+def decode_parameter(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode_parameter(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__tuple__" in value:
+        return tuple(decode_parameter(v) for v in value["__tuple__"])
+    if "__enum__" in value:
+        return _resolve(value["__enum__"])[value["name"]]
+    if "__type__" in value:
+        return _resolve(value["__type__"])
+    if "__object__" in value:
+        cls = _resolve(value["__object__"])
+        obj = cls.__new__(cls)
+        obj.__dict__.update({k: decode_parameter(v) for k, v in value["fields"].items()})
+        return obj
+    return {k: decode_parameter(v) for k, v in value.items()}
+
+
+def _read_file(path: str) -> Any:
+    with open(path, "r") as f:
+        if os.path.splitext(path)[1].lower() in YAML_EXTENSIONS:
+            return _yaml().safe_load(f)
+        return json.load(f)
+
+
+def _yaml():
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("Reading or writing YAML manifests requires PyYAML (`pip install pyyaml`); use a .json manifest instead.")
+    return yaml
+
+
+def _type_path(t: type) -> str:
+    return f"{t.__module__}.{t.__qualname__}"
+
+
+def _resolve(path: str) -> Any:
+    """Import `<module>.<qualname>`, trying the longest module name first."""
+    parts = path.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        try:
+            obj = importlib.import_module(".".join(parts[:i]))
+        except ImportError:
+            continue
+        for name in parts[i:]:
+            obj = getattr(obj, name)
+        return obj
+    raise ValueError(f"Can't import '{path}'.")
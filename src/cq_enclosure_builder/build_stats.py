@@ -0,0 +1,131 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import json
+import threading
+from typing import List, Dict, Any, Hashable, Union
+
+
+class BuildStatsEntry:
+    """Statistics for one (category, part_type, parameters) cache key."""
+
+    def __init__(self, category: str, part_type: str, parameters: str):
+        self.category = category
+        self.part_type = part_type
+        self.parameters = parameters
+        self.builds: int = 0
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.total_build_time: float = 0  # seconds, only counting actual builds
+        self.geometry_bytes: Union[int, None] = None  # size of the serialized BREP, if measured
+
+    @property
+    def average_build_time(self) -> float:
+        return self.total_build_time / self.builds if self.builds > 0 else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "category": self.category,
+            "part_type": self.part_type,
+            "parameters": self.parameters,
+            "builds": self.builds,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "total_build_time": self.total_build_time,
+            "average_build_time": self.average_build_time,
+            "geometry_bytes": self.geometry_bytes,
+        }
+
+
+class BuildStats:
+    """
+    Records, per PartFactory cache key, how often a part was built or served from a cache,
+    and how long building it took.
+
+    Measuring the geometry size requires serializing the part, so it's only done when
+    `record_geometry_size` is True (or when the size is already known, e.g. with a byte-bounded cache).
+    """
+
+    SORT_KEYS: List[str] = ["total_build_time", "average_build_time", "builds", "hits", "disk_hits", "geometry_bytes"]
+
+    def __init__(self, record_geometry_size: bool = False):
+        self.record_geometry_size = record_geometry_size
+        self._entries: Dict[Hashable, BuildStatsEntry] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, key: Hashable, category: str, part_type: str, parameters: Dict[str, Any]) -> BuildStatsEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            parameters_str = ", ".join(f"{name}={value!r}" for name, value in parameters.items())
+            entry = BuildStatsEntry(category, part_type, parameters_str)
+            self._entries[key] = entry
+        return entry
+
+    def record_build(self, key: Hashable, category: str, part_type: str, parameters: Dict[str, Any],
+                     build_time: float, geometry_bytes: Union[int, None] = None) -> None:
+        with self._lock:
+            entry = self._entry(key, category, part_type, parameters)
+            entry.builds += 1
+            entry.total_build_time += build_time
+            if geometry_bytes is not None:
+                entry.geometry_bytes = geometry_bytes
+
+    def record_hit(self, key: Hashable, category: str, part_type: str, parameters: Dict[str, Any], from_disk: bool = False) -> None:
+        with self._lock:
+            entry = self._entry(key, category, part_type, parameters)
+            if from_disk:
+                entry.disk_hits += 1
+            else:
+                entry.hits += 1
+
+    def entries(self, sort_by: str = "total_build_time") -> List[BuildStatsEntry]:
+        """All entries, most expensive (according to `sort_by`) first."""
+        if sort_by not in BuildStats.SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{sort_by}'; available: {BuildStats.SORT_KEYS}")
+        with self._lock:
+            entries = list(self._entries.values())
+        return sorted(entries, key=lambda e: getattr(e, sort_by) or 0, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def report(self, format: str = "table", sort_by: str = "total_build_time") -> str:
+        """Dump the statistics as a `table` (human-readable) or `json`."""
+        entries = self.entries(sort_by)
+        if format == "json":
+            return json.dumps([e.to_dict() for e in entries], indent=2)
+        elif format != "table":
+            raise ValueError(f"Unknown report format '{format}'; available: ['table', 'json']")
+
+        header = ("part", "builds", "hits", "disk hits", "total (s)", "avg (s)", "size (KB)", "parameters")
+        rows = [header]
+        for e in entries:
+            rows.append((
+                f"{e.category}/{e.part_type}",
+                str(e.builds),
+                str(e.hits),
+                str(e.disk_hits),
+                f"{e.total_build_time:.3f}",
+                f"{e.average_build_time:.3f}",
+                f"{e.geometry_bytes / 1024:.1f}" if e.geometry_bytes is not None else "-",
+                e.parameters,
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header) - 1)]
+        return "\n".join(
+            "  ".join(cell.ljust(widths[i]) for i, cell in enumerate(row[:-1])) + "  " + row[-1]
+            for row in rows
+        )
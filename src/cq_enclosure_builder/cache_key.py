@@ -0,0 +1,139 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import types
+import dataclasses
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Type
+
+# Canonical, value-based encoding of part parameters, used to build the PartFactory cache keys.
+#
+# Two parameters that are equal by value (e.g. two `KnobOrCap(18, 17.25, 10.5)` created in different modules)
+#   get the same key. Values that can't be compared by value (e.g. lambdas) fall back to their identity.
+
+# Number of decimals kept when normalizing floats, so that e.g. 0.1 + 0.2 and 0.3 share a key
+FLOAT_DECIMALS: int = 9
+
+_custom_encoders: Dict[Type, Callable[[Any], Any]] = {}
+
+
+class IdentityKey:
+    """
+    Key of a value encoded by identity; only valid for the current session, so never persisted.
+
+    The key holds the value: it's kept alive exactly as long as the key is used (e.g. by an entry of the memory cache),
+    so its id can't be reused by another object in the meantime, and it's released with the key (e.g. when evicted).
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IdentityKey) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __repr__(self) -> str:
+        return f"IdentityKey({_type_path(type(self.value))} at {id(self.value):#x})"
+
+
+def register_key_encoder(value_type: Type, encoder: Callable[[Any], Any]) -> None:
+    """
+    Register how to encode a custom parameter type; `encoder` should return a value-based representation
+    of its argument (it will itself be canonicalized, so it can return lists, dicts, floats, etc.).
+    Applies to subclasses of `value_type` as well.
+    """
+    _custom_encoders[value_type] = encoder
+
+
+def _type_path(t: Type) -> str:
+    return f"{t.__module__}.{t.__qualname__}"
+
+
+def canonical_key(value: Any) -> Hashable:
+    """Encode `value` into a hashable key that only depends on its value."""
+    return _encode(value, set())
+
+
+def is_persistable(key: Hashable) -> bool:
+    """Whether the key is stable across sessions (i.e. doesn't rely on the identity of an object)."""
+    if isinstance(key, IdentityKey):
+        return False
+    if isinstance(key, tuple):
+        return all(is_persistable(k) for k in key)
+    return True
+
+
+def _identity(value: Any) -> Hashable:
+    return ("identity", IdentityKey(value))
+
+
+def _encode(value: Any, in_progress: set) -> Hashable:
+    if value is None or isinstance(value, (bool, int, str, bytes)):
+        return value
+    if isinstance(value, float):
+        value = round(value, FLOAT_DECIMALS)
+        return 0.0 if value == 0 else value  # no -0.0
+
+    for value_type in type(value).__mro__:
+        if value_type in _custom_encoders:
+            return ("custom", _type_path(value_type), _encode(_custom_encoders[value_type](value), in_progress))
+
+    if isinstance(value, Enum):
+        return ("enum", _type_path(type(value)), value.name)
+    if isinstance(value, type):
+        return ("type", _type_path(value))
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType)):
+        if "<" in value.__qualname__:  # lambdas and nested functions can capture anything
+            return _identity(value)
+        return ("function", f"{value.__module__}.{value.__qualname__}")
+    if callable(value):
+        return _identity(value)
+
+    if id(value) in in_progress:  # cycle
+        return _identity(value)
+    in_progress.add(id(value))
+    try:
+        if isinstance(value, (list, tuple)):
+            return tuple(_encode(v, in_progress) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return ("set", tuple(sorted((_encode(v, in_progress) for v in value), key=repr)))
+        if isinstance(value, dict):
+            items = ((_encode(k, in_progress), _encode(v, in_progress)) for k, v in value.items())
+            return ("dict", tuple(sorted(items, key=repr)))
+        if dataclasses.is_dataclass(value):
+            fields = tuple((f.name, _encode(getattr(value, f.name), in_progress)) for f in dataclasses.fields(value))
+            return ("object", _type_path(type(value)), fields)
+        if hasattr(value, "__dict__"):
+            # Plain value objects, e.g. KnobOrCap
+            fields = tuple(sorted((name, _encode(v, in_progress)) for name, v in vars(value).items()))
+            return ("object", _type_path(type(value)), fields)
+        if hasattr(type(value), "__slots__"):
+            slots = [s for t in type(value).__mro__ for s in getattr(t, "__slots__", ()) if hasattr(value, s)]
+            fields = tuple(sorted((name, _encode(getattr(value, name), in_progress)) for name in slots))
+            return ("object", _type_path(type(value)), fields)
+        if type(value).__hash__ is object.__hash__:
+            # Only hashable by identity (and its default repr, used for the disk key, contains its address)
+            return _identity(value)
+        try:
+            hash(value)
+            return ("value", _type_path(type(value)), value)
+        except TypeError:
+            return _identity(value)
+    finally:
+        in_progress.discard(id(value))
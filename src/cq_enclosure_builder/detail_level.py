@@ -0,0 +1,86 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import contextlib
+from enum import Enum
+from contextvars import ContextVar
+from typing import Iterator, Union
+
+# Level of detail of the screw holes (see parts/common/fastener_holes.py).
+#
+# Screw holes are made at the current level: the one of the innermost `detail_level(...)` block, else the global one
+#   (see set_detail_level). PartFactory builds each part making screw holes within a block for the level of the call
+#   (current, or passed as `detail_level=`), and keeps the parts built at different levels apart in its caches.
+
+# Name of the build option (and of the parameter of ScrewBlock.build and of the hole functions) setting the level
+DETAIL_LEVEL_PARAMETER: str = "detail_level"
+
+# Module making the screw holes; the parts using it (directly, or e.g. through ScrewBlock) are built at the current level
+FASTENER_HOLES_MODULE: str = "cq_enclosure_builder.parts.common.fastener_holes"
+
+
+class DetailLevel(Enum):
+    PREVIEW = "preview"  # plain cylinders; fast, for iterating on a design
+    PRINT = "print"      # threaded holes modelled as plain holes at the tap drill size, for the screws to cut their own threads
+    FULL = "full"        # helical threads
+
+
+DEFAULT_DETAIL_LEVEL: DetailLevel = DetailLevel.FULL
+
+_global_detail_level: DetailLevel = DEFAULT_DETAIL_LEVEL
+
+# Level of the innermost `detail_level` block of the current thread or asyncio task; None outside of any block
+_scoped_detail_level: ContextVar[Union[DetailLevel, None]] = ContextVar("cq_enclosure_builder_detail_level", default=None)
+
+
+def get_detail_level() -> DetailLevel:
+    scoped = _scoped_detail_level.get()
+    return scoped if scoped is not None else _global_detail_level
+
+
+def resolve_detail_level(level: Union[DetailLevel, str, None]) -> DetailLevel:
+    """`level` as a DetailLevel (also accepts "preview", "print", and "full"); the current level if None."""
+    if level is None:
+        return get_detail_level()
+    if isinstance(level, DetailLevel):
+        return level
+    try:
+        return DetailLevel(level)
+    except ValueError:
+        raise ValueError(f"Unknown detail level '{level}'; available: {[l.value for l in DetailLevel]}")
+
+
+def set_detail_level(level: Union[DetailLevel, str]) -> None:
+    """Sets the level of detail (only for the current `detail_level` block, if within one)."""
+    global _global_detail_level
+    level = resolve_detail_level(level)
+    if _scoped_detail_level.get() is not None:
+        _scoped_detail_level.set(level)
+    else:
+        _global_detail_level = level
+
+
+@contextlib.contextmanager
+def detail_level(level: Union[DetailLevel, str, None]) -> Iterator[DetailLevel]:
+    """
+    Scope in which the parts and screws are built at `level`, without affecting other threads or asyncio tasks.
+    None keeps the current level (e.g. `with detail_level(panel.detail_level):` when the panel doesn't set one).
+    """
+    token = _scoped_detail_level.set(resolve_detail_level(level))
+    try:
+        yield _scoped_detail_level.get()
+    finally:
+        _scoped_detail_level.reset(token)
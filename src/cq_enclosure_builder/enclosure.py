@@ -20,11 +20,15 @@ from typing_extensions import Self
 import cadquery as cq
 from cadquery import exporters
 
-from cq_enclosure_builder import Part, Panel, PanelSize, Face, ProjectInfo
+from cq_enclosure_builder import Part, PartFactory, Panel, PanelSize, Face, ProjectInfo
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock, TaperOptions
 from cq_enclosure_builder.parts.common.screws_providers import DefaultScrewProvider, DefaultHeatSetScrewProvider
 from cq_enclosure_builder.parts.common.screws_providers import LargeBlockFlatHeadScrewProvider, LargeBlockHeatSetScrewProvider
 from cq_enclosure_builder.parts.support.skirt import SkirtPart
+from cq_enclosure_builder.lazy_part import LazyPart
+from cq_enclosure_builder.detail_level import DetailLevel, detail_level
+from cq_enclosure_builder.boolean_options import BooleanOptions, DEFAULT_BOOLEAN_OPTIONS
+from cq_enclosure_builder.utils.workplane_utils import translated, cut_all
 
 
 def explode(pos_array, walls_explosion_factor=2.0):
@@ -77,6 +81,8 @@ class Enclosure:
         backpanel_tapered_top: bool = True,
         backpanel_screws_pos = [],
         backpanel_screw_diameter = 2.3,
+        detail_level: Union[DetailLevel, str, None] = None,  # of the screws, and of the lazy parts added to the panels; None -> current level
+        boolean_options: Union[BooleanOptions, None] = None,  # of the cuts made when assembling the frame and panels; None -> DEFAULT_BOOLEAN_OPTIONS
     ):
         if lid_on_faces != [Face.BOTTOM]:
             # TODO: add support for lid != BOTTOM; see issue #2
@@ -93,6 +99,8 @@ class Enclosure:
         self.project_info = project_info
         self.no_fillet_top = no_fillet_top
         self.no_fillet_bottom = no_fillet_bottom
+        self.detail_level = detail_level
+        self.boolean_options: BooleanOptions = boolean_options if boolean_options is not None else DEFAULT_BOOLEAN_OPTIONS
 
         self.frame: Union[cq.Assembly, None] = None
         self.panels_specs = [
@@ -124,6 +132,8 @@ class Enclosure:
                     lid_size_error_margin=lid_size_error_margin,
                     project_info=self.project_info,
                     add_chamfer=add_chamfer,
+                    detail_level=detail_level,
+                    boolean_options=self.boolean_options,
                     backpanel_size=backpanel_size,
                     backpanel_thickness=backpanel_thickness,
                     backpanel_pos=backpanel_pos,
@@ -139,6 +149,8 @@ class Enclosure:
                     lid_size_error_margin=lid_size_error_margin,
                     project_info=self.project_info,
                     add_chamfer=add_chamfer,
+                    detail_level=detail_level,
+                    boolean_options=self.boolean_options,
                 )
 
         # Lid should be created before the screws are added (cut the screws' masks from the lid)
@@ -266,13 +278,14 @@ class Enclosure:
             hole_position=hole_position,
             counter_sunk_extrude_depth=counter_sunk_extrude_depth,
             counter_sunk_negative_mask_error_margin=pos_error_margin,
+            detail_level=self.detail_level,
         )
         
-        screw["block"] = screw["block"].translate([*pos, pos_error_margin])
-        screw["mask"] = screw["mask"].translate([*pos, pos_error_margin])
+        screw["block"] = translated(screw["block"], (*pos, pos_error_margin))
+        screw["mask"] = translated(screw["mask"], (*pos, pos_error_margin))
         if with_counter_sunk_block:
-            screw["counter_sunk_block"] = screw["counter_sunk_block"].translate([*pos, pos_error_margin])
-            screw["counter_sunk_mask"] = screw["counter_sunk_mask"].translate([*pos, pos_error_margin])
+            screw["counter_sunk_block"] = translated(screw["counter_sunk_block"], (*pos, pos_error_margin))
+            screw["counter_sunk_mask"] = translated(screw["counter_sunk_mask"], (*pos, pos_error_margin))
 
             translate_z = screw["size"][2] + self.lid_thickness_error_margin + self.size.wall_thickness
             cs_block = screw["counter_sunk_block"].rotate((0, 0, 0), (1, 0, 0), 180).translate([0, 0, translate_z])
@@ -281,7 +294,7 @@ class Enclosure:
 
         self.screws.append(screw)
         if self.add_lid_support:
-            self.lid_support = self.lid_support.cut(screw["mask"])
+            self.lid_support = cut_all(self.lid_support, [screw["mask"]], self.boolean_options)
         return screw
 
     def add_corner_lid_screws(
@@ -300,7 +313,7 @@ class Enclosure:
             screw_provider = LargeBlockHeatSetScrewProvider if heat_set else LargeBlockFlatHeadScrewProvider
             counter_sunk_screw_provider = LargeBlockFlatHeadScrewProvider
 
-        screw_size = ScrewBlock(screw_provider).build(screw_size_category, lid_screws_thickness, self.size.wall_thickness)["size"]  # refactor to avoid this
+        screw_size = ScrewBlock.block_size(screw_provider, screw_size_category, lid_screws_thickness)
         pw = self.size.outer_width
         pl = self.size.outer_length
         sw = screw_size[0]
@@ -348,8 +361,13 @@ class Enclosure:
         walls_explosion_factor: float = 1.0,
         lid_panel_shift: float = 0.0
     ) -> Self:
+        # Build all the lazy parts of the enclosure at once, in parallel
+        with detail_level(self.detail_level):
+            LazyPart.resolve_all([part for panel in self.panels.values() for part in panel.parts])
+        self.printables = {}  # parts with printables may have been removed since the last call
         for panel in self.panels.values():
-            panel.assemble()
+            if panel.dirty:  # panels that didn't change since the last call are kept as they are
+                panel.assemble()
 
             for printable in panel.additional_printables:
                 printable_name = printable[0]
@@ -359,7 +377,8 @@ class Enclosure:
         panels_assembly, panels_masks_assembly = self._build_panels_assembly(walls_explosion_factor, lid_panel_shift)
         self.panels_assembly = panels_assembly
         self.panels_masks_assembly = panels_masks_assembly
-        self.frame = self._build_frame_assembly(panels_masks_assembly)
+        if self.frame is None:  # only depends on the size of the enclosure
+            self.frame = self._build_frame_assembly(panels_masks_assembly)
         self.lid_screws_assembly = self._build_lid_screws_assembly()
 
         footprints_assembly = self._build_debug_assembly([("footprint_in", "I"), ("footprint_out", "O")], walls_explosion_factor, lid_panel_shift)
@@ -392,6 +411,20 @@ class Enclosure:
         )
         return self
 
+    async def aassemble(
+        self,
+        walls_explosion_factor: float = 1.0,
+        lid_panel_shift: float = 0.0
+    ) -> Self:
+        """
+        Same as `assemble`, without blocking the event loop: the lazy parts are built with PartFactory.abuild,
+        then the enclosure is assembled in the PartFactory executor (see PartFactory.set_executor).
+        If cancelled while assembling, the assembly still completes in the background.
+        """
+        with detail_level(self.detail_level):
+            await LazyPart.aresolve_all([part for panel in self.panels.values() for part in panel.parts])
+        return await PartFactory.run_in_executor(self.assemble, walls_explosion_factor, lid_panel_shift)
+
     def _build_printable_file_path(self, printable_name: str) -> str:
         project_name = self.project_info.name.lower().replace(" ", "_")
         version = self.project_info.version
@@ -454,7 +487,7 @@ class Enclosure:
                 .translate([0, 0, shell_translate_z])
         )
 
-        return shell.cut(panels_masks_assembly.toCompound())
+        return cut_all(shell, [cq.Workplane("XY").add(panels_masks_assembly.toCompound())], self.boolean_options)
 
     def _build_lid_screws_assembly(self) -> cq.Assembly:
         a = cq.Assembly(None)
@@ -466,7 +499,7 @@ class Enclosure:
         for face, size, position, alpha in self.panels_specs:
             panel: Panel = self.panels[face]
             translated_mask = panel.mask.translate(position)
-            frame = frame.cut(translated_mask)
+            frame = cut_all(frame, [translated_mask], self.boolean_options)
         return frame
 
     def _build_debug_assembly(self, assemblies_specs, walls_explosion_factor, lid_panel_shift) -> cq.Assembly:
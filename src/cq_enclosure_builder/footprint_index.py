@@ -0,0 +1,189 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import math
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Set, Tuple, Union
+
+# Axis-aligned rectangles of the parts placed on a panel, for overlap queries without building any geometry (see Panel).
+#
+# Rectangles are (xmin, ymin, xmax, ymax), in the coordinates of `Panel.add`'s rel_pos (centre of the panel is 0,0).
+# Each part has up to one rectangle per kind: its mask (from its size), and its inside and outside footprints; only
+# rectangles of the same kind can overlap (e.g. the outside footprint of a knob can sit over the inside footprint of a PCB).
+
+Rect = Tuple[float, float, float, float]
+
+MASK: str = "mask"
+INSIDE: str = "inside"
+OUTSIDE: str = "outside"
+KINDS: Tuple[str, ...] = (MASK, INSIDE, OUTSIDE)
+
+DEFAULT_CELL_SIZE: float = 20.0
+
+
+def footprint_rects(part: Any, pos: Tuple[float, float]) -> Dict[str, Rect]:
+    """
+    Rectangles of `part` (a Part, or a LazyPart) placed at `pos`; only the ones known from its size and footprints,
+    which are available without building a LazyPart if its part has a `build_spec`.
+    """
+    def centered(size, offset) -> Union[Rect, None]:
+        if size is None or size[0] is None or size[1] is None:
+            return None
+        offset = offset if offset is not None else (0, 0)
+        x, y = pos[0] + offset[0], pos[1] + offset[1]
+        return (x - size[0]/2, y - size[1]/2, x + size[0]/2, y + size[1]/2)
+
+    rects = {
+        MASK: centered((part.size.width, part.size.length), (0, 0)),
+        INSIDE: centered(part.inside_footprint, part.inside_footprint_offset),
+        OUTSIDE: centered(part.outside_footprint, part.outside_footprint_offset),
+    }
+    return {kind: rect for kind, rect in rects.items() if rect is not None}
+
+
+def intersects(a: Rect, b: Rect) -> bool:
+    """Whether `a` and `b` overlap; rectangles only touching each other don't."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def distance(a: Rect, b: Rect) -> float:
+    """Distance between `a` and `b`; if they overlap, minus the smallest shift (along X or Y) separating them."""
+    dx = max(b[0] - a[2], a[0] - b[2])
+    dy = max(b[1] - a[3], a[1] - b[3])
+    if dx < 0 and dy < 0:
+        return max(dx, dy)
+    return math.hypot(max(dx, 0), max(dy, 0))
+
+
+class FootprintIndex:
+    """
+    Uniform grid over the rectangles of the parts: each rectangle is registered in the cells it covers, so that queries
+    only look at the rectangles sharing a cell with the query.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size: float = cell_size
+        self._rects: Dict[Hashable, Tuple[int, str, Dict[str, Rect]]] = {}  # key -> (insertion number, label, rects by kind)
+        self._cells: Dict[Tuple[str, int, int], Set[Hashable]] = {}        # (kind, i, j) -> keys
+        self._inserted: int = 0
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
+
+    def insert(self, key: Hashable, label: str, rects: Dict[str, Rect]) -> None:
+        """Add (or replace) the rectangles of a part; `key` identifies it, as labels don't have to be unique."""
+        self.remove(key)
+        self._inserted += 1
+        self._rects[key] = (self._inserted, label, rects)
+        for kind, rect in rects.items():
+            for cell in self._cells_of(kind, rect):
+                self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        if key not in self._rects:
+            return
+        _, _, rects = self._rects.pop(key)
+        for kind, rect in rects.items():
+            for cell in self._cells_of(kind, rect):
+                keys = self._cells[cell]
+                keys.discard(key)
+                if len(keys) == 0:
+                    del self._cells[cell]
+
+    def rects(self, key: Hashable) -> Dict[str, Rect]:
+        return self._rects[key][2]
+
+    def query(self, rect: Rect, kinds: Iterable[str] = KINDS, exclude: Union[Hashable, None] = None) -> List[Tuple[Hashable, str, str]]:
+        """(key, label, kind) of the rectangles of `kinds` overlapping `rect`."""
+        found = []
+        for kind in kinds:
+            candidates = set()
+            for cell in self._cells_of(kind, rect):
+                candidates.update(self._cells.get(cell, ()))
+            candidates.discard(exclude)
+            for key in sorted(candidates, key=lambda candidate: self._rects[candidate][0]):
+                _, label, rects = self._rects[key]
+                if intersects(rects[kind], rect):
+                    found.append((key, label, kind))
+        return found
+
+    def find_overlaps(self, kinds: Iterable[str] = KINDS) -> List[Tuple[str, str, str]]:
+        """(label, other label, kind) of each pair of parts whose rectangles of the same kind overlap."""
+        overlaps = []
+        for key, (inserted, label, rects) in self._rects.items():
+            for kind in kinds:
+                if kind not in rects:
+                    continue
+                for other_key, other_label, _ in self.query(rects[kind], [kind], exclude=key):
+                    if self._rects[other_key][0] > inserted:  # each pair once, in insertion order
+                        overlaps.append((label, other_label, kind))
+        return overlaps
+
+    def clearance(self, key: Hashable, kinds: Iterable[str] = KINDS) -> float:
+        """
+        Smallest distance between the rectangles of the part `key` and the ones of the same kind of the other parts
+        (negative if they overlap; see `distance`); infinite if there's none.
+        """
+        rects = self.rects(key)
+        kinds = [kind for kind in kinds if kind in rects]
+        if len(self._cells) == 0:
+            return math.inf
+        cells_bounds = (
+            min(i for _, i, _ in self._cells), min(j for _, _, j in self._cells),
+            max(i for _, i, _ in self._cells), max(j for _, _, j in self._cells),
+        )
+        best = math.inf
+        # Look at the rings of cells around the rectangles, one after the other: the rectangles not found within `ring`
+        #   rings are at least `ring * cell_size` away
+        ring = 0
+        while True:
+            covers_all_cells = True
+            for kind in kinds:
+                for other_key in self._keys_in_ring(kind, rects[kind], ring):
+                    if other_key != key:
+                        best = min(best, distance(rects[kind], self._rects[other_key][2][kind]))
+                imin, jmin, imax, jmax = self._cell_range(rects[kind], ring)
+                covers_all_cells = (covers_all_cells and imin <= cells_bounds[0] and jmin <= cells_bounds[1]
+                                    and imax >= cells_bounds[2] and jmax >= cells_bounds[3])
+            if best <= ring * self.cell_size or covers_all_cells:
+                return best
+            ring += 1
+
+    def _cell_range(self, rect: Rect, margin: int = 0) -> Tuple[int, int, int, int]:
+        return (
+            math.floor(rect[0] / self.cell_size) - margin, math.floor(rect[1] / self.cell_size) - margin,
+            math.floor(rect[2] / self.cell_size) + margin, math.floor(rect[3] / self.cell_size) + margin,
+        )
+
+    def _cells_of(self, kind: str, rect: Rect) -> Iterator[Tuple[str, int, int]]:
+        imin, jmin, imax, jmax = self._cell_range(rect)
+        for i in range(imin, imax + 1):
+            for j in range(jmin, jmax + 1):
+                yield (kind, i, j)
+
+    def _keys_in_ring(self, kind: str, rect: Rect, ring: int) -> Set[Hashable]:
+        """Keys in the cells `ring` cells away from the ones covered by `rect` (the covered cells themselves for ring 0)."""
+        imin, jmin, imax, jmax = self._cell_range(rect, ring)
+        keys = set()
+        for i in range(imin, imax + 1):
+            for j in range(jmin, jmax + 1):
+                if ring == 0 or i in (imin, imax) or j in (jmin, jmax):
+                    keys.update(self._cells.get((kind, i, j), ()))
+        return keys
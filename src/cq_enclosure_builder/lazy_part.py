@@ -0,0 +1,88 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+from typing import List, Dict, Any, Union
+
+from cq_enclosure_builder.part import Part
+
+
+class LazyPart:
+    """
+    Stand-in for a Part, returned by `PartFactory.build(..., lazy=True)`.
+
+    Sizes and footprints are available right away when they can be known without building the part
+    (from the part's `build_spec`, or from the on-disk cache); any other attribute (`part`, `mask`, `debug_objects`, etc.) builds the
+    part on first access, and is then read from the built part.
+
+    `LazyPart.resolve_all` builds many lazy parts at once, in parallel; Panel and Enclosure call it
+    before assembling (and `aresolve_all` before Enclosure.aassemble), at their level of detail.
+    """
+
+    def __init__(self, factory: Any, request: Any, footprints: Union[Dict[str, Any], None] = None):
+        self._factory = factory
+        self._request = request
+        self._part: Union[Part, None] = None
+        if footprints is not None:
+            for name, value in footprints.items():
+                setattr(self, name, value)
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._part is not None
+
+    def resolve(self) -> Part:
+        """Build the part (or get it from the cache), if not done already."""
+        if self._part is None:
+            self._request = self._factory._with_current_detail_level(self._request)
+            self._part = self._factory._build_requests([self._request])[0]
+        return self._part
+
+    async def aresolve(self) -> Part:
+        """Same as `resolve`, without blocking the event loop (see PartFactory.abuild)."""
+        if self._part is None:
+            self._request = self._factory._with_current_detail_level(self._request)
+            self._part = await self._factory._abuild_request(self._request)
+        return self._part
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the proxy itself
+        if name.startswith("__") or name in ("_factory", "_request", "_part"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self.is_resolved else "not built yet"
+        return f"LazyPart({self._request.category}/{self._request.part_type}, {state})"
+
+    @staticmethod
+    def resolve_all(parts: List[Any], max_workers: Union[int, None] = None) -> None:
+        """Resolve all the lazy parts in `parts` (other parts are ignored), building them in parallel."""
+        lazy_parts = [p for p in parts if isinstance(p, LazyPart) and not p.is_resolved]
+        if len(lazy_parts) == 0:
+            return
+        factory = lazy_parts[0]._factory
+        for lazy_part in lazy_parts:
+            lazy_part._request = factory._with_current_detail_level(lazy_part._request)
+        built_parts = factory._build_requests([p._request for p in lazy_parts], max_workers=max_workers)
+        for lazy_part, part in zip(lazy_parts, built_parts):
+            lazy_part._part = part
+
+    @staticmethod
+    async def aresolve_all(parts: List[Any]) -> None:
+        """Same as `resolve_all`, without blocking the event loop; the parts are built concurrently in the PartFactory executor."""
+        lazy_parts = [p for p in parts if isinstance(p, LazyPart) and not p.is_resolved]
+        await asyncio.gather(*(p.aresolve() for p in lazy_parts))
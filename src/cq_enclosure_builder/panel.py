@@ -14,15 +14,53 @@
    limitations under the License.
 """
 
-from typing import Dict, Union, Tuple
+import math
+from typing import Iterable, List, Dict, Union, Tuple
 from typing_extensions import Self
 
 import cadquery as cq
+from OCP.gp import gp_Ax1, gp_Ax2, gp_Dir, gp_Pnt, gp_Trsf
 from cq_enclosure_builder import Face, ProjectInfo
 from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.lazy_part import LazyPart
+from cq_enclosure_builder.detail_level import DetailLevel, detail_level
+from cq_enclosure_builder.boolean_options import BooleanOptions, DEFAULT_BOOLEAN_OPTIONS
+from cq_enclosure_builder.footprint_index import FootprintIndex, Rect, KINDS, footprint_rects
+from cq_enclosure_builder.utils.workplane_utils import translated, transformed, cut_all, overlaps
 from cq_enclosure_builder import PanelSize
 
 
+def _mirror(normal: Tuple[float, float, float]) -> gp_Trsf:
+    trsf = gp_Trsf()
+    trsf.SetMirror(gp_Ax2(gp_Pnt(0, 0, 0), gp_Dir(*normal)))
+    return trsf
+
+def _rotation(axis: Tuple[float, float, float], angle_degrees: float) -> gp_Trsf:
+    trsf = gp_Trsf()
+    trsf.SetRotation(gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(*axis)), math.radians(angle_degrees))
+    return trsf
+
+def _composed(*steps: gp_Trsf) -> gp_Trsf:
+    """Single transform applying `steps` in order."""
+    trsf = gp_Trsf()
+    for step in steps:
+        trsf = step.Multiplied(trsf)
+    return trsf
+
+# Orientation of the parts and wall of the panel of each face (built on the XY plane), as a single transform
+_FACE_TRANSFORMS: Dict[str, gp_Trsf] = {
+    Face.TOP.label:    _mirror((0, 0, 1)),
+    Face.BOTTOM.label: _mirror((0, 1, 0)),
+    Face.BACK.label:   _composed(_rotation((1, 0, 0), 90), _mirror((1, 0, 0))),
+    Face.FRONT.label:  _composed(_rotation((1, 0, 0), 90), _mirror((0, 1, 0))),
+    Face.LEFT.label:   _composed(_rotation((1, 0, 0), 90), _rotation((0, 0, 1), 90), _mirror((0, 1, 0))),
+    Face.RIGHT.label:  _composed(_rotation((1, 0, 0), 90), _rotation((0, 0, 1), -90), _mirror((0, 1, 0))),
+}
+
+def _face_transform(face: Face.FaceInfo) -> gp_Trsf:
+    return _FACE_TRANSFORMS.get(face.label, gp_Trsf())
+
+
 class Panel:
     def __init__(
             self,
@@ -40,6 +78,8 @@ class Panel:
             backpanel_tapered_top: bool = True,
             backpanel_screws_pos = [],
             backpanel_screw_diameter = 2.3,
+            detail_level: Union[DetailLevel, str, None] = None,  # of the lazy parts added to the panel; None -> current level
+            boolean_options: Union[BooleanOptions, None] = None,  # of the cuts made when assembling; None -> DEFAULT_BOOLEAN_OPTIONS
     ):
         self.face: Face = face
         self.size: PanelSize = size
@@ -72,10 +112,23 @@ class Panel:
         self.backpanel_tapered_top = backpanel_tapered_top
         self.backpanel_screws_pos = backpanel_screws_pos
         self.backpanel_screw_diameter = backpanel_screw_diameter
+        self.detail_level = detail_level
+        self.boolean_options: BooleanOptions = boolean_options if boolean_options is not None else DEFAULT_BOOLEAN_OPTIONS
         self.additional_printables: Dict[str, Tuple[float, float], cq.Workplane] = []
         self._alpha: float = alpha
         self._parts_to_add = []
         self._screw_counter_sunks = []
+        # Incremental assembly: what's left of the last `assemble`, and whether anything changed since
+        self._dirty: bool = True
+        self._assembled_settings: Union[Tuple, None] = None  # `_settings()` at the last `assemble`
+        self._base_total_thickness: float = self.size.total_thickness
+        self._uncut_wall: Union[cq.Workplane, None] = None
+        self._masked_wall: Union[cq.Workplane, None] = None  # uncut wall minus the masks of the parts 'in_wall', and of...
+        self._masked_wall_counter_sunks: int = 0             # ...the first `_masked_wall_counter_sunks` counter-sunk screws
+        self._masks_to_uncut: List[cq.Workplane] = []  # of the parts moved or removed since, to fill back in `_masked_wall`
+        # Rectangles of the parts' masks and footprints, for `find_overlaps`, `query`, and `clearance`; the parts added or
+        #   moved since the last query are indexed on the next one
+        self._footprint_index: FootprintIndex = FootprintIndex()
 
     def add(
         self,
@@ -87,6 +140,119 @@ class Panel:
         alpha: float = 1.0,
     ) -> Self:
         print(f"[{str(self.project_info)}] {self.face.label}: adding part '{label}'")
+        self._parts_to_add.append({
+            "part": part,
+            "label": label,
+            "pos": self._to_rel_pos(rel_pos, abs_pos),
+            "color": color,
+            "alpha": alpha,
+            "placed": None,  # the part, its mask, and its debug objects in place, once assembled
+            "in_wall": False,  # whether its mask was cut from `_masked_wall`
+            "indexed": False,  # whether its rectangles are in `_footprint_index`
+        })
+        self._dirty = True
+        return self
+
+    def move(
+        self,
+        label: str,
+        rel_pos: Tuple[float, float] = None,
+        abs_pos: Tuple[float, float] = None,
+    ) -> Self:
+        print(f"[{str(self.project_info)}] {self.face.label}: moving part '{label}'")
+        part_to_add = self._find_part_to_add(label)
+        pos = self._to_rel_pos(rel_pos, abs_pos)
+        if tuple(pos) != tuple(part_to_add["pos"]):
+            self._uncut_mask_of(part_to_add)
+            part_to_add["pos"] = pos
+            part_to_add["placed"] = None
+            part_to_add["indexed"] = False
+            self._dirty = True
+        return self
+
+    def remove(self, label: str) -> Self:
+        print(f"[{str(self.project_info)}] {self.face.label}: removing part '{label}'")
+        part_to_add = self._find_part_to_add(label)
+        self._parts_to_add.remove(part_to_add)
+        self._uncut_mask_of(part_to_add)
+        self._footprint_index.remove(id(part_to_add))
+        self._dirty = True
+        return self
+
+    def find_overlaps(self, kinds: Iterable[str] = KINDS) -> List[Tuple[str, str, str]]:
+        """
+        (label, other label, kind) of each pair of parts whose rectangles of the same kind overlap; kinds are "mask",
+        "inside", and "outside" (footprints). No geometry is built, except for lazy parts without a `build_spec`.
+        """
+        return self._indexed_footprints().find_overlaps(kinds)
+
+    def query(self, rect: Rect, kinds: Iterable[str] = KINDS) -> List[Tuple[str, str]]:
+        """(label, kind) of the rectangles of the parts overlapping `rect`: (xmin, ymin, xmax, ymax), relative to the centre."""
+        return [(label, kind) for _, label, kind in self._indexed_footprints().query(rect, kinds)]
+
+    def clearance(self, label: str, kinds: Iterable[str] = KINDS) -> float:
+        """
+        Smallest distance between the rectangles of the part `label` and the ones of the same kind of the other parts;
+        negative if they overlap, infinite if there's no other part.
+        """
+        return self._indexed_footprints().clearance(id(self._find_part_to_add(label)), kinds)
+
+    def overlaps_with(
+        self,
+        part: Part,
+        rel_pos: Tuple[float, float] = None,
+        abs_pos: Tuple[float, float] = None,
+        kinds: Iterable[str] = KINDS,
+    ) -> List[Tuple[str, str]]:
+        """(label, kind) of the parts that `part` would overlap if added at this position; to check it before adding it."""
+        index = self._indexed_footprints()
+        rects = footprint_rects(part, self._to_rel_pos(rel_pos, abs_pos))
+        return [
+            (label, kind)
+            for kind in kinds if kind in rects
+            for _, label, _ in index.query(rects[kind], [kind])
+        ]
+
+    def _indexed_footprints(self) -> FootprintIndex:
+        for part_to_add in self._parts_to_add:
+            if not part_to_add["indexed"]:
+                rects = footprint_rects(part_to_add["part"], part_to_add["pos"])
+                self._footprint_index.insert(id(part_to_add), part_to_add["label"], rects)
+                part_to_add["indexed"] = True
+        return self._footprint_index
+
+    @property
+    def dirty(self) -> bool:
+        """Whether parts or screws were added, moved, or removed, or the panel's settings changed, since the last `assemble`."""
+        return self._dirty or self.panel is None or self._settings() != self._assembled_settings
+
+    def _settings(self) -> Tuple:
+        """The attributes the wall and the placed parts are built from; when one changes, they're all rebuilt."""
+        return (
+            (self.size.width, self.size.length, self.size.wall_thickness),
+            (self.true_size.width, self.true_size.length, self.true_size.wall_thickness),
+            self.add_chamfer,
+            tuple(self.backpanel_size) if self.backpanel_size is not None else None,
+            self.backpanel_thickness,
+            tuple(self.backpanel_pos) if self.backpanel_pos is not None else None,
+            self.backpanel_tapered_top,
+            tuple(tuple(pos) for pos in self.backpanel_screws_pos),
+            self.backpanel_screw_diameter,
+            self.detail_level,
+            self.boolean_options,
+        )
+
+    def _discard_assembled(self) -> None:
+        """Forget the wall and the placed parts of the previous `assemble`."""
+        self._uncut_wall = None
+        self._masked_wall = None
+        self._masked_wall_counter_sunks = 0
+        self._masks_to_uncut = []
+        for part_to_add in self._parts_to_add:
+            part_to_add["placed"] = None
+            part_to_add["in_wall"] = False
+
+    def _to_rel_pos(self, rel_pos: Tuple[float, float], abs_pos: Tuple[float, float]) -> Tuple[float, float]:
         pos = None
         if rel_pos == None and abs_pos == None:
             raise ValueError("Either rel_pos or abs_pos must be set.")
@@ -97,34 +263,46 @@ class Panel:
             )
         elif abs_pos==None:
             pos = rel_pos
-        self._parts_to_add.append({
-            "part": part,
-            "label": label,
-            "pos": pos,
-            "color": color,
-            "alpha": alpha,
-        })
-        return self
+        return pos
+
+    def _find_part_to_add(self, label: str) -> Dict:
+        for part_to_add in self._parts_to_add:
+            if part_to_add["label"] == label:
+                return part_to_add
+        raise ValueError(f"No part '{label}' on panel {self.face.label}; available: {[p['label'] for p in self._parts_to_add]}")
+
+    def _uncut_mask_of(self, part_to_add) -> None:
+        if part_to_add["in_wall"]:
+            self._masks_to_uncut.append(part_to_add["placed"]["mask"])
+            part_to_add["in_wall"] = False
+
+    @property
+    def parts(self) -> List[Part]:
+        """Parts added to the panel so far (some may be LazyPart)."""
+        return [part_to_add["part"] for part_to_add in self._parts_to_add]
 
     def add_screw_counter_sunk(self, block: cq.Workplane, mask: cq.Workplane) -> None:
         """
         Used by `Enclosure` when a screw is added; cut a countersunk hole in the panel.
         """
         self._screw_counter_sunks.append((block, mask))
+        self._dirty = True
 
     def assemble(self) -> Self:
-        wall = (
-            cq.Workplane("front")
-                .workplane()
-                .box(self.true_size.width, self.true_size.length, self.true_size.wall_thickness,
-                     centered=(True, True, False))
-        )
-        if self.add_chamfer:
-            wall = (
-                wall
-                    .faces("-Z").edges()
-                    .chamfer(self.true_size.wall_thickness * 0.75, self.true_size.wall_thickness * 0.75 * 0.35)
-            )
+        """
+        Does nothing if the panel didn't change since the last call. Otherwise, the parts placed on the panel are reused
+        (except for the ones moved since), and only the masks of the new or moved parts and screws are cut from the previous
+        wall, once the regions of the parts moved or removed have been filled back (see `_cut_masks_from_wall`).
+        If one of the settings of the panel changed (size, chamfer, backpanel, etc.; see `_settings`), everything is rebuilt.
+        """
+        if not self.dirty:
+            return self
+        settings = self._settings()
+        if settings != self._assembled_settings:
+            self._discard_assembled()
+
+        with detail_level(self.detail_level):
+            LazyPart.resolve_all(self.parts)
 
         backpanel = None
         backpanel_with_part_mask = None
@@ -133,37 +311,41 @@ class Panel:
             backpanel_with_part_mask = backpanel.translate([0,0,0])
 
         self.panel = cq.Assembly(None, name="Panel TOP")
+        self.additional_printables = []
+        self._reset_debug_assemblies()
+        self.size.total_thickness = self._base_total_thickness
+        part_masks = []
         for part_to_add in self._parts_to_add:
             part_obj = part_to_add["part"]
+            placed = self._place(part_to_add, backpanel)
             if part_obj.additional_printables is not None:
                 self.additional_printables.extend(part_obj.additional_printables)
-            self._add_part_to_debug_assemblies(part_to_add)
-            translated_part_mask = part_obj.mask.translate([*part_to_add["pos"], 0])
-            wall = wall.cut(translated_part_mask)
-            if backpanel_with_part_mask is not None:
-                backpanel_with_part_mask = backpanel_with_part_mask.cut(translated_part_mask)
+            self._add_part_to_debug_assemblies(part_to_add["label"], placed["debug"])
+            part_masks.append(placed["mask"])
             if part_obj.assembly_parts != None:
                 if backpanel is not None:
                     print("WARNING - support of backpanel when assembly_parts is present hasn't been implemented yet")
-                self.panel = self.panel.add(
-                    self._translate_assembly_objects_and_rotate_to_face(part_obj.assembly_parts, [*part_to_add["pos"], 0]))
-                    #self._rotate_assembly_to_face(part_obj.part_assembly.translate([*part_to_add["pos"], 0])))
+                self.panel = self.panel.add(placed["part"])
             else:
-                translated_part = part_obj.part.translate([*part_to_add["pos"], 0])
-                if backpanel is not None:
-                    translated_part = translated_part.cut(backpanel)
                 self.panel = self.panel.add(
-                    self._rotate_to_face(translated_part),
+                    placed["part"],
                     name=part_to_add["label"],
                     color=cq.Color(*self._part_color if part_to_add["color"] is None else part_to_add["color"], part_to_add["alpha"]),
                 )
             if part_obj.size.thickness > self.size.total_thickness:
                 self.size.total_thickness = part_obj.size.thickness
-        for screw_cs in self._screw_counter_sunks:
-            wall = wall.cut(screw_cs[1]).add(screw_cs[0])
+
+        wall = self._cut_masks_from_wall()
+        if backpanel_with_part_mask is not None:
+            backpanel_with_part_mask = cut_all(backpanel_with_part_mask, part_masks, self.boolean_options)
+        for i, (cs_block, _) in enumerate(self._screw_counter_sunks):
+            # Each counter-sunk block used to be added right after cutting its own mask, so the masks of the next screws
+            #   were also cut from it
+            next_cs_masks = [cs_mask for _, cs_mask in self._screw_counter_sunks[i+1:] if overlaps(cs_block, cs_mask)]
+            wall = wall.add(cut_all(cs_block, next_cs_masks, self.boolean_options))
 
         if backpanel is not None:
-            wall = wall.cut(backpanel)
+            wall = cut_all(wall, [backpanel], self.boolean_options)
             if len(self.backpanel_screws_pos) > 0:
                 wall = (
                     wall
@@ -191,8 +373,94 @@ class Panel:
                 .add(self.panel, name="Panel")
                 .add(self.debug_assemblies["combined"], name="Debug")
         )
+        self._dirty = False
+        self._assembled_settings = settings
         return self
 
+    def _build_wall(self) -> cq.Workplane:
+        wall = (
+            cq.Workplane("front")
+                .workplane()
+                .box(self.true_size.width, self.true_size.length, self.true_size.wall_thickness,
+                     centered=(True, True, False))
+        )
+        if self.add_chamfer:
+            wall = (
+                wall
+                    .faces("-Z").edges()
+                    .chamfer(self.true_size.wall_thickness * 0.75, self.true_size.wall_thickness * 0.75 * 0.35)
+            )
+        return wall
+
+    def _cut_masks_from_wall(self) -> cq.Workplane:
+        """
+        The wall minus the masks of the parts and of the counter-sunk screws. The masks are cut at once (the order doesn't
+        matter, as nothing is added to the wall in between); after the first time, only the new masks are cut from the
+        previous wall, once the regions of the masks of the parts moved or removed since have been filled back.
+        """
+        if self._uncut_wall is None:
+            self._uncut_wall = self._build_wall()
+        cs_masks = [cs_mask for _, cs_mask in self._screw_counter_sunks]
+        if self._masked_wall is None:
+            wall = self._uncut_wall
+            new_masks = [part_to_add["placed"]["mask"] for part_to_add in self._parts_to_add] + cs_masks
+        else:
+            wall = self._fill_back_uncut_masks(self._masked_wall, cs_masks[:self._masked_wall_counter_sunks])
+            new_masks = ([part_to_add["placed"]["mask"] for part_to_add in self._parts_to_add if not part_to_add["in_wall"]]
+                         + cs_masks[self._masked_wall_counter_sunks:])
+        self._masked_wall = cut_all(wall, new_masks, self.boolean_options)
+        for part_to_add in self._parts_to_add:
+            part_to_add["in_wall"] = True
+        self._masked_wall_counter_sunks = len(cs_masks)
+        # New stack: the counter-sunk blocks are then added to the returned workplane in place
+        return self._masked_wall.newObject(self._masked_wall.objects)
+
+    def _fill_back_uncut_masks(self, wall: cq.Workplane, cs_masks_in_wall: List[cq.Workplane]) -> cq.Workplane:
+        """
+        `wall` with the regions of `_masks_to_uncut` (boxes around them, through the wall) rebuilt from the uncut wall,
+        minus the masks still in the wall overlapping these regions.
+        """
+        masks_to_uncut = [mask for mask in self._masks_to_uncut if overlaps(mask, self._uncut_wall)]
+        self._masks_to_uncut = []
+        if len(masks_to_uncut) == 0:
+            return wall
+
+        wall_box = self._uncut_wall.val().BoundingBox()
+        regions = None
+        for mask in masks_to_uncut:
+            mask_box = cq.Compound.makeCompound(mask.vals()).BoundingBox()
+            region = (
+                cq.Workplane("XY")
+                    .box(mask_box.xlen, mask_box.ylen, wall_box.zlen + 2, centered=(True, True, False))
+                    .translate([mask_box.center.x, mask_box.center.y, wall_box.zmin - 1])
+            )
+            regions = region if regions is None else regions.union(region)
+
+        masks_in_wall = [part_to_add["placed"]["mask"] for part_to_add in self._parts_to_add if part_to_add["in_wall"]]
+        masks_in_regions = [mask for mask in masks_in_wall + cs_masks_in_wall if overlaps(mask, regions)]
+        filling = cut_all(self._uncut_wall.intersect(regions), masks_in_regions, self.boolean_options)
+        return wall.union(filling)
+
+    def _place(self, part_to_add, backpanel) -> Dict:
+        """The part, its mask, and its debug objects at the position of `part_to_add`; kept until the part is moved."""
+        if part_to_add["placed"] is None:
+            part_obj = part_to_add["part"]
+            pos = [*part_to_add["pos"], 0]
+            if part_obj.assembly_parts != None:
+                placed_part = self._translate_assembly_objects_and_rotate_to_face(part_obj.assembly_parts, pos)
+                #self._rotate_assembly_to_face(part_obj.part_assembly.translate([*part_to_add["pos"], 0])))
+            elif backpanel is not None:
+                translated_part = cut_all(part_obj.part.translate(pos), [backpanel], self.boolean_options)
+                placed_part = self._rotate_to_face(translated_part)
+            else:
+                placed_part = self._rotate_to_face(part_obj.part, pos)
+            part_to_add["placed"] = {
+                "part": placed_part,
+                "mask": translated(part_obj.mask, pos),
+                "debug": self._place_debug_objects(part_obj, pos),
+            }
+        return part_to_add["placed"]
+
     def _build_backpanel(self):
         copper_size = self.backpanel_size
         copper_thickness = self.backpanel_thickness
@@ -207,61 +475,58 @@ class Panel:
         copper = copper.translate(self.backpanel_pos)
         return copper
 
-    def _rotate_to_face(self, wp) -> cq.Workplane:
-        if self.face == Face.TOP:
-            wp = wp.mirror("XY")
-        elif self.face == Face.BOTTOM:
-            wp = wp.mirror("XZ")
-        elif self.face == Face.BACK:
-            wp = wp.rotate((0, 0, 0), (1, 0, 0), 90)
-            wp = wp.mirror("YZ")
-        elif self.face == Face.FRONT:
-            wp = wp.rotate((0, 0, 0), (1, 0, 0), 90)
-            wp = wp.mirror("XZ")
-        elif self.face == Face.LEFT:
-            wp = wp.rotate((0, 0, 0), (1, 0, 0), 90)
-            wp = wp.rotate((0, 0, 0), (0, 0, 1), 90)
-            wp = wp.mirror("XZ")
-        elif self.face == Face.RIGHT:
-            wp = wp.rotate((0, 0, 0), (1, 0, 0), 90)
-            wp = wp.rotate((0, 0, 0), (0, 0, 1), -90)
-            wp = wp.mirror("XZ")
-        return wp
+    def _rotate_to_face(self, wp, translation: Tuple[float, float, float] = (0, 0, 0)) -> Union[cq.Workplane, cq.Shape]:
+        """
+        `wp` (a workplane, or a bare shape, e.g. a compound in a part's debug objects) translated by `translation`,
+        then oriented to the face of the panel, with a single transform.
+        """
+        trsf = gp_Trsf()
+        trsf.SetTranslation(cq.Vector(*translation).wrapped)
+        return transformed(wp, _face_transform(self.face).Multiplied(trsf))
 
     def _translate_assembly_objects_and_rotate_to_face(self, assembly_parts, translation) -> cq.Assembly:
         assembly = cq.Assembly()
         for assembly_part in assembly_parts:
             part, loc, name, color = assembly_part.as_assembly_add_parameters()
-            part = part.translate(translation)
-            part = self._rotate_to_face(part)
+            part = self._rotate_to_face(part, translation)
             assembly.add(part, name=name, color=color)
         return assembly
 
-    def _add_part_to_debug_assemblies(self, part_to_add) -> None:
-        part = part_to_add["part"]
-        part_pos = part_to_add["pos"]
-        part_label: str = part_to_add["label"]
-        if part.debug_objects.hole != None:
+    def _reset_debug_assemblies(self) -> None:
+        self.debug_assemblies["hole"] = None
+        self.debug_assemblies["footprint_in"] = None
+        self.debug_assemblies["footprint_out"] = None
+        self.debug_assemblies["other"] = None
+        self.debug_assemblies["combined"] = cq.Assembly(None, name=self.face.label + " - Debug")
+
+    def _place_debug_objects(self, part: Part, pos) -> Dict:
+        def place(debug_object):
+            return None if debug_object == None else self._rotate_to_face(debug_object, pos)
+        return {
+            "hole": place(part.debug_objects.hole),
+            "footprint_in": place(part.debug_objects.footprint.inside),
+            "footprint_out": place(part.debug_objects.footprint.outside),
+            "others": {key: place(debug_object) for key, debug_object in part.debug_objects.others.items()},
+        }
+
+    def _add_part_to_debug_assemblies(self, part_label: str, placed_debug: Dict) -> None:
+        if placed_debug["hole"] != None:
             if self.debug_assemblies["hole"] == None:
                 self.debug_assemblies["hole"] = cq.Assembly(name="Hole")
-            hole = self._rotate_to_face(part.debug_objects.hole.translate([*part_pos, 0]))
-            self.debug_assemblies["hole"] = self.debug_assemblies["hole"].add(hole, name=part_label, color=cq.Color(1, 0, 0))
-        if part.debug_objects.footprint.inside != None:
+            self.debug_assemblies["hole"] = self.debug_assemblies["hole"].add(placed_debug["hole"], name=part_label, color=cq.Color(1, 0, 0))
+        if placed_debug["footprint_in"] != None:
             if self.debug_assemblies["footprint_in"] == None:
                 self.debug_assemblies["footprint_in"] = cq.Assembly(name="Footprint IN")
-            footprint_in = self._rotate_to_face(part.debug_objects.footprint.inside.translate([*part_pos, 0]))
-            self.debug_assemblies["footprint_in"] = self.debug_assemblies["footprint_in"].add(footprint_in, name=part_label, color=cq.Color(1, 0, 1))
-        if part.debug_objects.footprint.outside != None:
+            self.debug_assemblies["footprint_in"] = self.debug_assemblies["footprint_in"].add(placed_debug["footprint_in"], name=part_label, color=cq.Color(1, 0, 1))
+        if placed_debug["footprint_out"] != None:
             if self.debug_assemblies["footprint_out"] == None:
                 self.debug_assemblies["footprint_out"] = cq.Assembly(name="Footprint OUT")
-            footprint_out = self._rotate_to_face(part.debug_objects.footprint.outside.translate([*part_pos, 0]))
-            self.debug_assemblies["footprint_out"] = self.debug_assemblies["footprint_out"].add(footprint_out, name=part_label, color=cq.Color(0, 1, 1))
+            self.debug_assemblies["footprint_out"] = self.debug_assemblies["footprint_out"].add(placed_debug["footprint_out"], name=part_label, color=cq.Color(0, 1, 1))
         other_debug_assembly = None
-        for key in part.debug_objects.others.keys():
+        for key, debug_part in placed_debug["others"].items():
             if other_debug_assembly == None:
                 other_debug_assembly = cq.Assembly()
                 self.debug_assemblies["other"] = cq.Assembly()
-            debug_part = self._rotate_to_face(part.debug_objects.others[key].translate([*part_pos, 0]))
             other_debug_assembly = other_debug_assembly.add(debug_part, name=key)
         if other_debug_assembly != None:
             if self.debug_assemblies["other"] == None:
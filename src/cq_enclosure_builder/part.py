@@ -55,6 +55,46 @@ class PartSize:
         self.thickness: float = 0
 
 
+class PartSpec:
+    """
+    Size and footprints of a part: everything the layout builder needs, computed without building any geometry.
+
+    Built-in parts compute it in a `build_spec` static method taking the same parameters as their constructor
+    (see PartFactory.spec_<category>), and apply it in their constructor with `Part.apply_spec`.
+    """
+    def __init__(
+        self,
+        size: Tuple[float, float, float],
+        inside_footprint: Tuple[float, float],
+        inside_footprint_thickness: float,
+        inside_footprint_offset: Tuple[float, float],
+        outside_footprint: Tuple[float, float],
+        outside_footprint_thickness: float,
+        outside_footprint_offset: Tuple[float, float] = (0, 0),
+    ):
+        self.size: PartSize = PartSize()
+        self.size.width, self.size.length, self.size.thickness = size
+        self.inside_footprint: Tuple[float, float] = inside_footprint
+        self.inside_footprint_thickness: float = inside_footprint_thickness
+        self.inside_footprint_offset: Tuple[float, float] = inside_footprint_offset
+        self.outside_footprint: Tuple[float, float] = outside_footprint
+        self.outside_footprint_thickness: float = outside_footprint_thickness
+        self.outside_footprint_offset: Tuple[float, float] = outside_footprint_offset
+
+    @staticmethod
+    def from_part(part: "Part") -> "PartSpec":
+        """Spec of an already built part (e.g. a part without `build_spec`)."""
+        return PartSpec(
+            (part.size.width, part.size.length, part.size.thickness),
+            part.inside_footprint,
+            part.inside_footprint_thickness,
+            part.inside_footprint_offset,
+            part.outside_footprint,
+            part.outside_footprint_thickness,
+            part.outside_footprint_offset,
+        )
+
+
 """Base class for all parts."""
 class Part:
     def __init__(
@@ -108,6 +148,17 @@ class Part:
         self.debug_objects: DebugObjects = DebugObjects()
 
 
+    def apply_spec(self, spec: PartSpec) -> None:
+        """Set the size and footprints of the part from its spec."""
+        self.size.width, self.size.length, self.size.thickness = spec.size.width, spec.size.length, spec.size.thickness
+        self.inside_footprint = spec.inside_footprint
+        self.inside_footprint_thickness = spec.inside_footprint_thickness
+        self.inside_footprint_offset = spec.inside_footprint_offset
+        self.outside_footprint = spec.outside_footprint
+        self.outside_footprint_thickness = spec.outside_footprint_thickness
+        self.outside_footprint_offset = spec.outside_footprint_offset
+
+
     def assembly_parts_to_cq_assembly(self) -> cq.Assembly:
         if self.assembly_parts is None:
             return None
@@ -0,0 +1,620 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import os
+import io
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import time
+import socket
+import uuid
+from urllib.parse import quote
+from collections import OrderedDict, namedtuple
+from typing import List, Dict, Tuple, Any, Callable, Type, Union, Hashable
+
+import cadquery as cq
+from OCP.TopoDS import TopoDS_Iterator
+
+from cq_enclosure_builder.part import Part, PartSize, AssemblyPart
+from cq_enclosure_builder.cache_key import is_persistable
+from cq_enclosure_builder.part_fingerprint import package_version
+
+
+# Bump when the layout of the serialized parts changes, to ignore older cache entries
+SERIALIZATION_FORMAT_VERSION: int = 1
+
+META_FILE_NAME: str = "part.json"
+
+# When set, PartFactory uses this directory as its on-disk cache (see PartFactory.set_disk_cache_dir)
+CACHE_DIR_ENV_VAR: str = "CQ_ENCLOSURE_BUILDER_CACHE_DIR"
+
+# Lock files, one per key being built, so that processes sharing a cache directory only build each part once
+LOCKS_DIR_NAME: str = ".locks"
+LOCK_POLL_INTERVAL: float = 0.05  # seconds; doubled after each check, up to LOCK_MAX_POLL_INTERVAL
+LOCK_MAX_POLL_INTERVAL: float = 1.0
+LOCK_STALE_AFTER: float = 600.0  # seconds; locks of other hosts older than this are assumed to be left over by a crashed process
+
+# Index of the entries of each part: an empty file per key, in <index>/<category>/<part_type>/, so that prune
+#   only looks at the entries of the part being pruned
+INDEX_DIR_NAME: str = ".parts"
+
+# Caches kept by the helpers of the parts (e.g. the blocks of ScrewBlock), emptied along with PartFactory's memory cache
+_helper_cache_clearers: List[Callable[[], None]] = []
+
+
+def register_helper_cache(clear: Callable[[], None]) -> None:
+    """Have `clear` called by PartFactory.clear_cache, to empty a cache of intermediate geometry."""
+    _helper_cache_clearers.append(clear)
+
+
+def clear_helper_caches() -> None:
+    for clear in _helper_cache_clearers:
+        clear()
+
+
+def workplane_to_brep(wp: Union[cq.Workplane, cq.Shape]) -> Union[bytes, None]:
+    """Serialize the shapes held by a workplane (or a bare shape, e.g. the compound of the screens); returns None if there's nothing to serialize."""
+    if isinstance(wp, cq.Shape):
+        buffer = io.BytesIO()
+        wp.exportBrep(buffer)
+        return buffer.getvalue()
+    shapes = [o for o in wp.objects if isinstance(o, cq.Shape)]
+    if len(shapes) == 0:
+        try: shapes = [wp.findSolid()]
+        except ValueError: return None
+    shape = shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+    buffer = io.BytesIO()
+    shape.exportBrep(buffer)
+    return buffer.getvalue()
+
+
+def brep_to_workplane(data: bytes, object_count: int = 1) -> Union[cq.Workplane, cq.Shape]:
+    """
+    Inverse of `workplane_to_brep`; `object_count` > 1 means the shapes were wrapped in a compound,
+    and 0 that a bare shape was serialized.
+    """
+    shape = cq.Shape.importBrep(io.BytesIO(data))
+    if object_count == 0:
+        return shape
+    if object_count == 1:
+        return cq.Workplane("XY").newObject([shape])
+    shapes = []
+    iterator = TopoDS_Iterator(shape.wrapped)
+    while iterator.More():
+        shapes.append(cq.Shape.cast(iterator.Value()))
+        iterator.Next()
+    return cq.Workplane("XY").newObject(shapes)
+
+
+def _object_count(wp: Union[cq.Workplane, cq.Shape]) -> int:
+    if isinstance(wp, cq.Shape):
+        return 0
+    return max(1, len([o for o in wp.objects if isinstance(o, cq.Shape)]))
+
+
+def _is_json_value(value: Any) -> bool:
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def serialize_part(part: Part) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """
+    Split a part into a JSON-serializable dict of metadata, and one BREP blob per workplane ('slot').
+
+    Attributes added by subclasses are kept if they're JSON-serializable or workplanes; others are dropped.
+    """
+    breps: Dict[str, bytes] = {}
+    object_counts: Dict[str, int] = {}
+
+    def add_slot(slot: str, wp: Union[cq.Workplane, cq.Shape, None]) -> Union[str, None]:
+        if wp is None:
+            return None
+        data = workplane_to_brep(wp)
+        if data is None:
+            return None
+        breps[slot] = data
+        object_counts[slot] = _object_count(wp)
+        return slot
+
+    handled_attributes = {
+        "part", "mask", "assembly_parts", "additional_printables", "size", "debug_objects",
+        "inside_footprint", "inside_footprint_thickness", "inside_footprint_offset",
+        "outside_footprint", "outside_footprint_thickness", "outside_footprint_offset",
+    }
+
+    meta: Dict[str, Any] = {
+        "format_version": SERIALIZATION_FORMAT_VERSION,
+        "class": f"{type(part).__module__}.{type(part).__qualname__}",
+        "part": add_slot("part", part.part),
+        "mask": add_slot("mask", part.mask),
+        "size": [part.size.width, part.size.length, part.size.thickness],
+        "inside_footprint": part.inside_footprint,
+        "inside_footprint_thickness": part.inside_footprint_thickness,
+        "inside_footprint_offset": part.inside_footprint_offset,
+        "outside_footprint": part.outside_footprint,
+        "outside_footprint_thickness": part.outside_footprint_thickness,
+        "outside_footprint_offset": part.outside_footprint_offset,
+        "debug_objects": {
+            "footprint_inside": add_slot("debug.footprint.inside", part.debug_objects.footprint.inside),
+            "footprint_outside": add_slot("debug.footprint.outside", part.debug_objects.footprint.outside),
+            "hole": add_slot("debug.hole", part.debug_objects.hole),
+            "others": {name: add_slot(f"debug.others.{idx}", wp) for idx, (name, wp) in enumerate(part.debug_objects.others.items())},
+        },
+        "assembly_parts": None,
+        "additional_printables": None,
+        "attributes": {},
+        "workplane_attributes": {},
+        "object_counts": object_counts,
+    }
+
+    if part.assembly_parts is not None:
+        meta["assembly_parts"] = [{
+            "name": ap.name,
+            "color": list(ap.color.toTuple()) if ap.color is not None else None,
+            "workplane": add_slot(f"assembly_parts.{idx}", ap.workplane),
+        } for idx, ap in enumerate(part.assembly_parts)]
+
+    if part.additional_printables is not None:
+        meta["additional_printables"] = [{
+            "name": name,
+            "size": size,
+            "workplane": add_slot(f"additional_printables.{idx}", wp),
+        } for idx, (name, size, wp) in enumerate(part.additional_printables)]
+
+    for name, value in part.__dict__.items():
+        if name in handled_attributes:
+            continue
+        if isinstance(value, cq.Workplane):
+            meta["workplane_attributes"][name] = add_slot(f"attributes.{name}", value)
+        elif _is_json_value(value):
+            meta["attributes"][name] = value
+
+    return (meta, breps)
+
+
+def deserialize_part(part_class: Type[Part], meta: Dict[str, Any], breps: Dict[str, bytes]) -> Part:
+    """Rebuild a part of type `part_class` from the output of `serialize_part`, without calling its constructor."""
+    object_counts = meta["object_counts"]
+
+    def load_slot(slot: Union[str, None]) -> Union[cq.Workplane, None]:
+        if slot is None:
+            return None
+        return brep_to_workplane(breps[slot], object_counts.get(slot, 1))
+
+    def as_tuple(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    part = part_class.__new__(part_class)
+    Part.__init__(part)
+
+    for name, value in meta["attributes"].items():
+        setattr(part, name, value)
+    for name, slot in meta["workplane_attributes"].items():
+        setattr(part, name, load_slot(slot))
+
+    part.part = load_slot(meta["part"])
+    part.mask = load_slot(meta["mask"])
+    part.size.width, part.size.length, part.size.thickness = meta["size"]
+    part.inside_footprint = as_tuple(meta["inside_footprint"])
+    part.inside_footprint_thickness = meta["inside_footprint_thickness"]
+    part.inside_footprint_offset = as_tuple(meta["inside_footprint_offset"])
+    part.outside_footprint = as_tuple(meta["outside_footprint"])
+    part.outside_footprint_thickness = meta["outside_footprint_thickness"]
+    part.outside_footprint_offset = as_tuple(meta["outside_footprint_offset"])
+
+    debug = meta["debug_objects"]
+    part.debug_objects.footprint.inside = load_slot(debug["footprint_inside"])
+    part.debug_objects.footprint.outside = load_slot(debug["footprint_outside"])
+    part.debug_objects.hole = load_slot(debug["hole"])
+    part.debug_objects.others = {name: load_slot(slot) for name, slot in debug["others"].items()}
+
+    if meta["assembly_parts"] is not None:
+        part.assembly_parts = [
+            AssemblyPart(load_slot(ap["workplane"]), ap["name"], cq.Color(*ap["color"]) if ap["color"] is not None else None)
+            for ap in meta["assembly_parts"]
+        ]
+    if meta["additional_printables"] is not None:
+        part.additional_printables = [
+            (ap["name"], as_tuple(ap["size"]), load_slot(ap["workplane"]))
+            for ap in meta["additional_printables"]
+        ]
+
+    return part
+
+
+def footprints_from_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Size and footprint attributes of a serialized part (see `serialize_part`), e.g. for a LazyPart."""
+    def as_tuple(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    size = PartSize()
+    size.width, size.length, size.thickness = meta["size"]
+    footprints: Dict[str, Any] = {"size": size}
+    for name in ["inside_footprint", "inside_footprint_thickness", "inside_footprint_offset",
+                 "outside_footprint", "outside_footprint_thickness", "outside_footprint_offset"]:
+        footprints[name] = as_tuple(meta[name])
+    return footprints
+
+
+def estimate_part_bytes(part: Part) -> int:
+    """Approximate memory footprint of a part, based on the size of its serialized BREP."""
+    _, breps = serialize_part(part)
+    return sum(len(data) for data in breps.values())
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "max_entries", "bytes", "max_bytes"])
+
+
+class PartLruCache:
+    """
+    In-memory cache of built parts, evicting the least recently used entries once
+    `max_entries` or `max_bytes` (estimated from the serialized BREP size) is exceeded.
+
+    Both limits are disabled (None) by default. The sizes are only computed when `max_bytes` is set.
+    All methods are thread-safe; the cache is shared by every PartFactory.context.
+    """
+
+    def __init__(self, max_entries: Union[int, None] = None, max_bytes: Union[int, None] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Part]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable) -> Union[Part, None]:
+        with self._lock:
+            part = self._entries.get(key)
+            if part is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return part
+
+    def put(self, key: Hashable, part: Part) -> None:
+        # Measured outside of the lock, serializing a part can be slow
+        size = estimate_part_bytes(part) if self.max_bytes is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = part
+            if self.max_bytes is not None:
+                self._sizes[key] = size if size is not None else estimate_part_bytes(part)
+                self._total_bytes += self._sizes[key]
+            self._evict()
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove the entries whose key matches `predicate`. Returns the number of entries removed."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def size_of(self, key: Hashable) -> Union[int, None]:
+        """Estimated size of an entry, if tracked (i.e. when `max_bytes` is set)."""
+        with self._lock:
+            return self._sizes.get(key)
+
+    def set_limits(self, max_entries: Union[int, None] = None, max_bytes: Union[int, None] = None) -> None:
+        with self._lock:
+            if max_bytes is not None and self.max_bytes is None:
+                # Sizes weren't tracked so far
+                for key, part in self._entries.items():
+                    self._sizes[key] = estimate_part_bytes(part)
+                self._total_bytes = sum(self._sizes.values())
+            elif max_bytes is None:
+                self._sizes = {}
+                self._total_bytes = 0
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes = {}
+            self._total_bytes = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries),
+                             self.max_entries, self._total_bytes if self.max_bytes is not None else None, self.max_bytes)
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        while len(self._entries) > 0 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+
+class DiskPartCache:
+    """
+    Persistent cache tier behind `PartFactory.build`.
+
+    Each entry is a directory named after its key, containing one BREP file per workplane of the part,
+    and a JSON sidecar (`part.json`) with the rest of the part (sizes, footprints, names, etc.).
+
+    The directory can be shared by several processes: entries are written to a temporary directory,
+    then renamed, and a process building a part holds a lock file for its key (see `acquire`),
+    so that the other processes wait for the part instead of building it too.
+    """
+
+    def __init__(self, directory: str, lock_stale_after: float = LOCK_STALE_AFTER):
+        self.directory = directory
+        self.lock_stale_after = lock_stale_after
+        self._lock_tokens: Dict[str, str] = {}  # key -> token written in the lock this process holds for it
+        os.makedirs(os.path.join(self.directory, LOCKS_DIR_NAME), exist_ok=True)
+
+    @staticmethod
+    def build_key(category: str, part_type: str, hashable_kwargs: Dict[str, Any], fingerprint: Union[str, None]) -> Union[str, None]:
+        """
+        `hashable_kwargs` should be the canonical parameters (see cache_key.py), and `fingerprint` the one
+        computed when registering the part (see part_fingerprint.py).
+        Returns None if the part can't be safely cached on disk.
+        """
+        if fingerprint is None or not is_persistable(tuple(hashable_kwargs.values())):
+            return None
+        key_source = json.dumps([
+            SERIALIZATION_FORMAT_VERSION,
+            category,
+            part_type,
+            repr(sorted(hashable_kwargs.items())),
+            fingerprint,
+        ])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _index_dir(self, category: str, part_type: str) -> str:
+        return os.path.join(self.directory, INDEX_DIR_NAME, quote(category, safe=""), quote(part_type, safe=""))
+
+    def _lock_path(self, key: str) -> str:
+        return os.path.join(self.directory, LOCKS_DIR_NAME, key + ".lock")
+
+    def acquire(self, key: str, wait: bool = True) -> bool:
+        """
+        Take the lock for building `key`. Returns True if the caller now holds it (and should build the part,
+        then `release` it), False if the entry was stored by another process in the meantime,
+        or, with `wait=False`, if another process is building it.
+        """
+        lock_path = self._lock_path(key)
+        poll_interval = LOCK_POLL_INTERVAL
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self.load_meta(key) is not None:
+                    return False
+                if self._is_stale(lock_path):
+                    self._break_stale_lock(lock_path)
+                    continue
+                if not wait:
+                    return False
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, LOCK_MAX_POLL_INTERVAL)
+                continue
+            token = uuid.uuid4().hex
+            with os.fdopen(fd, "w") as f:
+                json.dump({"host": socket.gethostname(), "pid": os.getpid(), "token": token}, f)
+            self._lock_tokens[key] = token
+            return True
+
+    def release(self, key: str) -> None:
+        """Remove the lock taken with `acquire`; a lock taken over by another process in the meantime is left alone."""
+        token = self._lock_tokens.pop(key, None)
+        lock_path = self._lock_path(key)
+        try:
+            with open(lock_path, "r") as f:
+                owner = json.load(f)
+        except (OSError, ValueError):
+            return  # taken over, and being written
+        if isinstance(owner, dict) and owner.get("token") == token:
+            self._remove_lock(lock_path)
+
+    def _is_stale(self, lock_path: str) -> bool:
+        """
+        On this host, a lock is stale once the process holding it is gone, however long its build takes. The age of the
+        lock (`lock_stale_after`) is only used when its owner can't be checked: another host, or a lock left empty
+        by a process that crashed right after creating it.
+        """
+        try:
+            with open(lock_path, "r") as f:
+                age = time.time() - os.fstat(f.fileno()).st_mtime
+                owner = json.load(f)
+        except OSError:
+            return False  # just released
+        except ValueError:
+            owner = None  # still being written, or left empty
+        # (not on Windows, where os.kill(pid, 0) sends CTRL+C to the process)
+        if isinstance(owner, dict) and owner.get("host") == socket.gethostname() and os.name != "nt":
+            try:
+                os.kill(owner["pid"], 0)
+            except ProcessLookupError:
+                return True  # the process holding the lock is gone
+            except PermissionError:
+                return False  # alive, run by another user
+            except (OSError, KeyError, TypeError):
+                pass
+            else:
+                return False
+        return age > self.lock_stale_after
+
+    def _break_stale_lock(self, lock_path: str) -> None:
+        """
+        Remove a stale lock. Several waiters may find it stale at once, and one of them may take a new lock before another
+        removes the old one: the lock is first renamed to a name unique to this thread (only one rename can succeed),
+        and only removed if it's still the file found stale; otherwise it's a lock taken in the meantime, and it's put back.
+
+        One window remains: if yet another process takes a lock between the rename and putting it back, the lock can't
+        be put back, and two processes build the part (which is harmless, as entries are written atomically; see `store`).
+        """
+        try:
+            identity = self._file_identity(lock_path)
+            if not self._is_stale(lock_path) or self._file_identity(lock_path) != identity:
+                return  # not stale, or replaced while checking it
+        except FileNotFoundError:
+            return  # removed by another waiter
+        stale_path = f"{lock_path}.{socket.gethostname()}-{os.getpid()}-{threading.get_ident()}.stale"
+        try:
+            os.rename(lock_path, stale_path)
+        except FileNotFoundError:
+            return  # removed by another waiter
+        if self._file_identity(stale_path) != identity:
+            try:
+                os.link(stale_path, lock_path)
+            except OSError:
+                print(f"WARNING: couldn't restore the lock '{lock_path}' after taking it over by mistake; the part may be built twice.")
+        self._remove_lock(stale_path)
+
+    @staticmethod
+    def _file_identity(path: str) -> Tuple[int, int, int, int]:
+        stat = os.stat(path)
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _remove_lock(lock_path: str) -> None:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+    def load_meta(self, key: str) -> Union[Dict[str, Any], None]:
+        """The JSON sidecar of an entry (sizes, footprints, etc.), without loading its BREP files."""
+        meta_path = os.path.join(self._entry_dir(key), META_FILE_NAME)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("format_version") != SERIALIZATION_FORMAT_VERSION:
+            return None
+        return meta
+
+    def load(self, key: str, part_class: Type[Part]) -> Union[Part, None]:
+        entry_dir = self._entry_dir(key)
+        meta = self.load_meta(key)
+        if meta is None:
+            return None
+        try:
+            breps = {}
+            for slot in meta["object_counts"].keys():
+                with open(os.path.join(entry_dir, slot + ".brep"), "rb") as f:
+                    breps[slot] = f.read()
+            return deserialize_part(part_class, meta, breps)
+        except Exception as e:
+            print(f"WARNING: couldn't load cached part from '{entry_dir}', it will be rebuilt: {e}")
+            return None
+
+    def store(self, key: str, part: Part, category: str, part_type: str, fingerprint: Union[str, None] = None) -> int:
+        """Returns the total size of the BREP files."""
+        meta, breps = serialize_part(part)
+        meta["category"] = category
+        meta["part_type"] = part_type
+        meta["fingerprint"] = fingerprint
+        meta["package_version"] = package_version()
+
+        entry_dir = self._entry_dir(key)
+        parent_dir = os.path.dirname(entry_dir)
+        os.makedirs(parent_dir, exist_ok=True)
+
+        # Write everything to a temporary directory first, then rename it, so readers never see a partial entry
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}-", dir=parent_dir)
+        try:
+            for slot, data in breps.items():
+                with open(os.path.join(tmp_dir, slot + ".brep"), "wb") as f:
+                    f.write(data)
+            with open(os.path.join(tmp_dir, META_FILE_NAME), "w") as f:
+                json.dump(meta, f)
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            pass  # most likely already stored by someone else
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        index_dir = self._index_dir(category, part_type)
+        os.makedirs(index_dir, exist_ok=True)
+        open(os.path.join(index_dir, key), "w").close()
+        return sum(len(data) for data in breps.values())
+
+    def prune(self, category: str, part_type: str, fingerprint: str) -> int:
+        """
+        Delete the entries of a part built from another version of its code (i.e. with another `fingerprint`).
+        Only the entries in the part's index are looked at, and entries whose sidecar can't be read are kept.
+        Entries stored by another version of the package are kept too: when several versions share a cache directory
+        (e.g. two virtualenvs), each would otherwise delete the entries of the other one every time it builds a part.
+        Returns the number of entries deleted.
+        """
+        index_dir = self._index_dir(category, part_type)
+        try:
+            keys = os.listdir(index_dir)
+        except FileNotFoundError:
+            return 0
+        pruned = 0
+        for key in keys:
+            meta = self.load_meta(key)
+            if meta is None:
+                if not os.path.exists(self._entry_dir(key)):
+                    self._remove_index_entry(index_dir, key)  # already deleted (e.g. by hand)
+                continue
+            if ((meta.get("category"), meta.get("part_type")) != (category, part_type)
+                    or meta.get("package_version") != package_version()
+                    or meta.get("fingerprint") == fingerprint):
+                continue
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            self._remove_index_entry(index_dir, key)
+            pruned += 1
+        return pruned
+
+    @staticmethod
+    def _remove_index_entry(index_dir: str, key: str) -> None:
+        try:
+            os.remove(os.path.join(index_dir, key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(os.path.join(self.directory, LOCKS_DIR_NAME), exist_ok=True)
@@ -0,0 +1,117 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import sys
+import types
+import hashlib
+import inspect
+import functools
+from importlib import metadata
+from typing import List, Dict, Type, Union
+
+from cq_enclosure_builder.part import Part
+
+# Fingerprint of the code of a registered part, computed by PartFactory.register_part and used in the cache keys,
+#   so that editing (and reloading) a part, or one of the helpers it uses, invalidates the parts built with the old code.
+
+PACKAGE_NAME: str = "cq_enclosure_builder"
+
+# Modules of the package that don't affect the geometry of the parts (the factory and its caches)
+EXCLUDED_MODULES: List[str] = [
+    PACKAGE_NAME,
+    f"{PACKAGE_NAME}.parts_factory",
+    f"{PACKAGE_NAME}.parts_factory_protocol",
+    f"{PACKAGE_NAME}.part_cache",
+    f"{PACKAGE_NAME}.part_fingerprint",
+    f"{PACKAGE_NAME}.cache_key",
+    f"{PACKAGE_NAME}.build_stats",
+    f"{PACKAGE_NAME}.lazy_part",
+    f"{PACKAGE_NAME}.parts.manifest",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def package_version() -> str:
+    try:
+        return metadata.version(PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return "unknown"  # not installed, e.g. running from a clone
+
+
+def part_fingerprint(part_class: Type[Part]) -> Union[str, None]:
+    """
+    Hash of the package version, of the source of the module defining `part_class`, and of the source of the modules
+    of the package it uses (transitively; e.g. screw_block or generic_threaded_part).
+    None if some source can't be found (e.g. a part defined in a REPL).
+    """
+    module_hashes: Dict[str, Union[str, None]] = {}
+    _hash_module_tree(part_class.__module__, module_hashes)
+    if part_class.__module__ not in module_hashes or any(h is None for h in module_hashes.values()):
+        return None
+    fingerprint = hashlib.sha256(package_version().encode("utf-8"))
+    for module_name in sorted(module_hashes):
+        fingerprint.update(f"\n{module_name}:{module_hashes[module_name]}".encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def part_uses_module(part_class: Type[Part], module_name: str) -> bool:
+    """Whether the module defining `part_class` uses `module_name`, directly or through other modules of the package."""
+    visited = set()
+    pending = [part_class.__module__]
+    while pending:
+        name = pending.pop()
+        if name == module_name:
+            return True
+        if name in visited:
+            continue
+        visited.add(name)
+        module = sys.modules.get(name)
+        if module is not None:
+            pending.extend(_package_dependencies(module))
+    return False
+
+
+def _hash_module_tree(module_name: str, module_hashes: Dict[str, Union[str, None]]) -> None:
+    module = sys.modules.get(module_name)
+    if module is None:
+        module_hashes[module_name] = None
+        return
+    try:
+        source = inspect.getsource(module)
+        module_hashes[module_name] = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    except (OSError, TypeError):
+        module_hashes[module_name] = None
+        return
+
+    for dependency in _package_dependencies(module):
+        if dependency not in module_hashes:
+            _hash_module_tree(dependency, module_hashes)
+
+
+def _package_dependencies(module: types.ModuleType) -> List[str]:
+    """Modules of the package whose classes, functions, or the modules themselves, are imported by `module`."""
+    dependencies = set()
+    for value in list(vars(module).values()):
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+        elif isinstance(value, (type, types.FunctionType)):
+            name = getattr(value, "__module__", None)
+        else:
+            continue
+        if (name is not None and name != module.__name__ and name not in EXCLUDED_MODULES
+                and (name == PACKAGE_NAME or name.startswith(PACKAGE_NAME + "."))):
+            dependencies.add(name)
+    return sorted(dependencies)
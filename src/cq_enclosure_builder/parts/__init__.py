@@ -1,17 +1,33 @@
-from . import common
-from . import jack
-from . import button
-from . import encoder
-from . import potentiometer
-from . import usb_a
-from . import usb_c
-from . import screen
-from . import air_vent
-from . import banana
-from . import barrel_plug
-from . import rca
-from . import support
-from . import toggle
-from . import midi
-from . import holder
-from . import text
\ No newline at end of file
+import importlib
+
+# The category packages are imported on first access (e.g. `parts.jack`), so that importing cq_enclosure_builder
+#   doesn't import every part (and cq_warehouse); PartFactory knows about them through manifest.py.
+_SUBPACKAGES = [
+    "common",
+    "jack",
+    "button",
+    "encoder",
+    "potentiometer",
+    "usb_a",
+    "usb_c",
+    "screen",
+    "air_vent",
+    "banana",
+    "barrel_plug",
+    "rca",
+    "support",
+    "toggle",
+    "midi",
+    "holder",
+    "text",
+]
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + _SUBPACKAGES)
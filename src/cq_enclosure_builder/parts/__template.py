@@ -18,7 +18,7 @@ from typing import List, Dict, Tuple
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 
 
@@ -45,16 +45,23 @@ class XxxPart(Part):
 
         self.additional_printables = None  # optional
 
-        self.size.width     = None  # TODO (required)
-        self.size.length    = None  # TODO (required)
-        self.size.thickness = None  # TODO (required)
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = None  # TODO (required for supports)
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = None  # TODO (optional)
+        # Sets size and footprints (optional; can also be set directly, as `build_spec` is optional)
+        self.apply_spec(XxxPart.build_spec(enclosure_wall_thickness))
 
         self.debug_objects.footprint.inside  = None  # TODO (optional)
-        self.debug_objects.footprint.outside = None  # TODO (optional)
\ No newline at end of file
+        self.debug_objects.footprint.outside = None  # TODO (optional)
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,  # same parameters (and defaults) as __init__
+    ) -> PartSpec:
+        """Optional: lets PartFactory.spec_<category> (and lazy builds) get the footprints without building any geometry"""
+        width, length, thickness = None, None, None  # TODO (required)
+        return PartSpec(
+            size=(width, length, thickness),
+            inside_footprint=(width, length),
+            inside_footprint_thickness=None,  # TODO (required for supports)
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(width, length),
+            outside_footprint_thickness=None,  # TODO (optional)
+        )
\ No newline at end of file
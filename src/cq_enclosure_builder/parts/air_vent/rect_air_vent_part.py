@@ -14,13 +14,14 @@
    limitations under the License.
 """
 
-from typing import Union
+from typing import Tuple, Union
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock, TaperOptions
+from cq_enclosure_builder.parts.common.screw_pattern import ScrewPattern
 from cq_enclosure_builder.parts.common.screws_providers import TinyBlockFlatHeadScrewProvider, DefaultHeatSetScrewProvider
 from cq_enclosure_builder.parts.air_vent.fan_size import FanSize
 
@@ -88,16 +89,10 @@ class RectAirVentPart(Part):
                 .add(board)
         )
 
-        self.size.width     = width + margin*2 + taper_margin*2
-        self.size.length    = length + margin*2 + taper_margin*2
-        self.size.thickness = thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)  # TODO should account for the screw blocks (incl. taper)
-        self.inside_footprint_thickness = 14 - enclosure_wall_thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 2
+        self.apply_spec(RectAirVentPart.build_spec(
+            enclosure_wall_thickness, width, length, thickness, margin, hole_angle, hole_width, distance_between_holes,
+            taper, taper_margin, taper_angle, with_fan_screws, fan_screws_size, fan_screws_taper_mode,
+            fan_screws_taper_rotation, fan_screws_taper_incline, fan_screws_taper_on))
 
         footprint_in = (
             cq.Workplane("front")
@@ -139,13 +134,7 @@ class RectAirVentPart(Part):
             fan_screws = fan_screws_a["screws"]  #.translate([0, 0, enclosure_wall_thickness])
             fan_masks = fan_screws_a["masks"]  #.translate([0, 0, enclosure_wall_thickness])
             # footprint_in = footprint_in.add(fan_screws_a["footprint_in"])
-            fan_footprint = fan_screws_a["footprint_size"]
             footprint_in = fan_screws_a["footprint_in"]
-            self.inside_footprint = (
-                self.inside_footprint[0] if self.inside_footprint[0] > fan_footprint[0] else fan_footprint[0],
-                self.inside_footprint[1] if self.inside_footprint[1] > fan_footprint[1] else fan_footprint[1],
-            )
-            self.inside_footprint_thickness = self.inside_footprint_thickness + fan_screws_a["footprint_thickness"]
 
             board = board.cut(fan_masks).add(fan_screws)
             mask = mask.add(fan_masks)
@@ -165,23 +154,54 @@ class RectAirVentPart(Part):
         self.debug_objects.hole = None
 
     @staticmethod
-    def _get_fan_screws_blocks(
-        enclosure_wall_thickness,
+    def build_spec(
+        enclosure_wall_thickness: float,
+        width: float = 30,
+        length: float = 25,
+        thickness: float = 8,
+        margin: float = 0.5,
+        hole_angle: float = 25,
+        hole_width: float = 1.6,
+        distance_between_holes: float = 4,
+        taper: bool = True,
+        taper_margin: float = 3,
+        taper_angle: float = 35,
+        with_fan_screws: Union[FanSize, None] = FanSize._40_MM,
+        fan_screws_size: str = "m2",
+        fan_screws_taper_mode: TaperOptions = TaperOptions.XY_TAPER,
+        fan_screws_taper_rotation: float = 180,
+        fan_screws_taper_incline: float = 0.75,
+        fan_screws_taper_on: str = "0011"
+    ) -> PartSpec:
+        size = (width + margin*2 + taper_margin*2, length + margin*2 + taper_margin*2, thickness)
+
+        inside_footprint = (size[0], size[1])  # TODO should account for the screw blocks (incl. taper)
+        inside_footprint_thickness = 14 - enclosure_wall_thickness
+        if with_fan_screws is not None:
+            _, fan_footprint_size, fan_footprint_thickness = RectAirVentPart._get_fan_footprint(
+                with_fan_screws, thickness, fan_screws_taper_mode)
+            inside_footprint = (
+                inside_footprint[0] if inside_footprint[0] > fan_footprint_size else fan_footprint_size,
+                inside_footprint[1] if inside_footprint[1] > fan_footprint_size else fan_footprint_size,
+            )
+            inside_footprint_thickness = inside_footprint_thickness + fan_footprint_thickness
+
+        return PartSpec(
+            size=size,
+            inside_footprint=inside_footprint,
+            inside_footprint_thickness=inside_footprint_thickness,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(size[0], size[1]),
+            outside_footprint_thickness=2,
+        )
+
+    @staticmethod
+    def _get_fan_footprint(
         fan_size: FanSize,
         block_thickness: float,
-        screw_size: str = "m2",
         screw_block_taper_option: TaperOptions = TaperOptions.XY_TAPER,
-        screw_block_taper_rotation: float = 0,
-        screw_block_taper_incline: float = 0.75,
-        screw_block_taper_on: str = "1111",  # should taper that specific screw block? same order as screws_pos
-        screw_block_hole_distance_to_wall: float = 3,
-    ):
-        screw = ScrewBlock(screw_provider=DefaultHeatSetScrewProvider).build(
-            screw_size, block_thickness, enclosure_wall_thickness, screw_hole_depth=block_thickness-screw_block_hole_distance_to_wall, fill_pointy_bit=True,
-            taper=screw_block_taper_option, taper_rotation=screw_block_taper_rotation, xy_taper_incline=screw_block_taper_incline, xy_taper_from=enclosure_wall_thickness)
-        screw_no_taper = ScrewBlock(screw_provider=DefaultHeatSetScrewProvider).build(
-            screw_size, block_thickness, enclosure_wall_thickness, screw_hole_depth=block_thickness-screw_block_hole_distance_to_wall, fill_pointy_bit=True)
-
+    ) -> Tuple[float, float, float]:
+        """Distance between the screws (center to center), size and thickness of the fan footprint."""
         distance_between_screws = None  # center to center
         footprint_size = None
         footprint_thickness = None
@@ -208,6 +228,30 @@ class RectAirVentPart(Part):
             footprint_size = footprint_size + taper_ramp_size*2
         # TODO might need to do something for Z_TAPERs as well
 
+        return (distance_between_screws, footprint_size, footprint_thickness)
+
+    @staticmethod
+    def _get_fan_screws_blocks(
+        enclosure_wall_thickness,
+        fan_size: FanSize,
+        block_thickness: float,
+        screw_size: str = "m2",
+        screw_block_taper_option: TaperOptions = TaperOptions.XY_TAPER,
+        screw_block_taper_rotation: float = 0,
+        screw_block_taper_incline: float = 0.75,
+        screw_block_taper_on: str = "1111",  # should taper that specific screw block? same order as screws_pos
+        screw_block_hole_distance_to_wall: float = 3,
+    ):
+        screw_block = ScrewBlock(screw_provider=DefaultHeatSetScrewProvider)
+        screws = ScrewPattern(
+            screw_block, screw_size, block_thickness, enclosure_wall_thickness, screw_hole_depth=block_thickness-screw_block_hole_distance_to_wall, fill_pointy_bit=True,
+            taper=screw_block_taper_option, taper_rotation=screw_block_taper_rotation, xy_taper_incline=screw_block_taper_incline, xy_taper_from=enclosure_wall_thickness)
+        screws_no_taper = ScrewPattern(
+            screw_block, screw_size, block_thickness, enclosure_wall_thickness, screw_hole_depth=block_thickness-screw_block_hole_distance_to_wall, fill_pointy_bit=True)
+
+        distance_between_screws, footprint_size, footprint_thickness = RectAirVentPart._get_fan_footprint(
+            fan_size, block_thickness, screw_block_taper_option)
+
         hdbs = distance_between_screws/2
 
         screws_pos = [
@@ -217,12 +261,10 @@ class RectAirVentPart(Part):
             (-hdbs, -hdbs),  # BR
         ]
 
-        screws = cq.Assembly()
-        masks = cq.Assembly()
         for idx, sp in enumerate(screws_pos):
-            current_screw = screw if screw_block_taper_on[idx] == "1" else screw_no_taper  # see apologies in constructor :D
-            screws.add(current_screw["block"].translate([*sp, 0]))
-            masks.add(current_screw["mask"].translate([*sp, 0]))
+            pattern = screws if screw_block_taper_on[idx] == "1" else screws_no_taper  # see apologies in constructor :D
+            pattern.add(sp)
+        placed_screws = ScrewPattern.build_all([screws, screws_no_taper])
 
         footprint_in = (
             cq.Workplane("front")
@@ -232,8 +274,8 @@ class RectAirVentPart(Part):
         )
 
         return {
-            "screws": screws.toCompound(),
-            "masks": masks.toCompound(),
+            "screws": placed_screws["blocks"],
+            "masks": placed_screws["masks"],
             "footprint_in": footprint_in,
             "footprint_size": (footprint_size, footprint_size),
             "footprint_thickness": footprint_thickness,
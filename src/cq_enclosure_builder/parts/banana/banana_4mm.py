@@ -14,8 +14,11 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedPart
 from cq_enclosure_builder.parts_factory import register_part
 
@@ -29,9 +32,11 @@ class Banana4mmPart(GenericThreadedPart):
     """
 
     def __init__(self, enclosure_wall_thickness):
-        super().__init__(
-            enclosure_wall_thickness,
+        super().__init__(enclosure_wall_thickness, **Banana4mmPart._threaded_parameters(enclosure_wall_thickness))
 
+    @staticmethod
+    def _threaded_parameters(enclosure_wall_thickness: float) -> Dict[str, Any]:
+        return dict(
             base_size=11.2,
 
             thread_diameter=5.7,
@@ -43,4 +48,9 @@ class Banana4mmPart(GenericThreadedPart):
                 outside_footprint_size=(11.2, 11.2),
                 outside_footprint_depth=8.8
             )
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        parameters = Banana4mmPart._threaded_parameters(enclosure_wall_thickness)
+        return GenericThreadedPart.base_spec(enclosure_wall_thickness, parameters["base_size"], parameters["footprint_specs"])
\ No newline at end of file
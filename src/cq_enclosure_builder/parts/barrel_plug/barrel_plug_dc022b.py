@@ -14,7 +14,10 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedPart
 from cq_enclosure_builder.parts_factory import register_part
 
@@ -27,9 +30,11 @@ class BarrelPlugDc022bPart(GenericThreadedPart):
     """
 
     def __init__(self, enclosure_wall_thickness):
-        super().__init__(
-            enclosure_wall_thickness,
+        super().__init__(enclosure_wall_thickness, **BarrelPlugDc022bPart._threaded_parameters(enclosure_wall_thickness))
 
+    @staticmethod
+    def _threaded_parameters(enclosure_wall_thickness: float) -> Dict[str, Any]:
+        return dict(
             base_size=15.6,
 
             thread_diameter=10.7,
@@ -41,4 +46,9 @@ class BarrelPlugDc022bPart(GenericThreadedPart):
                 outside_footprint_size=(12.4, 12.4),
                 outside_footprint_depth=3
             )
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        parameters = BarrelPlugDc022bPart._threaded_parameters(enclosure_wall_thickness)
+        return GenericThreadedPart.base_spec(enclosure_wall_thickness, parameters["base_size"], parameters["footprint_specs"])
\ No newline at end of file
@@ -14,8 +14,11 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 
@@ -34,9 +37,29 @@ class ButtonPbs110Part(GenericThreadedWithStopPart):
         self,
         enclosure_wall_thickness: float
     ):
-        super().__init__(
-            enclosure_wall_thickness,
+        super().__init__(enclosure_wall_thickness, **ButtonPbs110Part._threaded_parameters())
+        self.apply_spec(ButtonPbs110Part.build_spec(enclosure_wall_thickness))
+
+        footprint_in = (
+            cq.Workplane("front")
+                .box(*self.inside_footprint, self.inside_footprint_thickness, centered=(True, True, False))
+                .translate([0, 0, -self.inside_footprint_thickness])
+        )
+        footprint_out = (
+            cq.Workplane("front")
+                .circle(self.thread_diameter/2)
+                .extrude(self.outside_footprint_thickness)
+        )
 
+        footprint_in = self.mirror_and_translate(footprint_in)
+        footprint_out = self.mirror_and_translate(footprint_out)
+
+        self.debug_objects.footprint.inside  = footprint_in
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def _threaded_parameters() -> Dict[str, Any]:
+        return dict(
             width=12,
             length=12,
 
@@ -51,29 +74,18 @@ class ButtonPbs110Part(GenericThreadedWithStopPart):
             pyramid_taper=42
         )
 
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **ButtonPbs110Part._threaded_parameters())
         button_block_thickness = 8.3 + 6.5
-        self.inside_footprint = (self.width + 2, self.length + 2)
-        self.inside_footprint_thickness = self.block_thickness + button_block_thickness
-        self.inside_footprint_offset = (0, 0)
-
         button_outside_thickness = 20.7 - 8.3
-        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
-        self.outside_footprint = (self.thread_diameter, self.thread_diameter)
-        self.outside_footprint_thickness = button_outside_thickness - self.block_thickness - enclosure_wall_thickness  # updated later if button_cap is not None
 
-        footprint_in = (
-            cq.Workplane("front")
-                .box(*self.inside_footprint, self.inside_footprint_thickness, centered=(True, True, False))
-                .translate([0, 0, -self.inside_footprint_thickness])
-        )
-        footprint_out = (
-            cq.Workplane("front")
-                .circle(self.thread_diameter/2)
-                .extrude(self.outside_footprint_thickness)
-        )
-
-        footprint_in = self.mirror_and_translate(footprint_in)
-        footprint_out = self.mirror_and_translate(footprint_out)
-
-        self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(dimensions.width + 2, dimensions.length + 2),
+            inside_footprint_thickness=dimensions.block_thickness + button_block_thickness,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(dimensions.thread_diameter, dimensions.thread_diameter),
+            outside_footprint_thickness=button_outside_thickness - dimensions.block_thickness - enclosure_wall_thickness,
+        )
\ No newline at end of file
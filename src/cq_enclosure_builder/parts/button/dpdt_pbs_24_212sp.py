@@ -14,12 +14,18 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.knobs_and_caps import KnobOrCap, CAP_23_75_x_11_9
 
+BUTTON_BLOCK_THICKNESS = 15
+BUTTON_OUTSIDE_HEIGHT = 20.5
+
 
 @register_part("button", "DPDT PBS-24-212SP")
 class ButtonDpdtPbs24212SpPart(GenericThreadedWithStopPart):
@@ -34,31 +40,10 @@ class ButtonDpdtPbs24212SpPart(GenericThreadedWithStopPart):
         enclosure_wall_thickness: float,
         button_cap: KnobOrCap = CAP_23_75_x_11_9
     ):
-        super().__init__(
-            enclosure_wall_thickness,
-
-            width=16,
-            length=16,
+        super().__init__(enclosure_wall_thickness, **ButtonDpdtPbs24212SpPart._threaded_parameters())
+        self.apply_spec(ButtonDpdtPbs24212SpPart.build_spec(enclosure_wall_thickness, button_cap))
 
-            thread_diameter=11.8,
-            thread_diameter_error_margin=0.6,
-            thread_depth=12,
-
-            washer_thickness=0.75,
-            nut_thickness=2.13,
-            margin_after_nut=0.62,
-
-            pyramid_taper=5
-        )
-
-        button_block_thickness = 15
-        self.inside_footprint = (13.4, 12.15)
-        self.inside_footprint_offset = (0, 0)
-        self.inside_footprint_thickness = self.block_thickness + button_block_thickness
-
-        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
-        self.outside_footprint = (self.thread_diameter, self.thread_diameter)
-        self.outside_footprint_thickness = 20.5 - self.block_thickness - self.enclosure_wall_thickness  # updated later if button_cap is not None
+        button_outside_thickness = BUTTON_OUTSIDE_HEIGHT - self.block_thickness - self.enclosure_wall_thickness
 
         footprint_in = (
             cq.Workplane("front")
@@ -68,26 +53,64 @@ class ButtonDpdtPbs24212SpPart(GenericThreadedWithStopPart):
         footprint_out = (
             cq.Workplane("front")
                 .circle(self.thread_diameter/2)
-                .extrude(self.outside_footprint_thickness)
+                .extrude(button_outside_thickness)
                 .translate([0, 0, enclosure_wall_thickness])
         )
 
         if button_cap is not None:
-            self.outside_footprint = (button_cap.diameter, button_cap.diameter)
             knob_wp = (
                 cq.Workplane("front")
                     .circle(button_cap.diameter/2)
                     .extrude(button_cap.thickness)
                     .translate([0, 0, enclosure_wall_thickness])
-                    .translate([0, 0, self.outside_footprint_thickness - button_cap.inner_depth])
+                    .translate([0, 0, button_outside_thickness - button_cap.inner_depth])
             )
             if button_cap.fillet > 0:
                 knob_wp = knob_wp.edges("front").fillet(button_cap.fillet)
             footprint_out = footprint_out.add(knob_wp)
-            self.outside_footprint_thickness = self.outside_footprint_thickness + (button_cap.thickness - button_cap.inner_depth)
 
         footprint_in = self.mirror_and_translate(footprint_in)
         footprint_out = self.mirror_and_translate(footprint_out)
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def _threaded_parameters() -> Dict[str, Any]:
+        return dict(
+            width=16,
+            length=16,
+
+            thread_diameter=11.8,
+            thread_diameter_error_margin=0.6,
+            thread_depth=12,
+
+            washer_thickness=0.75,
+            nut_thickness=2.13,
+            margin_after_nut=0.62,
+
+            pyramid_taper=5
+        )
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        button_cap: KnobOrCap = CAP_23_75_x_11_9
+    ) -> PartSpec:
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **ButtonDpdtPbs24212SpPart._threaded_parameters())
+
+        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
+        outside_footprint = (dimensions.thread_diameter, dimensions.thread_diameter)
+        outside_footprint_thickness = BUTTON_OUTSIDE_HEIGHT - dimensions.block_thickness - enclosure_wall_thickness
+        if button_cap is not None:
+            outside_footprint = (button_cap.diameter, button_cap.diameter)
+            outside_footprint_thickness = outside_footprint_thickness + (button_cap.thickness - button_cap.inner_depth)
+
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(13.4, 12.15),
+            inside_footprint_thickness=dimensions.block_thickness + BUTTON_BLOCK_THICKNESS,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=outside_footprint,
+            outside_footprint_thickness=outside_footprint_thickness,
+        )
\ No newline at end of file
@@ -14,12 +14,18 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.knobs_and_caps import KnobOrCap, CAP_23_75_x_11_9
 
+BUTTON_BLOCK_THICKNESS = 14
+BUTTON_OUTSIDE_HEIGHT = 25.9
+
 
 @register_part("button", "SPST PBS-24B-4")
 class ButtonSpstPbs24b4Part(GenericThreadedWithStopPart):
@@ -35,64 +41,82 @@ class ButtonSpstPbs24b4Part(GenericThreadedWithStopPart):
         reinforced: bool = True,
         button_cap: KnobOrCap = CAP_23_75_x_11_9
     ):
-        # TODO test dome vs. pyramid for reinforcement
-        base_size = 28 if reinforced else 16
-        taper = 35 if reinforced else 5
-        super().__init__(
-            enclosure_wall_thickness,
-
-            width=base_size,
-            length=base_size,
+        super().__init__(enclosure_wall_thickness, **ButtonSpstPbs24b4Part._threaded_parameters(reinforced))
+        self.apply_spec(ButtonSpstPbs24b4Part.build_spec(enclosure_wall_thickness, reinforced, button_cap))
 
-            thread_diameter=11.8,
-            thread_diameter_error_margin=0.6,
-            thread_depth=14,
-
-            washer_thickness=0.75,
-            nut_thickness=2.13,
-            margin_after_nut=0.62,
-
-            pyramid_taper=taper
-        )
-
-        button_block_thickness = 14
-        self.inside_footprint = (16, 30.8)
-        self.inside_footprint_thickness = self.block_thickness + button_block_thickness
-        self.inside_footprint_offset = (0, -4.8)
-
-        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
-        self.outside_footprint = (self.thread_diameter, self.thread_diameter)
-        self.outside_footprint_thickness = 25.9 - self.block_thickness - enclosure_wall_thickness  # updated later if button_cap is not None
+        button_outside_thickness = BUTTON_OUTSIDE_HEIGHT - self.block_thickness - enclosure_wall_thickness
 
         footprint_in = (
             cq.Workplane("front")
-                .box(*self.inside_footprint, button_block_thickness, centered=(True, True, False))
-                .translate([0, (self.inside_footprint[1]/2) - 20.2, -(button_block_thickness + self.block_thickness)])
+                .box(*self.inside_footprint, BUTTON_BLOCK_THICKNESS, centered=(True, True, False))
+                .translate([0, (self.inside_footprint[1]/2) - 20.2, -(BUTTON_BLOCK_THICKNESS + self.block_thickness)])
                 .add(self.pyramid.mirror("XY").translate([0, 0, enclosure_wall_thickness]))
         )
         footprint_out = (
             cq.Workplane("front")
                 .circle(self.thread_diameter/2)
-                .extrude(self.outside_footprint_thickness)
+                .extrude(button_outside_thickness)
                 .translate([0, 0, enclosure_wall_thickness])
         )
 
         if button_cap is not None:
-            self.outside_footprint = (button_cap.diameter, button_cap.diameter)
             knob_wp = (
                 cq.Workplane("front")
                     .circle(button_cap.diameter/2)
                     .extrude(button_cap.thickness)
                     .translate([0, 0, enclosure_wall_thickness])
-                    .translate([0, 0, self.outside_footprint_thickness - button_cap.inner_depth])
+                    .translate([0, 0, button_outside_thickness - button_cap.inner_depth])
             )
             if button_cap.fillet > 0:
                 knob_wp = knob_wp.edges("front").fillet(button_cap.fillet)
             footprint_out = footprint_out.add(knob_wp)
-            self.outside_footprint_thickness = self.outside_footprint_thickness + (button_cap.thickness - button_cap.inner_depth)
 
         footprint_in = self.mirror_and_translate(footprint_in)
         footprint_out = self.mirror_and_translate(footprint_out)
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def _threaded_parameters(reinforced: bool) -> Dict[str, Any]:
+        # TODO test dome vs. pyramid for reinforcement
+        base_size = 28 if reinforced else 16
+        taper = 35 if reinforced else 5
+        return dict(
+            width=base_size,
+            length=base_size,
+
+            thread_diameter=11.8,
+            thread_diameter_error_margin=0.6,
+            thread_depth=14,
+
+            washer_thickness=0.75,
+            nut_thickness=2.13,
+            margin_after_nut=0.62,
+
+            pyramid_taper=taper
+        )
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        reinforced: bool = True,
+        button_cap: KnobOrCap = CAP_23_75_x_11_9
+    ) -> PartSpec:
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **ButtonSpstPbs24b4Part._threaded_parameters(reinforced))
+
+        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
+        outside_footprint = (dimensions.thread_diameter, dimensions.thread_diameter)
+        outside_footprint_thickness = BUTTON_OUTSIDE_HEIGHT - dimensions.block_thickness - enclosure_wall_thickness
+        if button_cap is not None:
+            outside_footprint = (button_cap.diameter, button_cap.diameter)
+            outside_footprint_thickness = outside_footprint_thickness + (button_cap.thickness - button_cap.inner_depth)
+
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(16, 30.8),
+            inside_footprint_thickness=dimensions.block_thickness + BUTTON_BLOCK_THICKNESS,
+            inside_footprint_offset=(0, -4.8),
+            outside_footprint=outside_footprint,
+            outside_footprint_thickness=outside_footprint_thickness,
+        )
\ No newline at end of file
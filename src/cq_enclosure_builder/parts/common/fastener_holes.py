@@ -0,0 +1,80 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import re
+from typing import Union
+
+import cadquery as cq
+import cq_warehouse.extensions
+from cq_enclosure_builder.detail_level import DetailLevel, resolve_detail_level
+
+# Drop-in replacements for cq_warehouse's threadedHole, insertHole, and clearanceHole, honouring the level of detail
+#   (see detail_level.py). Like them, they cut a hole at each point on the stack of `workplane`.
+#
+# PREVIEW: plain cylinders of the nominal diameter of the fastener (no head recess, no counter-sink).
+# PRINT:   threaded holes without their helical thread (cq_warehouse's `simple` mode); other holes as in FULL.
+# FULL:    cq_warehouse's holes, with helical threads.
+
+
+def threaded_hole(
+    workplane: cq.Workplane,
+    fastener,
+    depth: float,
+    fit: Union[str, None] = None,
+    counter_sunk: bool = True,
+    detail_level: Union[DetailLevel, str, None] = None,
+) -> cq.Workplane:
+    detail_level = resolve_detail_level(detail_level)
+    if detail_level == DetailLevel.PREVIEW:
+        return workplane.hole(nominal_diameter(fastener), depth)
+    return workplane.threadedHole(fastener=fastener, depth=depth, fit=fit, counterSunk=counter_sunk,
+                                  simple=(detail_level == DetailLevel.PRINT))
+
+
+def insert_hole(
+    workplane: cq.Workplane,
+    fastener,
+    depth: Union[float, None] = None,
+    fit: str = "Normal",
+    detail_level: Union[DetailLevel, str, None] = None,
+) -> cq.Workplane:
+    if resolve_detail_level(detail_level) == DetailLevel.PREVIEW:
+        return workplane.hole(getattr(fastener, "nut_diameter", None) or nominal_diameter(fastener), depth)
+    return workplane.insertHole(fastener=fastener, depth=depth, fit=fit)
+
+
+def clearance_hole(
+    workplane: cq.Workplane,
+    fastener,
+    depth: Union[float, None] = None,
+    fit: str = "Normal",
+    counter_sunk: bool = True,
+    detail_level: Union[DetailLevel, str, None] = None,
+) -> cq.Workplane:
+    if resolve_detail_level(detail_level) == DetailLevel.PREVIEW:
+        return workplane.hole(nominal_diameter(fastener), depth)
+    return workplane.clearanceHole(fastener=fastener, depth=depth, fit=fit, counterSunk=counter_sunk)
+
+
+def nominal_diameter(fastener) -> float:
+    """Diameter of the thread of `fastener`, e.g. 3 for "M3-0.5"."""
+    thread_diameter = getattr(fastener, "thread_diameter", None)
+    if thread_diameter:
+        return thread_diameter
+    match = re.match(r"\s*M?(\d+(?:\.\d+)?)", str(fastener.size), re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"Can't find the diameter of fastener size '{fastener.size}'")
+    return float(match.group(1))
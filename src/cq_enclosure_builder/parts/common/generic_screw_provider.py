@@ -14,37 +14,63 @@
    limitations under the License.
 """
 
+from typing import Dict, Tuple, Any, Union
+
+from cq_enclosure_builder.part_cache import register_helper_cache
 from cq_enclosure_builder.parts.common.hole_type import HoleType
 
+# Length of the screws passed to cq_warehouse when digging holes (the depth of the holes is set separately)
+DEFAULT_FASTENER_LENGTH: float = 20
+
 class GenericScrewProvider:
+    # Fasteners built so far, reused by all providers: {(screw class, model name, size reference, length, simple): fastener}
+    #   cq_warehouse only reads them when making holes, so they're never modified, and can be shared.
+    #   Emptied by PartFactory.clear_cache.
+    _fastener_pool: Dict[Tuple[type, str, str, Union[float, None], bool], Any] = {}
+
     @classmethod
-    def build_fastener(cls, screw_class, screw_model_name, screw_size_references, block_sizes, hole_type: HoleType, include_length_param: bool, screw_size_category: str):
+    def get_fastener(cls, screw_class, screw_model_name: str, screw_size_reference: str, length: Union[float, None], simple: bool = True):
+        """
+        Fastener from the pool, built on first use. `length` is None for fasteners without length (e.g. heat-set nuts).
+        `simple` skips the threads of the fastener itself, which aren't needed to make holes.
+        """
+        key = (screw_class, screw_model_name, screw_size_reference, length, simple)
+        fastener = cls._fastener_pool.get(key)
+        if fastener is None:
+            if length is not None:
+                fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name, length=length, simple=simple)
+            else:
+                fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name, simple=simple)
+            fastener = cls._fastener_pool.setdefault(key, fastener)
+        return fastener
+
+    @classmethod
+    def clear_pool(cls) -> None:
+        cls._fastener_pool.clear()
+
+    @classmethod
+    def build_fastener(cls, screw_class, screw_model_name, screw_size_references, block_sizes, hole_type: HoleType, include_length_param: bool, screw_size_category: str,
+                       length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         if screw_size_category not in screw_size_references or screw_size_category not in block_sizes:
             raise ValueError(f"Unknown screw size category '{screw_size_category}'; available: {str(list(screw_size_references))}")
-            
+
         screw_size_reference = screw_size_references[screw_size_category]
-        fastener = None
-        # TODO refactor - need to see more examples of screw constructors
-        if include_length_param:
-            fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name, length=20)
-        else:
-            fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name)
+        fastener = cls.get_fastener(screw_class, screw_model_name, screw_size_reference, length if include_length_param else None, simple)
         block_size = block_sizes[screw_size_category]
     
         return (fastener, block_size, hole_type)
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_class, screw_model_name, screw_size_references, counter_sunk_block_sizes, include_length_param: bool, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_class, screw_model_name, screw_size_references, counter_sunk_block_sizes, include_length_param: bool, screw_size_category: str,
+                                    length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         if screw_size_category not in screw_size_references or screw_size_category not in counter_sunk_block_sizes:
             raise ValueError(f"Unknown screw size category '{screw_size_category}'; available: {str(list(screw_size_references))}")
-            
+
         screw_size_reference = screw_size_references[screw_size_category]
-        cs_fastener = None
-        # TODO refactor - need to see more examples of screw constructors
-        if include_length_param:
-            cs_fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name, length=20)
-        else:
-            cs_fastener = screw_class(size=screw_size_reference, fastener_type=screw_model_name)
+        cs_fastener = cls.get_fastener(screw_class, screw_model_name, screw_size_reference, length if include_length_param else None, simple)
         counter_sunk_block_size = counter_sunk_block_sizes[screw_size_category]
     
-        return (cs_fastener, counter_sunk_block_size)
\ No newline at end of file
+        return (cs_fastener, counter_sunk_block_size)
+
+
+register_helper_cache(GenericScrewProvider.clear_pool)
@@ -18,7 +18,7 @@ from typing import Tuple
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 
 
 class GenericThreadedPart(Part):
@@ -70,23 +70,13 @@ class GenericThreadedPart(Part):
                 .box(base_size, base_size, enclosure_wall_thickness, centered=(True, True, False))
         )
 
-        self.size.length    = base_size
-        self.size.width     = base_size
-        self.size.thickness = enclosure_wall_thickness
+        self.apply_spec(GenericThreadedPart.base_spec(enclosure_wall_thickness, base_size, footprint_specs))
 
         self.part = panel
         self.mask = mask
         self.debug_objects.hole = thread_hole
 
         if footprint_specs is not None:
-            self.inside_footprint = footprint_specs.inside_footprint_size
-            self.inside_footprint_offset = (0, 0)
-            self.inside_footprint_thickness = footprint_specs.inside_footprint_depth
-
-            # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
-            self.outside_footprint = footprint_specs.outside_footprint_size
-            self.outside_footprint_thickness = footprint_specs.outside_footprint_depth
-
             footprint_in = (
                 cq.Workplane("front")
                     .circle(self.inside_footprint[0]/2)
@@ -102,11 +92,55 @@ class GenericThreadedPart(Part):
             self.debug_objects.footprint.inside  = footprint_in
             self.debug_objects.footprint.outside = footprint_out
 
+    @staticmethod
+    def base_spec(enclosure_wall_thickness: float, base_size: float, footprint_specs: FootprintSpecs = None) -> PartSpec:
+        """Spec of the part, for subclasses' `build_spec`."""
+        if footprint_specs is None:
+            return PartSpec((base_size, base_size, enclosure_wall_thickness), None, None, None, None, None)
+        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
+        return PartSpec(
+            size=(base_size, base_size, enclosure_wall_thickness),
+            inside_footprint=footprint_specs.inside_footprint_size,
+            inside_footprint_thickness=footprint_specs.inside_footprint_depth,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=footprint_specs.outside_footprint_size,
+            outside_footprint_thickness=footprint_specs.outside_footprint_depth,
+        )
+
 
 class GenericThreadedWithStopPart(Part):
     """
     Has an additional block that prevents the threaded part from sticking too far outside.
     """
+    class Dimensions:
+        """
+        Sizes derived from the constructor parameters, without building any geometry;
+        used by the constructor, and by the subclasses' `build_spec`.
+        """
+        def __init__(
+            self,
+            enclosure_wall_thickness: float,
+            width: float,
+            length: float,
+            thread_diameter: float,
+            thread_diameter_error_margin: float,
+            thread_depth: float,
+            washer_thickness: float,
+            nut_thickness: float,
+            margin_after_nut: float,
+            **other_parameters
+        ):
+            self.width: float = width
+            self.length: float = length
+            self.thread_diameter: float = thread_diameter + thread_diameter_error_margin
+            self.smaller_side: float = min(width, length)
+            self.nut_depth: float = washer_thickness + nut_thickness + margin_after_nut
+            self.required_distance_to_inner_wall: float = thread_depth - self.nut_depth - 0.01
+            self.block_thickness: float = max(0, self.required_distance_to_inner_wall - enclosure_wall_thickness)
+            self.extrude_block: bool = enclosure_wall_thickness < self.required_distance_to_inner_wall
+            self.actual_wall_thickness: float = enclosure_wall_thickness if self.extrude_block else self.required_distance_to_inner_wall
+            self.size: Tuple[float, float, float] = (width, length, enclosure_wall_thickness + self.block_thickness)
+
     def __init__(
         self,
         enclosure_wall_thickness: float,
@@ -125,7 +159,10 @@ class GenericThreadedWithStopPart(Part):
     ):
         super().__init__()
 
-        thread_diameter = thread_diameter + thread_diameter_error_margin
+        dimensions = GenericThreadedWithStopPart.Dimensions(
+            enclosure_wall_thickness, width, length, thread_diameter, thread_diameter_error_margin,
+            thread_depth, washer_thickness, nut_thickness, margin_after_nut)
+        thread_diameter = dimensions.thread_diameter
 
         self.enclosure_wall_thickness: float = enclosure_wall_thickness
         self.width: float = width
@@ -141,15 +178,14 @@ class GenericThreadedWithStopPart(Part):
         self.dent_size_error_margin: float = dent_size_error_margin
         self.dent_thickness_error_margin: float = dent_thickness_error_margin
 
-        smaller_side = min(width, length)
-        nut_depth = washer_thickness + nut_thickness + margin_after_nut
-        required_distance_to_inner_wall = thread_depth - nut_depth - 0.01
-        block_thickness = max(0, required_distance_to_inner_wall - enclosure_wall_thickness)
+        smaller_side = dimensions.smaller_side
+        required_distance_to_inner_wall = dimensions.required_distance_to_inner_wall
+        block_thickness = dimensions.block_thickness
         self.smaller_side: float = smaller_side
-        self.nut_depth: float = nut_depth
+        self.nut_depth: float = dimensions.nut_depth
         self.block_thickness: float = block_thickness
-        extrude_block = enclosure_wall_thickness < required_distance_to_inner_wall
-        self.actual_wall_thickness = enclosure_wall_thickness if extrude_block else required_distance_to_inner_wall
+        extrude_block = dimensions.extrude_block
+        self.actual_wall_thickness = dimensions.actual_wall_thickness
         board_offset = enclosure_wall_thickness - self.actual_wall_thickness
 
         thread_hole = (
@@ -225,9 +261,7 @@ class GenericThreadedWithStopPart(Part):
                 .box(width, length, enclosure_wall_thickness, centered=(True, True, False))
         )
 
-        self.size.length    = length
-        self.size.width     = width
-        self.size.thickness = enclosure_wall_thickness + block_thickness
+        self.size.width, self.size.length, self.size.thickness = dimensions.size
 
         objects = [panel, mask, thread_hole]
         if extrude_block:
@@ -14,13 +14,20 @@
    limitations under the License.
 """
 
-from typing import Dict, List, Tuple, Union
+import types
+import threading
+import functools
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Any, Callable, Hashable, Union
 from enum import Enum
 
 import cadquery as cq
-import cq_warehouse.extensions
+from cq_enclosure_builder.detail_level import DetailLevel, resolve_detail_level
+from cq_enclosure_builder.part_cache import register_helper_cache
 from cq_enclosure_builder.parts.common.hole_type import HoleType
+from cq_enclosure_builder.parts.common.fastener_holes import threaded_hole, insert_hole, clearance_hole
 from cq_enclosure_builder.parts.common.screws_providers import DefaultScrewProvider
+from cq_enclosure_builder.utils.workplane_utils import moved
 
 class FitOptions(Enum):
     CLOSE = "Close"
@@ -34,12 +41,24 @@ class TaperOptions(Enum):
     Z_TAPER_SIDE = 4
 
 class ScrewBlock:
+    """
+    Builds screw blocks with the given providers; one shortcut per screw size of `screw_provider`,
+    e.g. `ScrewBlock().m3(block_thickness)` for `ScrewBlock().build("m3", block_thickness, enclosure_wall_thickness=2)`.
+    """
+    __slots__ = ("screw_provider", "counter_sunk_screw_provider")
+
     DEFAULT_FIT: FitOptions = FitOptions.LOOSE
     DEFAULT_TAPER: TaperOptions = TaperOptions.NO_TAPER
     DEFAULT_IS_COUNTER_SUNK: bool = False
     DEFAULT_WITH_COUNTER_SUNK_BLOCK: bool = False
     DEFAULT_SCREW_HOLE_DEPTH: Union[float, None] = None  # None -> fully go through. If still going through, read comment for fill_pointy_bit.
 
+    # Blocks built so far, shared by all instances: {(providers, all the arguments of build): result of _build_geometry}
+    #   Least recently used blocks are evicted past GEOMETRY_CACHE_MAX_ENTRIES; emptied by PartFactory.clear_cache
+    GEOMETRY_CACHE_MAX_ENTRIES: int = 256
+    _geometry_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+    _geometry_cache_lock: threading.Lock = threading.Lock()
+
     def __init__(
         self,
         screw_provider=DefaultScrewProvider,
@@ -47,9 +66,58 @@ class ScrewBlock:
     ):
         self.screw_provider = screw_provider
         self.counter_sunk_screw_provider = counter_sunk_screw_provider
-        for size in self.get_available_screw_sizes():
-            method_name = size.replace('.', '_')
-            setattr(self, method_name, self._create_method_for_category(size))
+
+    def __getattr__(self, name: str) -> Callable[..., Dict[str, Any]]:
+        # Only called for attributes not found otherwise, i.e. the size shortcuts
+        if name.startswith("_") or name in ScrewBlock.__slots__:
+            raise AttributeError(name)
+        shortcut = ScrewBlock._size_shortcuts(self.screw_provider).get(name)
+        if shortcut is None:
+            raise AttributeError(f"'ScrewBlock' object has no attribute '{name}'; available sizes: {self.get_available_screw_sizes()}")
+        return types.MethodType(shortcut, self)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(ScrewBlock._size_shortcuts(self.screw_provider)))
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, ScrewBlock)
+                and (self.screw_provider, self.counter_sunk_screw_provider) == (other.screw_provider, other.counter_sunk_screw_provider))
+
+    def __hash__(self) -> int:
+        return hash((self.screw_provider, self.counter_sunk_screw_provider))
+
+    def __repr__(self) -> str:
+        cs_provider = getattr(self.counter_sunk_screw_provider, "__name__", self.counter_sunk_screw_provider)
+        return f"ScrewBlock({self.screw_provider.__name__}, {cs_provider})"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _size_shortcuts(screw_provider) -> Dict[str, Callable[..., Dict[str, Any]]]:
+        """{<size with '.' replaced by '_'>: shortcut}, generated once per provider."""
+        return {
+            size.replace('.', '_'): ScrewBlock._create_method_for_category(size)
+            for size in screw_provider.SCREW_SIZE_REFERENCES.keys()
+        }
+
+    @staticmethod
+    def block_size(screw_provider, screw_size_category: str, block_thickness: float) -> Tuple[float, float, float]:
+        """Size of the block `build` creates with this provider (its "size"), without building any geometry."""
+        if screw_size_category not in screw_provider.BLOCK_SIZES:
+            raise ValueError(f"Unknown screw size category '{screw_size_category}'; available: {str(list(screw_provider.BLOCK_SIZES))}")
+        return (*screw_provider.BLOCK_SIZES[screw_size_category], block_thickness)
+
+    @staticmethod
+    def counter_sunk_block_size(
+        counter_sunk_screw_provider,
+        screw_size_category: str,
+        enclosure_wall_thickness: float,
+        counter_sunk_extrude_depth: float = 0,
+    ) -> Tuple[float, float, float]:
+        """Size of the counter-sunk block `build` creates with this provider, without building any geometry."""
+        sizes = getattr(counter_sunk_screw_provider, "COUNTER_SUNK_BLOCK_SIZES", {})
+        if screw_size_category not in sizes:
+            raise ValueError(f"Unknown counter-sunk screw size category '{screw_size_category}'; available: {str(list(sizes))}")
+        return (*sizes[screw_size_category], enclosure_wall_thickness + counter_sunk_extrude_depth)
 
     def get_available_screw_sizes(self) -> List[str]:
         return list(self.screw_provider.SCREW_SIZE_REFERENCES.keys())
@@ -71,7 +139,88 @@ class ScrewBlock:
         hole_position: Tuple[float, float] = (0, 0),
         counter_sunk_extrude_depth: float = 0,
         counter_sunk_negative_mask_error_margin: float = 0.4,
+        detail_level: Union[DetailLevel, str, None] = None,  # None -> current level; see detail_level.py
     ):
+        """
+        Blocks are memoized: building the same block again (or the same square block with its taper rotated by a multiple of 90°)
+        returns instances of the already built solids, placed with a Location, instead of building the (threaded) hole again.
+        The dict and workplanes returned are new each time, so they can be modified.
+        """
+        quarter_turns = 0
+        if taper == TaperOptions.NO_TAPER:
+            taper_rotation = 0.0  # unused
+        elif taper_rotation % 90 == 0 and self._is_square(screw_size_category, with_counter_sunk_block):
+            # Build the block for a rotation of 0, with the hole rotated the other way, then rotate the whole block
+            quarter_turns = int(taper_rotation // 90) % 4
+            for _ in range(quarter_turns):
+                hole_position = (-hole_position[1], hole_position[0])
+            taper_rotation = 0.0
+
+        arguments = (screw_size_category, block_thickness, enclosure_wall_thickness, screw_hole_depth, fill_pointy_bit,
+                     is_counter_sunk, with_counter_sunk_block, fit, taper, taper_rotation, xy_taper_incline, xy_taper_from,
+                     tuple(hole_position), counter_sunk_extrude_depth, counter_sunk_negative_mask_error_margin,
+                     resolve_detail_level(detail_level))
+        key = (self.screw_provider, self.counter_sunk_screw_provider, arguments)
+        geometry = ScrewBlock._cached_geometry(key)
+        if geometry is None:
+            geometry = self._build_geometry(*arguments)
+            ScrewBlock._cache_geometry(key, geometry)
+
+        location = cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), -90.0 * quarter_turns)
+        return {
+            name: moved(value, location) if isinstance(value, cq.Workplane) else value
+            for name, value in geometry.items()
+        }
+
+    @staticmethod
+    def _cached_geometry(key: Hashable) -> Union[Dict[str, Any], None]:
+        with ScrewBlock._geometry_cache_lock:
+            geometry = ScrewBlock._geometry_cache.get(key)
+            if geometry is not None:
+                ScrewBlock._geometry_cache.move_to_end(key)
+            return geometry
+
+    @staticmethod
+    def _cache_geometry(key: Hashable, geometry: Dict[str, Any]) -> None:
+        with ScrewBlock._geometry_cache_lock:
+            ScrewBlock._geometry_cache[key] = geometry
+            ScrewBlock._geometry_cache.move_to_end(key)
+            while len(ScrewBlock._geometry_cache) > ScrewBlock.GEOMETRY_CACHE_MAX_ENTRIES:
+                ScrewBlock._geometry_cache.popitem(last=False)
+
+    @staticmethod
+    def clear_cache() -> None:
+        with ScrewBlock._geometry_cache_lock:
+            ScrewBlock._geometry_cache.clear()
+
+    def _is_square(self, screw_size_category: str, with_counter_sunk_block: bool) -> bool:
+        try:
+            sizes = [ScrewBlock.block_size(self.screw_provider, screw_size_category, 0)]
+            if with_counter_sunk_block and self.counter_sunk_screw_provider is not None:
+                sizes.append(ScrewBlock.counter_sunk_block_size(self.counter_sunk_screw_provider, screw_size_category, 0))
+        except (ValueError, AttributeError):
+            return False  # let build report it
+        return all(size[0] == size[1] for size in sizes)
+
+    def _build_geometry(
+        self,
+        screw_size_category: str,
+        block_thickness: float,
+        enclosure_wall_thickness: float,
+        screw_hole_depth: Union[float, None],
+        fill_pointy_bit: bool,
+        is_counter_sunk: bool,
+        with_counter_sunk_block: bool,
+        fit: FitOptions,
+        taper: TaperOptions,
+        taper_rotation: float,
+        xy_taper_incline: float,
+        xy_taper_from: float,
+        hole_position: Tuple[float, float],
+        counter_sunk_extrude_depth: float,
+        counter_sunk_negative_mask_error_margin: float,
+        detail_level: DetailLevel,
+    ) -> Dict[str, Any]:
         fastener, block_size, hole_type = self.screw_provider.build_fastener(screw_size_category)
         cs_fastener = cs_block_size = None
         if with_counter_sunk_block and self.counter_sunk_screw_provider is not None:
@@ -90,11 +239,11 @@ class ScrewBlock:
                 .faces(">Z").workplane().pushPoints([hole_position])
         )
         if hole_type == HoleType.THREADED_HOLE:
-            screw_block = screw_block.threadedHole(fastener=fastener, depth=screw_hole_depth, fit=fit.value, counterSunk=is_counter_sunk)
+            screw_block = threaded_hole(screw_block, fastener, screw_hole_depth, fit.value, is_counter_sunk, detail_level)
         elif hole_type == HoleType.INSERT_HOLE:
-            screw_block = screw_block.insertHole(fastener=fastener, depth=screw_hole_depth, fit=fit.value)
+            screw_block = insert_hole(screw_block, fastener, screw_hole_depth, fit.value, detail_level)
         elif hole_type == HoleType.CLEARANCE_HOLE:
-            screw_block = screw_block.clearanceHole(fastener=fastener, depth=screw_hole_depth, fit=fit.value, counterSunk=is_counter_sunk)
+            screw_block = clearance_hole(screw_block, fastener, screw_hole_depth, fit.value, is_counter_sunk, detail_level)
 
         if fill_pointy_bit and screw_hole_depth != block_thickness:  # if the goal wasn't to pierce through the entire block
             # With threadedHole, cq_warehouse digs deeper than screw_hole_depth to make space for the 'pointy tip' of the screw,
@@ -149,7 +298,9 @@ class ScrewBlock:
                     cq.Workplane("XY")
                         .box(*cs_block_size, enclosure_wall_thickness + counter_sunk_extrude_depth, centered=(True, True, False))
                         .faces(">Z").workplane().pushPoints([(0, 0)])
-                        .clearanceHole(fastener=cs_fastener, depth=enclosure_wall_thickness + counter_sunk_extrude_depth, fit=fit.value, counterSunk=True)
+                )
+                cs_block = (
+                    clearance_hole(cs_block, cs_fastener, enclosure_wall_thickness + counter_sunk_extrude_depth, fit.value, True, detail_level)
                         .translate([*hole_position, block_thickness - counter_sunk_extrude_depth])
                 )
                 cs_mask = (
@@ -181,32 +332,13 @@ class ScrewBlock:
             "size": block_size
         }
 
-    def _create_method_for_category(self, screw_size_category):
-        def method(
-            block_thickness: float,
-            enclosure_wall_thickness: float = 2,
-            screw_hole_depth: Union[int, None] = ScrewBlock.DEFAULT_SCREW_HOLE_DEPTH,
-            fill_pointy_bit: bool = False,  # read comment where used
-            is_counter_sunk: bool = ScrewBlock.DEFAULT_IS_COUNTER_SUNK,
-            with_counter_sunk_block: bool = ScrewBlock.DEFAULT_WITH_COUNTER_SUNK_BLOCK,
-            fit: FitOptions = ScrewBlock.DEFAULT_FIT,
-            taper: TaperOptions = ScrewBlock.DEFAULT_TAPER,
-            taper_rotation: float = 0.0,
-            xy_taper_incline: float = 0.75,
-            xy_taper_from: float = 0  # useful to start your screw inside of a wall
-        ):
-            return self.build(
-                screw_size_category,
-                block_thickness,
-                enclosure_wall_thickness,
-                screw_hole_depth,
-                fill_pointy_bit,
-                is_counter_sunk,
-                with_counter_sunk_block,
-                fit,
-                taper,
-                taper_rotation,
-                xy_taper_incline,
-                xy_taper_from
-            )
-        return method
\ No newline at end of file
+    @staticmethod
+    def _create_method_for_category(screw_size_category: str) -> Callable[..., Dict[str, Any]]:
+        def method(self, block_thickness: float, enclosure_wall_thickness: float = 2, *args, **kwargs) -> Dict[str, Any]:
+            """Same as `build`, for this screw size (any other option of `build` can be passed)."""
+            return self.build(screw_size_category, block_thickness, enclosure_wall_thickness, *args, **kwargs)
+        method.__name__ = screw_size_category.replace('.', '_')
+        return method
+
+
+register_helper_cache(ScrewBlock.clear_cache)
@@ -0,0 +1,100 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from typing import Dict, List, Tuple, Any, Iterable, Union
+from typing_extensions import Self
+
+import cadquery as cq
+from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
+from cq_enclosure_builder.utils.workplane_utils import instances
+
+# Result of ScrewBlock.build -> keys of ScrewPattern.build
+PATTERN_KEYS: Dict[str, str] = {
+    "block": "blocks",
+    "mask": "masks",
+    "counter_sunk_block": "counter_sunk_blocks",
+    "counter_sunk_mask": "counter_sunk_masks",
+}
+
+
+class ScrewPattern:
+    """
+    The same screw block at several positions (and rotations around Z), e.g. the four screws of a holder.
+
+    The block is built once (see ScrewBlock.build), then placed as instances: `build` returns one compound of all the
+    blocks, and one of all the masks, ready to be added to or cut from a board at once.
+
+        pattern = ScrewPattern(ScrewBlock(), "m2.5", block_thickness=4, enclosure_wall_thickness=2)
+        pattern.add_all([(-29, 24.5, 2), (29, 24.5, 2), (29, -24.5, 2), (-29, -24.5, 2)])
+        board = board.add(pattern.build()["blocks"])
+    """
+
+    def __init__(
+        self,
+        screw_block: ScrewBlock,
+        screw_size_category: str,
+        block_thickness: float,
+        enclosure_wall_thickness: float = 2,
+        **build_options: Any,  # any other option of ScrewBlock.build, e.g. taper or detail_level
+    ):
+        self.screw_block = screw_block
+        self.screw_size_category = screw_size_category
+        self.block_thickness = block_thickness
+        self.enclosure_wall_thickness = enclosure_wall_thickness
+        self.build_options = build_options
+        self.locations: List[cq.Location] = []
+
+    def add(self, pos: Union[Tuple[float, float], Tuple[float, float, float]], rotation: float = 0.0) -> Self:
+        """Add a block at `pos` (x, y, and optionally z), rotated by `rotation` degrees around its vertical axis."""
+        x, y, z = (*pos, 0)[:3]
+        self.locations.append(cq.Location(cq.Vector(x, y, z), cq.Vector(0, 0, 1), rotation))
+        return self
+
+    def add_all(self, positions: Iterable[Union[Tuple[float, float], Tuple[float, float, float]]], rotation: float = 0.0) -> Self:
+        for pos in positions:
+            self.add(pos, rotation)
+        return self
+
+    def build(self) -> Dict[str, Any]:
+        """
+        {"blocks", "masks", "counter_sunk_blocks", "counter_sunk_masks"}: a compound of all the placed blocks (or masks);
+        the counter-sunk ones are None without counter-sunk block. "size" is the size of one block (None without any block).
+        """
+        return ScrewPattern.build_all([self])
+
+    @staticmethod
+    def build_all(patterns: List["ScrewPattern"]) -> Dict[str, Any]:
+        """Same as `build`, with the blocks of all `patterns` in the same compounds (e.g. tapered and non-tapered blocks)."""
+        shapes: Dict[str, List[cq.Shape]] = {key: [] for key in PATTERN_KEYS.values()}
+        present = {"blocks", "masks"}  # possibly empty; the counter-sunk ones are None unless a pattern has some
+        size = None
+        for pattern in patterns:
+            if len(pattern.locations) == 0:
+                continue
+            screw = pattern.screw_block.build(
+                pattern.screw_size_category, pattern.block_thickness, pattern.enclosure_wall_thickness, **pattern.build_options)
+            size = size or screw["size"]
+            for block_key, pattern_key in PATTERN_KEYS.items():
+                if screw[block_key] is not None:
+                    shapes[pattern_key].extend(instances(screw[block_key], pattern.locations))
+                    present.add(pattern_key)
+
+        result: Dict[str, Any] = {
+            key: cq.Compound.makeCompound(placed) if key in present else None
+            for key, placed in shapes.items()
+        }
+        result["size"] = size
+        return result
@@ -18,7 +18,7 @@ from typing import Dict, Tuple
 
 from cq_warehouse.fastener import HeatSetNut
 from cq_enclosure_builder.screws.flat_head_screw import FlatHeadScrew
-from cq_enclosure_builder.parts.common.generic_screw_provider import GenericScrewProvider
+from cq_enclosure_builder.parts.common.generic_screw_provider import GenericScrewProvider, DEFAULT_FASTENER_LENGTH
 from cq_enclosure_builder.parts.common.hole_type import HoleType
 
 
@@ -60,7 +60,7 @@ class DefaultScrewProvider:
     INCLUDE_LENGTH_PARAM: bool = True
 
     @classmethod
-    def build_fastener(cls, screw_size_category: str):
+    def build_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
@@ -68,18 +68,22 @@ class DefaultScrewProvider:
             cls.BLOCK_SIZES,
             cls.HOLE_TYPE,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_counter_sunk_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
             cls.SCREW_SIZE_REFERENCES,
             cls.COUNTER_SUNK_BLOCK_SIZES,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
 
@@ -117,7 +121,7 @@ class LargeBlockFlatHeadScrewProvider:
     INCLUDE_LENGTH_PARAM: bool = True
 
     @classmethod
-    def build_fastener(cls, screw_size_category: str):
+    def build_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
@@ -125,18 +129,22 @@ class LargeBlockFlatHeadScrewProvider:
             cls.BLOCK_SIZES,
             cls.HOLE_TYPE,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_counter_sunk_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
             cls.SCREW_SIZE_REFERENCES,
             cls.COUNTER_SUNK_BLOCK_SIZES,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
 
@@ -174,7 +182,7 @@ class TinyBlockFlatHeadScrewProvider:
     INCLUDE_LENGTH_PARAM: bool = True
 
     @classmethod
-    def build_fastener(cls, screw_size_category: str):
+    def build_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
@@ -182,18 +190,22 @@ class TinyBlockFlatHeadScrewProvider:
             cls.BLOCK_SIZES,
             cls.HOLE_TYPE,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_counter_sunk_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
             cls.SCREW_SIZE_REFERENCES,
             cls.COUNTER_SUNK_BLOCK_SIZES,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
 
@@ -220,7 +232,7 @@ class DefaultHeatSetScrewProvider:
     INCLUDE_LENGTH_PARAM: bool = False
 
     @classmethod
-    def build_fastener(cls, screw_size_category: str):
+    def build_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
@@ -228,11 +240,13 @@ class DefaultHeatSetScrewProvider:
             cls.BLOCK_SIZES,
             cls.HOLE_TYPE,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         raise ValueError("Counter-sunk fastener cannot be a HeadSetScrew")
 
 
@@ -259,7 +273,7 @@ class LargeBlockHeatSetScrewProvider:
     INCLUDE_LENGTH_PARAM: bool = False
 
     @classmethod
-    def build_fastener(cls, screw_size_category: str):
+    def build_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         return GenericScrewProvider.build_fastener(
             cls.SCREW_CLASS,
             cls.SCREW_MODEL_NAME,
@@ -267,9 +281,11 @@ class LargeBlockHeatSetScrewProvider:
             cls.BLOCK_SIZES,
             cls.HOLE_TYPE,
             cls.INCLUDE_LENGTH_PARAM,
-            screw_size_category
+            screw_size_category,
+            length,
+            simple
         )
 
     @classmethod
-    def build_counter_sunk_fastener(cls, screw_size_category: str):
+    def build_counter_sunk_fastener(cls, screw_size_category: str, length: float = DEFAULT_FASTENER_LENGTH, simple: bool = True):
         raise ValueError("Counter-sunk fastener cannot be a HeadSetScrew")
@@ -14,12 +14,18 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.knobs_and_caps import KnobOrCap, KNOB_16_4_x_14_8
 
+ENCODER_BLOCK_THICKNESS = 11.5
+ENCODER_OUTSIDE_HEIGHT = 30
+
 
 @register_part("encoder", "EC11")
 class EncoderEc11Part(GenericThreadedWithStopPart):
@@ -34,38 +40,10 @@ class EncoderEc11Part(GenericThreadedWithStopPart):
         enclosure_wall_thickness: float,
         encoder_knob: KnobOrCap = KNOB_16_4_x_14_8
     ):
-        thread_diameter = 6.8
-        super().__init__(
-            enclosure_wall_thickness,
-
-            width=12.05,
-            length=15,
-
-            thread_diameter=thread_diameter,
-            thread_diameter_error_margin=0.6,
-            thread_depth=6.5,
-
-            washer_thickness=0.36,
-            nut_thickness=2.28,
-            margin_after_nut=0.96,
+        super().__init__(enclosure_wall_thickness, **EncoderEc11Part._threaded_parameters())
+        self.apply_spec(EncoderEc11Part.build_spec(enclosure_wall_thickness, encoder_knob))
 
-            pyramid_taper=65,
-
-            dents_specs=[
-                ( (2, 0.8, 1), (0, -(2.7 + thread_diameter/2)) )
-            ],
-            dent_size_error_margin=0.6,
-            dent_thickness_error_margin=0.4
-        )
-
-        encoder_block_thickness = 11.5
-        self.inside_footprint = (self.width + 2, self.length + 2)
-        self.inside_footprint_offset = (0, 0)
-        self.inside_footprint_thickness = self.block_thickness + encoder_block_thickness
-
-        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
-        self.outside_footprint = (self.thread_diameter, self.thread_diameter)
-        self.outside_footprint_thickness = 30 - self.block_thickness - enclosure_wall_thickness  # updated later if encoder_knob is not None
+        encoder_outside_thickness = ENCODER_OUTSIDE_HEIGHT - self.block_thickness - enclosure_wall_thickness
 
         footprint_in = (
             cq.Workplane("front")
@@ -75,26 +53,71 @@ class EncoderEc11Part(GenericThreadedWithStopPart):
         footprint_out = (
             cq.Workplane("front")
                 .circle(self.thread_diameter/2)
-                .extrude(self.outside_footprint_thickness)
+                .extrude(encoder_outside_thickness)
                 .translate([0, 0, enclosure_wall_thickness])
         )
 
         if encoder_knob is not None:
-            self.outside_footprint = (encoder_knob.diameter, encoder_knob.diameter)
             knob_wp = (
                 cq.Workplane("front")
                     .circle(encoder_knob.diameter/2)
                     .extrude(encoder_knob.thickness)
                     .translate([0, 0, enclosure_wall_thickness])
-                    .translate([0, 0, self.outside_footprint_thickness - encoder_knob.inner_depth])
+                    .translate([0, 0, encoder_outside_thickness - encoder_knob.inner_depth])
             )
             if encoder_knob.fillet > 0:
                 knob_wp = knob_wp.edges("front").fillet(encoder_knob.fillet)
             footprint_out = footprint_out.add(knob_wp)
-            self.outside_footprint_thickness = self.outside_footprint_thickness + (encoder_knob.thickness - encoder_knob.inner_depth)
 
         footprint_in = self.mirror_and_translate(footprint_in)
         footprint_out = self.mirror_and_translate(footprint_out)
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def _threaded_parameters() -> Dict[str, Any]:
+        thread_diameter = 6.8
+        return dict(
+            width=12.05,
+            length=15,
+
+            thread_diameter=thread_diameter,
+            thread_diameter_error_margin=0.6,
+            thread_depth=6.5,
+
+            washer_thickness=0.36,
+            nut_thickness=2.28,
+            margin_after_nut=0.96,
+
+            pyramid_taper=65,
+
+            dents_specs=[
+                ( (2, 0.8, 1), (0, -(2.7 + thread_diameter/2)) )
+            ],
+            dent_size_error_margin=0.6,
+            dent_thickness_error_margin=0.4
+        )
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        encoder_knob: KnobOrCap = KNOB_16_4_x_14_8
+    ) -> PartSpec:
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **EncoderEc11Part._threaded_parameters())
+
+        # TODO we want to add the nut [and washer], as well as in the debug object (esp. important if no cap)
+        outside_footprint = (dimensions.thread_diameter, dimensions.thread_diameter)
+        outside_footprint_thickness = ENCODER_OUTSIDE_HEIGHT - dimensions.block_thickness - enclosure_wall_thickness
+        if encoder_knob is not None:
+            outside_footprint = (encoder_knob.diameter, encoder_knob.diameter)
+            outside_footprint_thickness = outside_footprint_thickness + (encoder_knob.thickness - encoder_knob.inner_depth)
+
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(dimensions.width + 2, dimensions.length + 2),
+            inside_footprint_thickness=dimensions.block_thickness + ENCODER_BLOCK_THICKNESS,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=outside_footprint,
+            outside_footprint_thickness=outside_footprint_thickness,
+        )
\ No newline at end of file
@@ -19,6 +19,7 @@ import cadquery as cq
 
 from cq_enclosure_builder.part import Part
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
+from cq_enclosure_builder.utils.workplane_utils import instances
 
 
 USE_DEFAULT_SCREW_BLOCK_PROVIDER = None  # alias for readability
@@ -67,14 +68,14 @@ class AbstractHolderPart(Part):
 
     # Base board and mask with screws and supports, centered on 0,0
     def build_base_board_and_mask(self, board_size):
-        screw_blocks_a = self.get_screw_blocks()
+        screw_blocks = self.get_screw_blocks()
         supports_a = self.get_support_blocks()
 
         part = (
             cq.Workplane("front")
                 .box(*board_size, centered=(True, True, False))
 
-                .add(screw_blocks_a.toCompound())
+                .add(screw_blocks)
                 .add(supports_a.toCompound())
         )
         mask = (
@@ -129,28 +130,21 @@ class AbstractHolderPart(Part):
         self.debug_objects.footprint.outside = None
 
 
-    def get_screw_blocks(self):
-        default_screw_block = None  # lazy loaded
-        screw_block = None
-
-        screw_blocks_a = cq.Assembly()
+    def get_screw_blocks(self) -> cq.Compound:
+        # Each screw block is built once, then placed as instances at all the positions using it (as with ScrewPattern)
+        locations_per_provider = {}
+        offset = self.screws_pos_offset
         for screw_specs in self.screws_specs:
             pos, provider = screw_specs
+            location = cq.Location(cq.Vector(pos[0] + offset[0], pos[1] + offset[1], self.enclosure_wall_thickness + offset[2]))
+            locations_per_provider.setdefault(provider, []).append(location)
 
-            if provider is None:
-                if default_screw_block is None:
-                    default_screw_block = self.default_screw_block_provider(self)
-                screw_block = default_screw_block
-            else:
-                screw_block = provider(self)
-
-            screw_blocks_a.add(
-                screw_block
-                    .translate([*pos, self.enclosure_wall_thickness])
-                    .translate(self.screws_pos_offset)
-            )
+        screw_blocks = []
+        for provider, locations in locations_per_provider.items():
+            screw_block = self.default_screw_block_provider(self) if provider is None else provider(self)
+            screw_blocks.extend(instances(screw_block, locations))
 
-        return screw_blocks_a
+        return cq.Compound.makeCompound(screw_blocks)
 
 
     def get_support_blocks(self):
@@ -17,10 +17,16 @@
 import os
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
+from cq_enclosure_builder.parts.common.screw_pattern import ScrewPattern
+from cq_enclosure_builder.parts.common.screws_providers import DefaultScrewProvider
 from cq_enclosure_builder.parts_factory import register_part
 
+DISTANCE_BETWEEN_SCREWS_X = 58
+DISTANCE_BETWEEN_SCREWS_Y = 49
+MODEL_THICKNESS = 20.1 - 1.8
+
 # TODO use AbstractHolderPart
 @register_part("holder", "RPi_4B")
 class Pi4HolderPart(Part):
@@ -35,8 +41,8 @@ class Pi4HolderPart(Part):
     ):
         super().__init__()
 
-        distance_between_screws_x = 58
-        distance_between_screws_y = 49
+        distance_between_screws_x = DISTANCE_BETWEEN_SCREWS_X
+        distance_between_screws_y = DISTANCE_BETWEEN_SCREWS_Y
         half_dist_x = distance_between_screws_x/2
         half_dist_y = distance_between_screws_y/2
 
@@ -47,21 +53,21 @@ class Pi4HolderPart(Part):
             (-half_dist_x, -half_dist_y, 0),  # BL
         ]
 
-        screw_part: Part = ScrewBlock().m2_5(screw_block_thickness, enclosure_wall_thickness)
-        screw = screw_part["block"].translate([0, 0, enclosure_wall_thickness])
-        screw_size = screw_part["size"]
-
-        board_width = distance_between_screws_x + screw_size[0]
-        board_length = distance_between_screws_y + screw_size[1]
+        screws = (
+            ScrewPattern(ScrewBlock(), "m2.5", screw_block_thickness, enclosure_wall_thickness)
+                .add_all([(x, y, z + enclosure_wall_thickness) for x, y, z in screws_pos])
+                .build()["blocks"]
+        )
+        screw_size = ScrewBlock.block_size(DefaultScrewProvider, "m2.5", screw_block_thickness)
 
-        screws_a = cq.Assembly()
-        for screw_pos in screws_pos:
-            screws_a.add(screw.translate(screw_pos))
+        self.apply_spec(Pi4HolderPart.build_spec(enclosure_wall_thickness, screw_block_thickness, add_model_to_footprint))
+        board_width = self.size.width
+        board_length = self.size.length
 
         board = (
             cq.Workplane("front")
                 .box(board_width, board_length, enclosure_wall_thickness, centered=(True, True, False))
-                .add(screws_a.toCompound())
+                .add(screws)
         )
         mask = (
             cq.Workplane("front")
@@ -71,18 +77,7 @@ class Pi4HolderPart(Part):
         self.part = board
         self.mask = mask
 
-        self.size.width     = board_width
-        self.size.length    = board_length
-        self.size.thickness = enclosure_wall_thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = screw_block_thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 0
-
-        footprint_in = screws_a.toCompound()
+        footprint_in = screws
         if add_model_to_footprint:
             step_dir = "../src/cq_enclosure_builder/parts/holder"
             try: step_dir = os.path.dirname(__file__)   # regular launch
@@ -95,8 +90,30 @@ class Pi4HolderPart(Part):
                     .translate([-(board_width/2), -(board_length/2), enclosure_wall_thickness + screw_block_thickness])
                     .translate([screw_size[0]/2, screw_size[1]/2, 0])
             )
-            footprint_in = pi_footprint.add(screws_a.toCompound())
-            self.inside_footprint_thickness = screw_block_thickness + 20.1 - 1.8
+            footprint_in = pi_footprint.add(screws)
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = None
\ No newline at end of file
+        self.debug_objects.footprint.outside = None
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness,
+        screw_block_thickness = 4,
+        add_model_to_footprint = True,
+    ) -> PartSpec:
+        screw_size = ScrewBlock.block_size(DefaultScrewProvider, "m2.5", screw_block_thickness)
+        board_width = DISTANCE_BETWEEN_SCREWS_X + screw_size[0]
+        board_length = DISTANCE_BETWEEN_SCREWS_Y + screw_size[1]
+
+        inside_footprint_thickness = screw_block_thickness
+        if add_model_to_footprint:
+            inside_footprint_thickness = screw_block_thickness + MODEL_THICKNESS
+
+        return PartSpec(
+            size=(board_width, board_length, enclosure_wall_thickness),
+            inside_footprint=(board_width, board_length),
+            inside_footprint_thickness=inside_footprint_thickness,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(board_width, board_length),
+            outside_footprint_thickness=0,
+        )
\ No newline at end of file
@@ -14,12 +14,13 @@
    limitations under the License.
 """
 
-from typing import List
+from typing import List, Tuple
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
+from cq_enclosure_builder.parts.common.screw_pattern import ScrewPattern
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.screws_providers import TinyBlockFlatHeadScrewProvider
 
@@ -47,37 +48,20 @@ class ProtoboardHolderPart(Part):
         base_board_size = (holes_count_x * hole_distance, holes_count_y * hole_distance)
 
         if screws_pos is None:
-            screws_pos = [
-                (0, 0),
-                (holes_count_x-1, 0),
-                (0, holes_count_y-1),
-                (holes_count_x-1, holes_count_y-1)
-            ]
-
-        screw_part: Part = ScrewBlock(screw_provider=screw_provider).m2_5(screw_block_thickness, enclosure_wall_thickness)
-        screw = screw_part["block"].translate([0, 0, enclosure_wall_thickness])
-        screw_size = screw_part["size"]
-
-        screws_a = cq.Assembly()
-        screws_workplanes: List[cq.Workplane] = [] 
-        min_pos = [9999, 9999]
-        max_pos = [-9999, -9999]
-        for screw_pos in screws_pos:
-            pos_x = screw_pos[0]*hole_distance + hole_distance/2 - base_board_size[0]/2
-            pos_y = screw_pos[1]*hole_distance + hole_distance/2 - base_board_size[1]/2
-
-            if pos_x - screw_size[0]/2 < min_pos[0]: min_pos[0] = pos_x - screw_size[0]/2
-            elif pos_x + screw_size[0]/2 > max_pos[0]: max_pos[0] = pos_x + screw_size[0]/2
-            if pos_y - screw_size[1]/2 < min_pos[1]: min_pos[1] = pos_y - screw_size[1]/2
-            elif pos_y + screw_size[1]/2 > max_pos[1]: max_pos[1] = pos_y + screw_size[1]/2
-
-            translated_screw = screw.translate([pos_x, pos_y, 0])
-            screws_workplanes.append(translated_screw)
-            screws_a.add(translated_screw)
-
-        self.size.width     = max(base_board_size[0], abs(min_pos[0]) + abs(max_pos[0]))
-        self.size.length    = max(base_board_size[1], abs(min_pos[1]) + abs(max_pos[1]))
-        self.size.thickness = enclosure_wall_thickness
+            screws_pos = ProtoboardHolderPart._default_screws_pos(holes_count_x, holes_count_y)
+
+        self.apply_spec(ProtoboardHolderPart.build_spec(
+            enclosure_wall_thickness, screw_block_thickness, holes_count_x, holes_count_y, screws_pos,
+            screw_provider, hole_distance, board_thickness, add_board_to_footprint))
+
+        screws = (
+            ScrewPattern(ScrewBlock(screw_provider=screw_provider), "m2.5", screw_block_thickness, enclosure_wall_thickness)
+                .add_all([
+                    (pos_x, pos_y, enclosure_wall_thickness)
+                    for pos_x, pos_y in ProtoboardHolderPart._screws_positions(screws_pos, hole_distance, base_board_size)
+                ])
+                .build()["blocks"]
+        )
 
         self.part = (
             cq.Workplane("front")
@@ -88,18 +72,10 @@ class ProtoboardHolderPart(Part):
                 .box(self.size.width, self.size.length, self.size.thickness, centered=(True, True, False))
         )
 
-        for wp in screws_workplanes:
-            # Only used to have separate objects in the tree, TODO refactor
-            self.part.add(wp)
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = screw_block_thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 0
+        # One object per screw, only used to have separate objects in the tree, TODO refactor
+        self.part.add(list(screws))
 
-        footprint_in = screws_a.toCompound()
+        footprint_in = screws
         if add_board_to_footprint:
             protoboard = (
                 cq.Workplane("front")
@@ -107,8 +83,68 @@ class ProtoboardHolderPart(Part):
                     .extrude(board_thickness)
                     .translate([0, 0, enclosure_wall_thickness + screw_block_thickness])
             )
-            footprint_in = protoboard.add(screws_a.toCompound())
-            self.inside_footprint_thickness = screw_block_thickness + board_thickness
+            footprint_in = protoboard.add(screws)
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = None
\ No newline at end of file
+        self.debug_objects.footprint.outside = None
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness,
+        screw_block_thickness = 4,
+        holes_count_x = 10,
+        holes_count_y = 8,
+        screws_pos = None,
+        screw_provider = TinyBlockFlatHeadScrewProvider,
+        hole_distance = HOLE_DISTANCE,
+        board_thickness = 2,
+        add_board_to_footprint = True,
+    ) -> PartSpec:
+        base_board_size = (holes_count_x * hole_distance, holes_count_y * hole_distance)
+        if screws_pos is None:
+            screws_pos = ProtoboardHolderPart._default_screws_pos(holes_count_x, holes_count_y)
+        screw_size = ScrewBlock.block_size(screw_provider, "m2.5", screw_block_thickness)
+
+        min_pos = [9999, 9999]
+        max_pos = [-9999, -9999]
+        for pos_x, pos_y in ProtoboardHolderPart._screws_positions(screws_pos, hole_distance, base_board_size):
+            if pos_x - screw_size[0]/2 < min_pos[0]: min_pos[0] = pos_x - screw_size[0]/2
+            elif pos_x + screw_size[0]/2 > max_pos[0]: max_pos[0] = pos_x + screw_size[0]/2
+            if pos_y - screw_size[1]/2 < min_pos[1]: min_pos[1] = pos_y - screw_size[1]/2
+            elif pos_y + screw_size[1]/2 > max_pos[1]: max_pos[1] = pos_y + screw_size[1]/2
+
+        width = max(base_board_size[0], abs(min_pos[0]) + abs(max_pos[0]))
+        length = max(base_board_size[1], abs(min_pos[1]) + abs(max_pos[1]))
+
+        inside_footprint_thickness = screw_block_thickness
+        if add_board_to_footprint:
+            inside_footprint_thickness = screw_block_thickness + board_thickness
+
+        return PartSpec(
+            size=(width, length, enclosure_wall_thickness),
+            inside_footprint=(width, length),
+            inside_footprint_thickness=inside_footprint_thickness,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(width, length),
+            outside_footprint_thickness=0,
+        )
+
+    @staticmethod
+    def _default_screws_pos(holes_count_x, holes_count_y) -> List[Tuple[int, int]]:
+        # One per corner
+        return [
+            (0, 0),
+            (holes_count_x-1, 0),
+            (0, holes_count_y-1),
+            (holes_count_x-1, holes_count_y-1)
+        ]
+
+    @staticmethod
+    def _screws_positions(screws_pos, hole_distance, base_board_size) -> List[Tuple[float, float]]:
+        return [
+            (
+                screw_pos[0]*hole_distance + hole_distance/2 - base_board_size[0]/2,
+                screw_pos[1]*hole_distance + hole_distance/2 - base_board_size[1]/2
+            )
+            for screw_pos in screws_pos
+        ]
\ No newline at end of file
@@ -14,7 +14,10 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 
@@ -31,9 +34,26 @@ class Jack6_35mmPj612aPart(GenericThreadedWithStopPart):
         self,
         enclosure_wall_thickness: float
     ):
-        super().__init__(
-            enclosure_wall_thickness,
+        super().__init__(enclosure_wall_thickness, **Jack6_35mmPj612aPart._threaded_parameters())
+        self.apply_spec(Jack6_35mmPj612aPart.build_spec(enclosure_wall_thickness))
+
+        footprint_in = (
+            cq.Workplane("front")
+                .box(self.size.width, self.size.length, self.inside_footprint_thickness, centered=(True, True, False))
+                .translate([0, 0, enclosure_wall_thickness])
+        )
+        footprint_out = (
+            cq.Workplane("front")
+                .circle(self.outside_footprint[0]/2)
+                .extrude(self.outside_footprint_thickness)
+                .translate([0, 0, -self.outside_footprint_thickness])
+        )
+        self.debug_objects.footprint.inside  = footprint_in
+        self.debug_objects.footprint.outside = footprint_out
 
+    @staticmethod
+    def _threaded_parameters() -> Dict[str, Any]:
+        return dict(
             width=16,
             length=16,
 
@@ -47,27 +67,18 @@ class Jack6_35mmPj612aPart(GenericThreadedWithStopPart):
 
             pyramid_taper=40
         )
-        
-        jack_diameter_with_nut = self.thread_diameter + 3
 
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = 20
-        self.inside_footprint_offset = (0, 0)
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **Jack6_35mmPj612aPart._threaded_parameters())
+        jack_diameter_with_nut = dimensions.thread_diameter + 3
 
         # TODO we want to add the nut [and washer], as well as in the debug object
-        self.outside_footprint = (jack_diameter_with_nut, jack_diameter_with_nut)
-        self.outside_footprint_thickness = self.nut_depth
-
-        footprint_in = (
-            cq.Workplane("front")
-                .box(self.size.width, self.size.length, self.inside_footprint_thickness, centered=(True, True, False))
-                .translate([0, 0, enclosure_wall_thickness])
-        )
-        footprint_out = (
-            cq.Workplane("front")
-                .circle(jack_diameter_with_nut/2)
-                .extrude(self.outside_footprint_thickness)
-                .translate([0, 0, -self.outside_footprint_thickness])
-        )
-        self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(dimensions.width, dimensions.length),
+            inside_footprint_thickness=20,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(jack_diameter_with_nut, jack_diameter_with_nut),
+            outside_footprint_thickness=dimensions.nut_depth,
+        )
\ No newline at end of file
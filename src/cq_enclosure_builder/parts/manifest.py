@@ -0,0 +1,85 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from typing import Dict
+
+# Categories and part types shipped with cq_enclosure_builder, and the module registering each of them.
+#
+# PartFactory knows about these parts without importing anything; the module of a part is only imported
+#   the first time the part is built (or its parameters listed). Keep it in sync when adding a part:
+#   building a part whose module doesn't register it raises an error.
+_PREFIX = "cq_enclosure_builder.parts"
+
+PARTS_MANIFEST: Dict[str, Dict[str, str]] = {
+    "jack": {
+        "6.35mm PJ-612A": f"{_PREFIX}.jack.jack_6_35mm_pj612a",
+        "3.5mm PJ-392": f"{_PREFIX}.jack.jack_3_5mm_pj392",
+        "6.35mm ACJS-MV-5": f"{_PREFIX}.jack.jack_6_35mm_acjsmv5",
+    },
+    "button": {
+        "SPST PBS-24B-4": f"{_PREFIX}.button.spst_pbs_24b_4",
+        "DPDT PBS-24-212SP": f"{_PREFIX}.button.dpdt_pbs_24_212sp",
+        "PBS-11A": f"{_PREFIX}.button.button_pbs_11a",
+        "PBS-110": f"{_PREFIX}.button.button_pbs_110",
+    },
+    "encoder": {
+        "EC11": f"{_PREFIX}.encoder.encoder_ec11",
+    },
+    "potentiometer": {
+        "WH148": f"{_PREFIX}.potentiometer.potentiometer_wh148",
+        "PSM60_Ctrl": f"{_PREFIX}.potentiometer.motorized_fader_psm60_ctrl",
+    },
+    "usb_a": {
+        "3.0 vertical cltgxdd": f"{_PREFIX}.usb_a.usb_a_30_vertical_cltgxdd",
+    },
+    "usb_c": {
+        "ChengHaoRan E": f"{_PREFIX}.usb_c.usb_c_chenghaoran_e",
+    },
+    "screen": {
+        "HDMI 5 inch JRP5015": f"{_PREFIX}.screen.hdmi_5inch_jrp5015",
+        "DSI 5 inch CFsunbird": f"{_PREFIX}.screen.dsi_5inch_CFsunbird",
+        "DSI_5inch_800x480_Waveshare": f"{_PREFIX}.screen.dsi_5Inch_800x480_waveshare",
+    },
+    "air_vent": {
+        "basic rectangular": f"{_PREFIX}.air_vent.rect_air_vent_part",
+    },
+    "banana": {
+        "4mm": f"{_PREFIX}.banana.banana_4mm",
+    },
+    "barrel_plug": {
+        "DC-022B": f"{_PREFIX}.barrel_plug.barrel_plug_dc022b",
+    },
+    "rca": {
+        "N1030": f"{_PREFIX}.rca.rca_n1030",
+    },
+    "support": {
+        "pyramid": f"{_PREFIX}.support.pyramid_support",
+        "skirt": f"{_PREFIX}.support.skirt",
+    },
+    "toggle": {
+        "MTS-103": f"{_PREFIX}.toggle.toggle_mts103",
+    },
+    "midi": {
+        "SD-50SN": f"{_PREFIX}.midi.midi_sd_50sn",
+    },
+    "holder": {
+        "RPi_4B": f"{_PREFIX}.holder.pi4_holder",
+        "Protoboard": f"{_PREFIX}.holder.protoboard_holder",
+    },
+    "text": {
+        "default": f"{_PREFIX}.text.default_text",
+    },
+}
@@ -16,9 +16,12 @@
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 
+WIDTH = 19.2
+LENGTH = 28.4
+
 
 @register_part("midi", "SD-50SN")
 class MidiSd50SnPart(Part):
@@ -35,8 +38,8 @@ class MidiSd50SnPart(Part):
     ):
         super().__init__()
 
-        width = 19.2
-        length = 28.4
+        width = WIDTH
+        length = LENGTH
 
         hole_diameter = 15.1 + 0.5
         screw_holes_diameter = 2.9 + 0.3
@@ -63,16 +66,7 @@ class MidiSd50SnPart(Part):
         self.part = board
         self.mask = mask
 
-        self.size.width     = width
-        self.size.length    = length
-        self.size.thickness = enclosure_wall_thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = 19.4
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 2.2
+        self.apply_spec(MidiSd50SnPart.build_spec(enclosure_wall_thickness))
 
         # Front panel (very rough estimation--should normally follow the curves of the holes)
         hwx = (width / 2) + 0.2
@@ -95,4 +89,15 @@ class MidiSd50SnPart(Part):
         footprint_out = rounded_diamond.translate([0, 0, -self.outside_footprint_thickness])
 
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        return PartSpec(
+            size=(WIDTH, LENGTH, enclosure_wall_thickness),
+            inside_footprint=(WIDTH, LENGTH),
+            inside_footprint_thickness=19.4,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(WIDTH, LENGTH),
+            outside_footprint_thickness=2.2,
+        )
\ No newline at end of file
@@ -17,11 +17,14 @@
 import os
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
 from cq_enclosure_builder.parts_factory import register_part
+from cq_enclosure_builder.parts.common.fastener_holes import clearance_hole
 from cq_warehouse.fastener import CounterSunkScrew
 
+BOARD_SIZE = (112, 21.1, 1.5)
+
 @register_part("potentiometer", "PSM60_Ctrl")
 class MotorizedFaderPsm60CtrlPart(Part):
     """
@@ -37,7 +40,7 @@ class MotorizedFaderPsm60CtrlPart(Part):
     ):
         super().__init__()
         
-        board_size = (112, 21.1, 1.5)
+        board_size = BOARD_SIZE
         board_offset = (-5.00, 3.55)
         slit_size = (72, 3)
 
@@ -45,15 +48,14 @@ class MotorizedFaderPsm60CtrlPart(Part):
         screw = CounterSunkScrew(size="M3-0.5", fastener_type="iso7046",length=10)
 
         slit = cq.Workplane("front").box(*slit_size, 10, centered=(True, True, False))
-        board = (
+        board = clearance_hole(
             cq.Workplane("front")
                 .box(*board_size, centered=(True, True, False))
                 .translate([*board_offset, 0])
                 .faces("<Z").workplane()
-                .pushPoints(screws_pos)
-                .clearanceHole(fastener=screw, fit="Loose", counterSunk=True)
-                .cut(slit)
-        )
+                .pushPoints(screws_pos),
+            fastener=screw, fit="Loose", counter_sunk=True
+        ).cut(slit)
         mask = (
             cq.Workplane("front")
                 .box(board_size[0], board_size[1], enclosure_wall_thickness, centered=(True, True, False))
@@ -63,33 +65,12 @@ class MotorizedFaderPsm60CtrlPart(Part):
         self.part = board
         self.mask = mask
 
-        self.size.width, self.size.length, self.size.thickness = board_size
-
-        self.inside_footprint = (112, 21.095)
-        self.inside_footprint_thickness = 37.6
-        self.inside_footprint_offset = (5.00, 3.55)
-
-        self.outside_footprint = (86, 13)
-        self.outside_footprint_thickness = 9
+        model = MotorizedFaderPsm60CtrlPart._load_model(enclosure_wall_thickness) if add_model_to_footprint else None
+        self.apply_spec(MotorizedFaderPsm60CtrlPart.build_spec(enclosure_wall_thickness, add_model_to_footprint, model))
 
         footprint_in = None
         if add_model_to_footprint:
-            step_dir = "../src/cq_enclosure_builder/parts/potentiometer/step"  # when launched from Jupyter
-            try: step_dir = os.path.dirname(__file__)  # regular launch
-            except NameError: pass
-            model_path = os.path.join(step_dir, "psm60_with_controller_noslider.step")
-            model = (
-                cq.importers.importStep(model_path)
-                    .rotate((0,0,0), (1,0,0), 180)
-                    .translate([0, 0, min(board_size[2], enclosure_wall_thickness)])
-            )
             footprint_in = cq.Workplane("front").add(model)
-            bounding_box = model.val().BoundingBox()
-            self.inside_footprint_offset = (
-                -abs(abs(bounding_box.xmin) - abs(bounding_box.xmax)) / 2,
-                abs(abs(bounding_box.ymin) - abs(bounding_box.ymax)) / 2
-            )
-            self.inside_footprint_thickness = abs(bounding_box.zmin) + abs(bounding_box.zmax)
         else:
             footprint_in = (
                 cq.Workplane("front")
@@ -102,4 +83,46 @@ class MotorizedFaderPsm60CtrlPart(Part):
                 .translate([0, 0, -self.outside_footprint_thickness])
         )
         self.debug_objects.footprint.inside  = footprint_in
-        self.debug_objects.footprint.outside = footprint_out
\ No newline at end of file
+        self.debug_objects.footprint.outside = footprint_out
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness,
+        add_model_to_footprint = True,
+        _model: cq.Workplane = None,
+    ) -> PartSpec:
+        """
+        Not geometry-free when `add_model_to_footprint` is True: the inside footprint is then measured
+        on the STEP model, which has to be loaded.
+        """
+        inside_footprint_offset = (5.00, 3.55)
+        inside_footprint_thickness = 37.6
+        if add_model_to_footprint:
+            model = _model if _model is not None else MotorizedFaderPsm60CtrlPart._load_model(enclosure_wall_thickness)
+            bounding_box = model.val().BoundingBox()
+            inside_footprint_offset = (
+                -abs(abs(bounding_box.xmin) - abs(bounding_box.xmax)) / 2,
+                abs(abs(bounding_box.ymin) - abs(bounding_box.ymax)) / 2
+            )
+            inside_footprint_thickness = abs(bounding_box.zmin) + abs(bounding_box.zmax)
+
+        return PartSpec(
+            size=BOARD_SIZE,
+            inside_footprint=(112, 21.095),
+            inside_footprint_thickness=inside_footprint_thickness,
+            inside_footprint_offset=inside_footprint_offset,
+            outside_footprint=(86, 13),
+            outside_footprint_thickness=9,
+        )
+
+    @staticmethod
+    def _load_model(enclosure_wall_thickness) -> cq.Workplane:
+        step_dir = "../src/cq_enclosure_builder/parts/potentiometer/step"  # when launched from Jupyter
+        try: step_dir = os.path.dirname(__file__)  # regular launch
+        except NameError: pass
+        model_path = os.path.join(step_dir, "psm60_with_controller_noslider.step")
+        return (
+            cq.importers.importStep(model_path)
+                .rotate((0,0,0), (1,0,0), 180)
+                .translate([0, 0, min(BOARD_SIZE[2], enclosure_wall_thickness)])
+        )
\ No newline at end of file
@@ -14,8 +14,11 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedPart
 from cq_enclosure_builder.parts_factory import register_part
 
@@ -32,9 +35,11 @@ class RcaN1030Part(GenericThreadedPart):
         self,
         enclosure_wall_thickness: float
     ):
-        super().__init__(
-            enclosure_wall_thickness,
+        super().__init__(enclosure_wall_thickness, **RcaN1030Part._threaded_parameters(enclosure_wall_thickness))
 
+    @staticmethod
+    def _threaded_parameters(enclosure_wall_thickness: float) -> Dict[str, Any]:
+        return dict(
             base_size=13.6,
 
             thread_diameter=7.8,
@@ -46,4 +51,9 @@ class RcaN1030Part(GenericThreadedPart):
                 outside_footprint_size=(13.6, 13.6),
                 outside_footprint_depth=12
             )
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        parameters = RcaN1030Part._threaded_parameters(enclosure_wall_thickness)
+        return GenericThreadedPart.base_spec(enclosure_wall_thickness, parameters["base_size"], parameters["footprint_specs"])
\ No newline at end of file
@@ -21,7 +21,7 @@ from typing import Tuple
 import cadquery as cq
 
 from cq_enclosure_builder.constants import DEFAULT_PART_COLOR
-from cq_enclosure_builder.part import Part, AssemblyPart
+from cq_enclosure_builder.part import Part, PartSpec, AssemblyPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
 from cq_enclosure_builder.utils.workplane_utils import scale
@@ -57,6 +57,11 @@ class Dsi5Inch800x480WavesharePart(Part):
     """
 
     RAMP_SLOPE_THICKNESS = 1
+    RAMP_BASE_THICKNESS = 0.4#1#.6
+
+    SCREEN_VIEWING_AREA_CLEARANCE = -2 #0.4*2
+    SCREEN_VIEWING_AREA_SIZE = (109 - SCREEN_VIEWING_AREA_CLEARANCE, 65.8 - SCREEN_VIEWING_AREA_CLEARANCE)
+    SCREEN_BEVEL_SIZE = (3.1, 8.3, 5.85, 5.85)  # top, bottom, left, right
 
     # STEP model
     STEP_FILE = "step/waveshare-5inch-dsi-800x480.stp"
@@ -98,29 +103,20 @@ class Dsi5Inch800x480WavesharePart(Part):
 
 
         screen_module_thickness = 14.68 - 0.88
-        screen_viewing_area_clearance = -2 #0.4*2
-        screen_viewing_area_size = (109 - screen_viewing_area_clearance, 65.8 - screen_viewing_area_clearance)
-        screen_bevel_size = (3.1, 8.3, 5.85, 5.85)  # top, bottom, left, right
+        screen_viewing_area_size = Dsi5Inch800x480WavesharePart.SCREEN_VIEWING_AREA_SIZE
         viewing_area_offset = (0.0, 0)
         # viewing_area_offset = (0.4, -2.2)
         print("off s " + str(viewing_area_offset))
 
         screw_block_thickness = screen_module_thickness - enclosure_wall_thickness
 
-        ramp_base_thickness = 0.4#1#.6
+        ramp_base_thickness = Dsi5Inch800x480WavesharePart.RAMP_BASE_THICKNESS
         ramp_slope_thickness = Dsi5Inch800x480WavesharePart.RAMP_SLOPE_THICKNESS
         part_thickness = ramp_base_thickness + ramp_slope_thickness
 
         screw_block_thickness = screen_module_thickness - ramp_slope_thickness
         
-        screen_w_bevel_size = (
-            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
-            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
-        )
-        screen_board_size = (
-            screen_w_bevel_size[0] + 24,
-            screen_w_bevel_size[1] + 6
-        )
+        screen_w_bevel_size, screen_board_size = Dsi5Inch800x480WavesharePart._screen_sizes()
 
         screen_w_ramp_width = screen_viewing_area_size[0] + ramp_width_l_plus_r
 
@@ -231,25 +227,19 @@ class Dsi5Inch800x480WavesharePart(Part):
 
         bracket, bracket_footprint, bracket_size = self.build_brackets(enclosure_wall_thickness, bracket_extra_thickness, viewing_area_offset)
 
-        self.size.width     = screen_board_size[0]
-        self.size.length    = screen_board_size[1]
-        self.size.thickness = part_thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = part_thickness + screw_block_thickness - enclosure_wall_thickness
-        self.inside_footprint_offset = (-viewing_area_offset[0], -viewing_area_offset[1])
-
-        self.outside_footprint = (screen_w_ramp_width, screen_w_ramp_length)
-        self.outside_footprint_thickness = 3
+        self.apply_spec(Dsi5Inch800x480WavesharePart.build_spec(
+            enclosure_wall_thickness, bracket_extra_thickness, ramp_width_l_plus_r, ratio_bevel_lr_to_bt,
+            add_model_to_footprint, use_simplified_model, use_ultra_simplified_model))
 
         footprint_in = (
             cq.Workplane("front")
         )
+        footprint_out_thickness = 3
         footprint_out = (
             cq.Workplane("front")
-                .rect(*self.outside_footprint)
-                .extrude(self.outside_footprint_thickness)
-                .translate([*viewing_area_offset, -self.outside_footprint_thickness])
+                .rect(screen_w_ramp_width, screen_w_ramp_length)
+                .extrude(footprint_out_thickness)
+                .translate([*viewing_area_offset, -footprint_out_thickness])
         )
 
 
@@ -263,11 +253,6 @@ class Dsi5Inch800x480WavesharePart(Part):
                 .add(bracket_footprint.rotate((0, 0, 0), (0, 1, 0), 0).rotate((0, 0, 0), (0, 0, 1), 180).translate([0, 35.8 - 4.755 - 4.5, 20-0.5-5.5]))
         )
 
-        # Inside footprint
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = 20
-        self.inside_footprint_offset = (0, -2.6-0.52)
-
         # footprint_in = cq.Workplane("front")
         if add_model_to_footprint:
             footprint_in.add(super().get_step_model(
@@ -284,11 +269,6 @@ class Dsi5Inch800x480WavesharePart(Part):
 
         self.debug_objects.footprint.inside  = footprint_in
 
-        # Outside footprint
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 0
-        self.outside_footprint_offset = (0, 0)
-
         # Risers
         riser = (
             cq.Workplane("front")
@@ -330,6 +310,42 @@ class Dsi5Inch800x480WavesharePart(Part):
 
         self.debug_objects.hole = None #viewing_area_hole
 
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        bracket_extra_thickness: float = 1.4,
+        ramp_width_l_plus_r: float = 3,
+        ratio_bevel_lr_to_bt: float = 1.5,
+        add_model_to_footprint: bool = True,
+        use_simplified_model: bool = False,
+        use_ultra_simplified_model: bool = False,
+    ) -> PartSpec:
+        _, screen_board_size = Dsi5Inch800x480WavesharePart._screen_sizes()
+        part_thickness = Dsi5Inch800x480WavesharePart.RAMP_BASE_THICKNESS + Dsi5Inch800x480WavesharePart.RAMP_SLOPE_THICKNESS
+        return PartSpec(
+            size=(*screen_board_size, part_thickness),
+            inside_footprint=screen_board_size,
+            inside_footprint_thickness=20,
+            inside_footprint_offset=(0, -2.6-0.52),
+            outside_footprint=screen_board_size,
+            outside_footprint_thickness=0,
+            outside_footprint_offset=(0, 0),
+        )
+
+    @staticmethod
+    def _screen_sizes() -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        screen_viewing_area_size = Dsi5Inch800x480WavesharePart.SCREEN_VIEWING_AREA_SIZE
+        screen_bevel_size = Dsi5Inch800x480WavesharePart.SCREEN_BEVEL_SIZE
+        screen_w_bevel_size = (
+            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
+            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
+        )
+        screen_board_size = (
+            screen_w_bevel_size[0] + 24,
+            screen_w_bevel_size[1] + 6
+        )
+        return (screen_w_bevel_size, screen_board_size)
+
     def build_screws_assembly(self, screw_thickness, enclosure_wall_thickness, screen_ramp_thickness, screen_w_ramp_size):
         screw_block_thickness = screen_ramp_thickness - enclosure_wall_thickness + screw_thickness
         m4 = ScrewBlock().m3(screw_block_thickness, enclosure_wall_thickness)
@@ -21,7 +21,7 @@ from typing import Tuple
 import cadquery as cq
 
 from cq_enclosure_builder.constants import DEFAULT_PART_COLOR
-from cq_enclosure_builder.part import Part, AssemblyPart
+from cq_enclosure_builder.part import Part, PartSpec, AssemblyPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
 from cq_enclosure_builder.utils.workplane_utils import scale
@@ -51,6 +51,13 @@ class Dsi5InchCfsunbirdPart(Part):
     https://www.aliexpress.com/item/1005005353135304.html
     """
 
+    SCREEN_VIEWING_AREA_SIZE = (108.8-0.8, 65.6-0.8)
+    SCREEN_BEVEL_SIZE = (3.2, 7.6, 6.4, 6.4)  # top, bottom, left, right
+    VIEWING_AREA_OFFSET = (0.4, -2.2)
+
+    RAMP_BASE_THICKNESS = 1.6
+    RAMP_SLOPE_THICKNESS = 2
+
     DISTANCE_BETWEEN_SCREWS_X = 110.8 - 1.0
     DISTANCE_BETWEEN_OUTER_SCREWS_Y = 67.6 + 24
     DISTANCE_BETWEEN_INNER_SCREWS_Y = 67.6
@@ -80,32 +87,16 @@ class Dsi5InchCfsunbirdPart(Part):
 
         super().__init__()
 
-        screen_viewing_area_size = (108.8-0.8, 65.6-0.8)
-        screen_bevel_size = (3.2, 7.6, 6.4, 6.4)  # top, bottom, left, right
-
-        viewing_area_offset = (0.4, -2.2)
+        screen_viewing_area_size = Dsi5InchCfsunbirdPart.SCREEN_VIEWING_AREA_SIZE
 
-        ramp_base_thickness = 1.6
-        ramp_slope_thickness = 2
-        part_thickness = ramp_base_thickness + ramp_slope_thickness
+        viewing_area_offset = Dsi5InchCfsunbirdPart.VIEWING_AREA_OFFSET
 
-        screen_w_bevel_size = (
-            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
-            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
-        )
-        screen_board_size = (
-            screen_w_bevel_size[0] +  4, # magic number, TODO calculate margin from screw size
-            screen_w_bevel_size[1] + 28  # space for screws TODO unhardcode for HDMI v. DSI
-        )
+        ramp_slope_thickness = Dsi5InchCfsunbirdPart.RAMP_SLOPE_THICKNESS
+        part_thickness = Dsi5InchCfsunbirdPart.RAMP_BASE_THICKNESS + ramp_slope_thickness
 
-        screen_w_ramp_width = screen_viewing_area_size[0] + ramp_width_l_plus_r
+        screen_w_bevel_size, screen_board_size = Dsi5InchCfsunbirdPart._screen_sizes()
 
-        ratioed_screen_width = screen_viewing_area_size[0] / ratio_bevel_lr_to_bt
-        ratioed_screen_w_ramp_width = screen_w_ramp_width / ratio_bevel_lr_to_bt
-
-        alpha = required_taper_for_x(ratioed_screen_width, ratioed_screen_w_ramp_width, ramp_slope_thickness)
-
-        screen_w_ramp_length = tapered_dimensions(ratioed_screen_width, screen_viewing_area_size[1], ramp_slope_thickness, alpha)
+        screen_w_ramp_width, ratioed_screen_w_ramp_width, screen_w_ramp_length, alpha = Dsi5InchCfsunbirdPart._ramp_dimensions(ramp_width_l_plus_r, ratio_bevel_lr_to_bt)
         #print(f"TAPER ANGLE: {str(alpha)} for ramp {str(ramp_width_l_plus_r)} ratio {str(ratio_bevel_lr_to_bt)}")
 
         # otherwise, the tapered extrusion won't actually be `ramp_slope_thickness`
@@ -161,16 +152,9 @@ class Dsi5InchCfsunbirdPart(Part):
 
         bracket, bracket_split, bracket_footprint, bracket_size = self.build_brackets(enclosure_wall_thickness, bracket_extra_thickness, viewing_area_offset)
 
-        self.size.width     = screen_board_size[0]
-        self.size.length    = screen_board_size[1]
-        self.size.thickness = part_thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = part_thickness + screw_block_thickness - enclosure_wall_thickness
-        self.inside_footprint_offset = (-viewing_area_offset[0], -viewing_area_offset[1])
-
-        self.outside_footprint = (screen_w_ramp_width, screen_w_ramp_length)
-        self.outside_footprint_thickness = 3
+        self.apply_spec(Dsi5InchCfsunbirdPart.build_spec(
+            enclosure_wall_thickness, screw_block_thickness, bracket_extra_thickness, center_is_outward_facing_hole,
+            ramp_width_l_plus_r, ratio_bevel_lr_to_bt, add_pi_footprint, pi_footprint_offset))
 
         footprint_in = (
             cq.Workplane("front")
@@ -232,6 +216,59 @@ class Dsi5InchCfsunbirdPart(Part):
         self.debug_objects.others["screws_mask"] = screws_mask
         self.debug_objects.others["screen_with_ramps_hole"] = screen_w_ramps_hole
 
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        screw_block_thickness: float = 11.6 + 1.4,
+        bracket_extra_thickness: float = 1.4,
+        center_is_outward_facing_hole: bool = True,
+        ramp_width_l_plus_r: float = 2.8,
+        ratio_bevel_lr_to_bt: float = 1.5,
+        add_pi_footprint: bool = False,
+        pi_footprint_offset: Tuple[float, float] = DEFAULT_PI_OFFSET,
+    ) -> PartSpec:
+        _, screen_board_size = Dsi5InchCfsunbirdPart._screen_sizes()
+        screen_w_ramp_width, _, screen_w_ramp_length, _ = Dsi5InchCfsunbirdPart._ramp_dimensions(ramp_width_l_plus_r, ratio_bevel_lr_to_bt)
+        viewing_area_offset = Dsi5InchCfsunbirdPart.VIEWING_AREA_OFFSET
+        part_thickness = Dsi5InchCfsunbirdPart.RAMP_BASE_THICKNESS + Dsi5InchCfsunbirdPart.RAMP_SLOPE_THICKNESS
+        return PartSpec(
+            size=(*screen_board_size, part_thickness),
+            inside_footprint=screen_board_size,
+            inside_footprint_thickness=part_thickness + screw_block_thickness - enclosure_wall_thickness,
+            inside_footprint_offset=(-viewing_area_offset[0], -viewing_area_offset[1]),
+            outside_footprint=(screen_w_ramp_width, screen_w_ramp_length),
+            outside_footprint_thickness=3,
+        )
+
+    @staticmethod
+    def _screen_sizes() -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        screen_viewing_area_size = Dsi5InchCfsunbirdPart.SCREEN_VIEWING_AREA_SIZE
+        screen_bevel_size = Dsi5InchCfsunbirdPart.SCREEN_BEVEL_SIZE
+        screen_w_bevel_size = (
+            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
+            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
+        )
+        screen_board_size = (
+            screen_w_bevel_size[0] +  4, # magic number, TODO calculate margin from screw size
+            screen_w_bevel_size[1] + 28  # space for screws TODO unhardcode for HDMI v. DSI
+        )
+        return (screen_w_bevel_size, screen_board_size)
+
+    @staticmethod
+    def _ramp_dimensions(ramp_width_l_plus_r: float, ratio_bevel_lr_to_bt: float) -> Tuple[float, float, float, float]:
+        screen_viewing_area_size = Dsi5InchCfsunbirdPart.SCREEN_VIEWING_AREA_SIZE
+        ramp_slope_thickness = Dsi5InchCfsunbirdPart.RAMP_SLOPE_THICKNESS
+
+        screen_w_ramp_width = screen_viewing_area_size[0] + ramp_width_l_plus_r
+
+        ratioed_screen_width = screen_viewing_area_size[0] / ratio_bevel_lr_to_bt
+        ratioed_screen_w_ramp_width = screen_w_ramp_width / ratio_bevel_lr_to_bt
+
+        alpha = required_taper_for_x(ratioed_screen_width, ratioed_screen_w_ramp_width, ramp_slope_thickness)
+
+        screen_w_ramp_length = tapered_dimensions(ratioed_screen_width, screen_viewing_area_size[1], ramp_slope_thickness, alpha)
+        return (screen_w_ramp_width, ratioed_screen_w_ramp_width, screen_w_ramp_length, alpha)
+
     def build_screws_assembly(self, screw_thickness, enclosure_wall_thickness, screen_ramp_thickness, screen_w_ramp_size):
         screw_block_thickness = screen_ramp_thickness - enclosure_wall_thickness + screw_thickness
         m4 = ScrewBlock().m4(screw_block_thickness, enclosure_wall_thickness)
@@ -15,11 +15,12 @@
 """
 
 import math
+from typing import Tuple
 
 import cadquery as cq
 
 from cq_enclosure_builder.constants import DEFAULT_PART_COLOR
-from cq_enclosure_builder.part import Part, AssemblyPart
+from cq_enclosure_builder.part import Part, PartSpec, AssemblyPart
 from cq_enclosure_builder.parts_factory import register_part
 from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
 from cq_enclosure_builder.utils.workplane_utils import scale
@@ -45,6 +46,14 @@ class Hdmi5InchJrp5015Part(Part):
     https://www.aliexpress.com/item/1005004132936105.html
     """
 
+    SCREEN_VIEWING_AREA_SIZE = (108.8-0.8, 65.6-0.8)
+    SCREEN_BEVEL_SIZE = (3.2, 7.6, 6.4, 6.4)  # top, bottom, left, right
+    VIEWING_AREA_OFFSET = (0.4, -2.2)
+
+    RAMP_BASE_THICKNESS = 1.6
+    RAMP_SLOPE_THICKNESS = 2
+    PCB_THICKNESS = 2
+
     def __init__(
         self,
         enclosure_wall_thickness: float,
@@ -58,32 +67,16 @@ class Hdmi5InchJrp5015Part(Part):
 
         super().__init__()
 
-        screen_viewing_area_size = (108.8-0.8, 65.6-0.8)
-        screen_bevel_size = (3.2, 7.6, 6.4, 6.4)  # top, bottom, left, right
-
-        viewing_area_offset = (0.4, -2.2)
-
-        ramp_base_thickness = 1.6
-        ramp_slope_thickness = 2
-        part_thickness = ramp_base_thickness + ramp_slope_thickness
-
-        screen_w_bevel_size = (
-            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
-            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
-        )
-        screen_board_size = (
-            screen_w_bevel_size[0] +  4, # magic number, TODO calculate margin from screw size
-            screen_w_bevel_size[1] + 26  # space for screws TODO unhardcode for HDMI v. DSI
-        )
+        screen_viewing_area_size = Hdmi5InchJrp5015Part.SCREEN_VIEWING_AREA_SIZE
 
-        screen_w_ramp_width = screen_viewing_area_size[0] + ramp_width_l_plus_r
+        viewing_area_offset = Hdmi5InchJrp5015Part.VIEWING_AREA_OFFSET
 
-        ratioed_screen_width = screen_viewing_area_size[0] / ratio_bevel_lr_to_bt
-        ratioed_screen_w_ramp_width = screen_w_ramp_width / ratio_bevel_lr_to_bt
+        ramp_slope_thickness = Hdmi5InchJrp5015Part.RAMP_SLOPE_THICKNESS
+        part_thickness = Hdmi5InchJrp5015Part.RAMP_BASE_THICKNESS + ramp_slope_thickness
 
-        alpha = required_taper_for_x(ratioed_screen_width, ratioed_screen_w_ramp_width, ramp_slope_thickness)
+        screen_w_bevel_size, screen_board_size = Hdmi5InchJrp5015Part._screen_sizes()
 
-        screen_w_ramp_length = tapered_dimensions(ratioed_screen_width, screen_viewing_area_size[1], ramp_slope_thickness, alpha)
+        screen_w_ramp_width, ratioed_screen_w_ramp_width, screen_w_ramp_length, alpha = Hdmi5InchJrp5015Part._ramp_dimensions(ramp_width_l_plus_r, ratio_bevel_lr_to_bt)
         #print("TAPER ANGLE: " + str(alpha) + "for depth " + str(screw_block_thickness))
 
         # otherwise, the tapered extrusion won't actually be `ramp_slope_thickness`
@@ -137,17 +130,9 @@ class Hdmi5InchJrp5015Part(Part):
                 .box(*screen_w_bevel_size, part_thickness, centered=(True, True, False))
         )
 
-        self.size.width     = screen_board_size[0]
-        self.size.length    = screen_board_size[1]
-        self.size.thickness = part_thickness
-
-        pcb_thickness = 2
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness =part_thickness + screw_block_thickness + pcb_thickness
-        self.inside_footprint_offset = (-viewing_area_offset[0], -viewing_area_offset[1])
-
-        self.outside_footprint = (screen_w_ramp_width, screen_w_ramp_length)
-        self.outside_footprint_thickness = 3
+        self.apply_spec(Hdmi5InchJrp5015Part.build_spec(
+            enclosure_wall_thickness, screw_block_thickness, center_is_outward_facing_hole,
+            ramp_width_l_plus_r, ratio_bevel_lr_to_bt))
 
         footprint_in = (
             cq.Workplane("front")
@@ -185,6 +170,56 @@ class Hdmi5InchJrp5015Part(Part):
         self.debug_objects.others["screws_mask"] = screws_mask
         self.debug_objects.others["screen_with_ramps_hole"] = screen_w_ramps_hole
 
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        screw_block_thickness: float = 6,
+        center_is_outward_facing_hole: bool = True,
+        ramp_width_l_plus_r: float = 2.8,
+        ratio_bevel_lr_to_bt: float = 1.5,
+    ) -> PartSpec:
+        _, screen_board_size = Hdmi5InchJrp5015Part._screen_sizes()
+        screen_w_ramp_width, _, screen_w_ramp_length, _ = Hdmi5InchJrp5015Part._ramp_dimensions(ramp_width_l_plus_r, ratio_bevel_lr_to_bt)
+        viewing_area_offset = Hdmi5InchJrp5015Part.VIEWING_AREA_OFFSET
+        part_thickness = Hdmi5InchJrp5015Part.RAMP_BASE_THICKNESS + Hdmi5InchJrp5015Part.RAMP_SLOPE_THICKNESS
+        return PartSpec(
+            size=(*screen_board_size, part_thickness),
+            inside_footprint=screen_board_size,
+            inside_footprint_thickness=part_thickness + screw_block_thickness + Hdmi5InchJrp5015Part.PCB_THICKNESS,
+            inside_footprint_offset=(-viewing_area_offset[0], -viewing_area_offset[1]),
+            outside_footprint=(screen_w_ramp_width, screen_w_ramp_length),
+            outside_footprint_thickness=3,
+        )
+
+    @staticmethod
+    def _screen_sizes() -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        screen_viewing_area_size = Hdmi5InchJrp5015Part.SCREEN_VIEWING_AREA_SIZE
+        screen_bevel_size = Hdmi5InchJrp5015Part.SCREEN_BEVEL_SIZE
+        screen_w_bevel_size = (
+            screen_viewing_area_size[0] + screen_bevel_size[2] + screen_bevel_size[3],
+            screen_viewing_area_size[1] + screen_bevel_size[0] + screen_bevel_size[1]
+        )
+        screen_board_size = (
+            screen_w_bevel_size[0] +  4, # magic number, TODO calculate margin from screw size
+            screen_w_bevel_size[1] + 26  # space for screws TODO unhardcode for HDMI v. DSI
+        )
+        return (screen_w_bevel_size, screen_board_size)
+
+    @staticmethod
+    def _ramp_dimensions(ramp_width_l_plus_r: float, ratio_bevel_lr_to_bt: float) -> Tuple[float, float, float, float]:
+        screen_viewing_area_size = Hdmi5InchJrp5015Part.SCREEN_VIEWING_AREA_SIZE
+        ramp_slope_thickness = Hdmi5InchJrp5015Part.RAMP_SLOPE_THICKNESS
+
+        screen_w_ramp_width = screen_viewing_area_size[0] + ramp_width_l_plus_r
+
+        ratioed_screen_width = screen_viewing_area_size[0] / ratio_bevel_lr_to_bt
+        ratioed_screen_w_ramp_width = screen_w_ramp_width / ratio_bevel_lr_to_bt
+
+        alpha = required_taper_for_x(ratioed_screen_width, ratioed_screen_w_ramp_width, ramp_slope_thickness)
+
+        screen_w_ramp_length = tapered_dimensions(ratioed_screen_width, screen_viewing_area_size[1], ramp_slope_thickness, alpha)
+        return (screen_w_ramp_width, ratioed_screen_w_ramp_width, screen_w_ramp_length, alpha)
+
     def build_screws_assembly(self, screw_thickness, enclosure_wall_thickness, screen_ramp_thickness, screen_w_ramp_size):
         screw_block_thickness = screen_ramp_thickness - enclosure_wall_thickness + screw_thickness
         m4 = ScrewBlock().m4(screw_block_thickness, enclosure_wall_thickness)
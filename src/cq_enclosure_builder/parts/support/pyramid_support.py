@@ -16,7 +16,7 @@
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 
 
@@ -59,17 +59,25 @@ class PyramidSupportPart(Part):
                 .box(base_size, base_size, enclosure_wall_thickness, centered=(True, True, False))
         )
 
-        self.size.width     = base_size
-        self.size.length    = base_size
-        self.size.thickness = support_height
-
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = self.size.thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (0, 0)
-        self.outside_footprint_thickness = 0
+        self.apply_spec(PyramidSupportPart.build_spec(enclosure_wall_thickness, support_height, base_size, top_size, pyramid_taper))
 
         self.debug_objects.footprint.inside  = board
         self.debug_objects.footprint.outside = None
-        self.debug_objects.hole = None
\ No newline at end of file
+        self.debug_objects.hole = None
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        support_height: float,
+        base_size: float = 8,
+        top_size: float = 5,
+        pyramid_taper: float = 20
+    ) -> PartSpec:
+        return PartSpec(
+            size=(base_size, base_size, support_height),
+            inside_footprint=(base_size, base_size),
+            inside_footprint_thickness=support_height,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(0, 0),
+            outside_footprint_thickness=0,
+        )
\ No newline at end of file
@@ -18,7 +18,7 @@ from typing import Tuple
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 
 
@@ -79,18 +79,26 @@ class SkirtPart(Part):
         self.part = skirt
         self.mask = skirt
 
-        self.size.width     = width
-        self.size.length    = length
-        self.size.thickness = skirt_size[1]
-
-        self.inside_footprint = (self.size.width, self.size.length)  # TODO should account for the screw blocks (incl. taper)
-        self.inside_footprint_thickness = self.size.thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)
-        self.outside_footprint_thickness = 0
+        self.apply_spec(SkirtPart.build_spec(enclosure_wall_thickness, width, length, skirt_size, base_size))
 
         self.debug_objects.footprint.inside  = skirt
         self.debug_objects.footprint.outside = None
         
-        self.debug_objects.hole = None
\ No newline at end of file
+        self.debug_objects.hole = None
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        width: float,
+        length: float,
+        skirt_size: Tuple[float, float] = (4, 4),
+        base_size: float = None
+    ) -> PartSpec:
+        return PartSpec(
+            size=(width, length, skirt_size[1]),
+            inside_footprint=(width, length),  # TODO should account for the screw blocks (incl. taper)
+            inside_footprint_thickness=skirt_size[1],
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(width, length),
+            outside_footprint_thickness=0,
+        )
\ No newline at end of file
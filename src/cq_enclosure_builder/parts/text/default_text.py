@@ -18,7 +18,7 @@ from typing import Literal
 
 import cadquery as cq
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
 
 # TODO preset for sizes; approx. decent values for the default text:
@@ -81,16 +81,29 @@ class TextPart(Part):
         self.part = text_wp
         self.mask = mask
 
-        self.size.width     = width
-        self.size.length    = length
-        self.size.thickness = enclosure_wall_thickness + thickness
-
-        self.inside_footprint = (self.size.width, self.size.length)  # text isn't taken into account (can be more or less)
-        self.inside_footprint_thickness = 0 if outside else thickness
-        self.inside_footprint_offset = (0, 0)
-
-        self.outside_footprint = (self.size.width, self.size.length)  # text isn't taken into account (can be more or less)
-        self.outside_footprint_thickness = thickness if outside else 0
+        self.apply_spec(TextPart.build_spec(enclosure_wall_thickness, text, thickness, cut, fontsize, width, length, outside, halign, valign))
 
         self.debug_objects.footprint.inside  = None if outside else text_wp.cut(mask)
-        self.debug_objects.footprint.outside = text_wp.cut(mask) if outside else None
\ No newline at end of file
+        self.debug_objects.footprint.outside = text_wp.cut(mask) if outside else None
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        text: str = "Sample text\nLine 2",
+        thickness: float = 1.4,
+        cut: bool = False,
+        fontsize: int = 6,
+        width: float = 40,
+        length: float = 18,
+        outside: bool = False,
+        halign: Literal['center', 'left', 'right'] = "center",
+        valign: Literal['center', 'left', 'right'] = "center",
+    ) -> PartSpec:
+        return PartSpec(
+            size=(width, length, enclosure_wall_thickness + thickness),
+            inside_footprint=(width, length),  # text isn't taken into account (can be more or less)
+            inside_footprint_thickness=0 if outside else thickness,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(width, length),  # text isn't taken into account (can be more or less)
+            outside_footprint_thickness=thickness if outside else 0,
+        )
\ No newline at end of file
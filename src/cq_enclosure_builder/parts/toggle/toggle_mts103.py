@@ -14,11 +14,18 @@
    limitations under the License.
 """
 
+from typing import Dict, Any
+
 import cadquery as cq
 
+from cq_enclosure_builder.part import PartSpec
 from cq_enclosure_builder.parts.common.generic_threaded_part import GenericThreadedWithStopPart
 from cq_enclosure_builder.parts_factory import register_part
 
+TOGGLE_BLOCK_SIZE = (13, 8.2)
+TOGGLE_BLOCK_THICKNESS = 9.5 + 6.3
+TOGGLE_STICK_THICKNESS = 10.2
+
 
 @register_part("toggle", "MTS-103")
 class ToggleMts103Part(GenericThreadedWithStopPart):
@@ -32,42 +39,15 @@ class ToggleMts103Part(GenericThreadedWithStopPart):
         self,
         enclosure_wall_thickness: float
     ):
-        super().__init__(
-            enclosure_wall_thickness,
-
-            width=14,
-            length=14,
-
-            thread_diameter=6.0,
-            thread_diameter_error_margin=0.6,
-            thread_depth=8.8,
-
-            washer_thickness=0.6,
-            nut_thickness=1.9,
-            margin_after_nut=0.5,
-
-            pyramid_taper=35,
-        )
-
-        toggle_block_size = (13, 8.2)
-        toggle_block_thickness = 9.5 + 6.3
-        self.inside_footprint = (
-            toggle_block_size[0] if toggle_block_size[0] > self.width else self.width,
-            toggle_block_size[1] if toggle_block_size[1] > self.length else self.length
-        )
-        self.inside_footprint_thickness = self.block_thickness + toggle_block_thickness
-        self.inside_footprint_offset = (0, 0)
+        super().__init__(enclosure_wall_thickness, **ToggleMts103Part._threaded_parameters())
+        self.apply_spec(ToggleMts103Part.build_spec(enclosure_wall_thickness))
 
         toggle_thread_minus_wall = self.thread_depth - self.block_thickness - enclosure_wall_thickness
-        toggle_stick_thickness = 10.2
-        # TODO we want to add the nut [and washer], as well as in the debug object
-        self.outside_footprint = (self.thread_diameter, self.thread_diameter)
-        self.outside_footprint_thickness = toggle_thread_minus_wall + toggle_stick_thickness
 
         footprint_in = (
             cq.Workplane("front")
-                .box(*toggle_block_size, toggle_block_thickness, centered=(True, True, False))
-                .translate([0, 0, -(toggle_block_thickness + self.block_thickness)])
+                .box(*TOGGLE_BLOCK_SIZE, TOGGLE_BLOCK_THICKNESS, centered=(True, True, False))
+                .translate([0, 0, -(TOGGLE_BLOCK_THICKNESS + self.block_thickness)])
                 .add(self.pyramid.mirror("XY").translate([0, 0, enclosure_wall_thickness]))
         )
         footprint_out = (
@@ -78,9 +58,45 @@ class ToggleMts103Part(GenericThreadedWithStopPart):
                 .add(
                     cq.Workplane("front")
                         .circle(1.5)
-                        .extrude(toggle_stick_thickness)
+                        .extrude(TOGGLE_STICK_THICKNESS)
                         .translate([0, 0, toggle_thread_minus_wall + enclosure_wall_thickness])
                 )
         )
         self.debug_objects.footprint.inside  = self.mirror_and_translate(footprint_in)
-        self.debug_objects.footprint.outside = self.mirror_and_translate(footprint_out)
\ No newline at end of file
+        self.debug_objects.footprint.outside = self.mirror_and_translate(footprint_out)
+
+    @staticmethod
+    def _threaded_parameters() -> Dict[str, Any]:
+        return dict(
+            width=14,
+            length=14,
+
+            thread_diameter=6.0,
+            thread_diameter_error_margin=0.6,
+            thread_depth=8.8,
+
+            washer_thickness=0.6,
+            nut_thickness=1.9,
+            margin_after_nut=0.5,
+
+            pyramid_taper=35,
+        )
+
+    @staticmethod
+    def build_spec(enclosure_wall_thickness: float) -> PartSpec:
+        parameters = ToggleMts103Part._threaded_parameters()
+        dimensions = GenericThreadedWithStopPart.Dimensions(enclosure_wall_thickness, **parameters)
+
+        toggle_thread_minus_wall = parameters["thread_depth"] - dimensions.block_thickness - enclosure_wall_thickness
+        # TODO we want to add the nut [and washer], as well as in the debug object
+        return PartSpec(
+            size=dimensions.size,
+            inside_footprint=(
+                TOGGLE_BLOCK_SIZE[0] if TOGGLE_BLOCK_SIZE[0] > dimensions.width else dimensions.width,
+                TOGGLE_BLOCK_SIZE[1] if TOGGLE_BLOCK_SIZE[1] > dimensions.length else dimensions.length
+            ),
+            inside_footprint_thickness=dimensions.block_thickness + TOGGLE_BLOCK_THICKNESS,
+            inside_footprint_offset=(0, 0),
+            outside_footprint=(dimensions.thread_diameter, dimensions.thread_diameter),
+            outside_footprint_thickness=toggle_thread_minus_wall + TOGGLE_STICK_THICKNESS,
+        )
\ No newline at end of file
@@ -17,8 +17,17 @@
 import cadquery as cq
 from cq_warehouse.fastener import PanHeadScrew
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
+from cq_enclosure_builder.parts.common.fastener_holes import threaded_hole
+
+USB_HOLE_ERROR_MARGIN = 0.6
+USB_DEPTH_ERROR_MARGIN = 0.2
+
+USB_SIZE = (14.6 + USB_HOLE_ERROR_MARGIN, 7.0 + USB_HOLE_ERROR_MARGIN)
+USB_DEPTH = 15 - USB_DEPTH_ERROR_MARGIN
+
+PCB_THICKNESS = 2
 
 
 @register_part("usb_a", "3.0 vertical cltgxdd")
@@ -51,11 +60,8 @@ class UsbA30VerticalCltgxddPart(Part):
         half_length = length / 2
         half_slope_size = slope_size / 2
 
-        usb_hole_error_margin = 0.6
-        usb_depth_error_margin = 0.2
-
-        usb_size = (14.6 + usb_hole_error_margin, 7.0 + usb_hole_error_margin)
-        usb_depth = 15 - usb_depth_error_margin
+        usb_size = USB_SIZE
+        usb_depth = USB_DEPTH
 
         usb_pos = (0, 6.6)
         screws_pos = [
@@ -108,12 +114,12 @@ class UsbA30VerticalCltgxddPart(Part):
         )
 
         # Screws
-        board = (
+        board = threaded_hole(
             board
                 .faces(">Z")
                 .workplane()
-                .pushPoints(screws_pos)
-                .threadedHole(fastener=screw, depth=screw_hole_depth, counterSunk=False)
+                .pushPoints(screws_pos),
+            fastener=screw, depth=screw_hole_depth, counter_sunk=False
         )
 
         # Mask & footprint
@@ -180,7 +186,6 @@ class UsbA30VerticalCltgxddPart(Part):
         usb_hole = usb_hole.rotate((0, 0, 0), (0, 0, 1), rotate_by)
 
         # Huh, I really need to cleanup this class
-        reverse = -1 if rotate_180 else 1
         if rotate_180:
             # board = board.mirror("XZ")
             # mask = board.mirror("XZ")
@@ -192,17 +197,8 @@ class UsbA30VerticalCltgxddPart(Part):
         self.part = board
         self.mask = mask
 
-        self.size.width     = 22.8 if orientation_vertical else 25.2  # TODO unhardcode
-        self.size.length    = 29.2 if orientation_vertical else 26.8
-        self.size.thickness = enclosure_wall_thickness + wall_thickness
-
-        pcb_thickness = 2
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = usb_depth - enclosure_wall_thickness + pcb_thickness
-        self.inside_footprint_offset = (0, reverse * 4.6) if not orientation_vertical else (reverse * -6.6, reverse * -2)
-
-        self.outside_footprint = (usb_size[0] if not orientation_vertical else usb_size[1], usb_size[1] if not orientation_vertical else usb_size[0])
-        self.outside_footprint_thickness = 3
+        self.apply_spec(UsbA30VerticalCltgxddPart.build_spec(
+            enclosure_wall_thickness, orientation_vertical, center_is_outward_facing_hole, rotate_180, filleted_hole))
 
         footprint_in = (
             cq.Workplane("front")
@@ -222,4 +218,27 @@ class UsbA30VerticalCltgxddPart(Part):
         self.debug_objects.footprint.inside  = footprint_in
         self.debug_objects.footprint.outside = footprint_out
         
-        self.debug_objects.hole = usb_hole
\ No newline at end of file
+        self.debug_objects.hole = usb_hole
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        orientation_vertical: bool = False,
+        center_is_outward_facing_hole: bool = True,
+        rotate_180 = True,
+        filleted_hole = True,
+    ) -> PartSpec:
+        wall_thickness = USB_DEPTH - enclosure_wall_thickness
+        reverse = -1 if rotate_180 else 1
+
+        width = 22.8 if orientation_vertical else 25.2  # TODO unhardcode
+        length = 29.2 if orientation_vertical else 26.8
+
+        return PartSpec(
+            size=(width, length, enclosure_wall_thickness + wall_thickness),
+            inside_footprint=(width, length),
+            inside_footprint_thickness=USB_DEPTH - enclosure_wall_thickness + PCB_THICKNESS,
+            inside_footprint_offset=(0, reverse * 4.6) if not orientation_vertical else (reverse * -6.6, reverse * -2),
+            outside_footprint=(USB_SIZE[0] if not orientation_vertical else USB_SIZE[1], USB_SIZE[1] if not orientation_vertical else USB_SIZE[0]),
+            outside_footprint_thickness=3,
+        )
\ No newline at end of file
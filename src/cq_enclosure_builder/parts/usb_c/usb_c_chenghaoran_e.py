@@ -15,14 +15,21 @@
 """
 
 import cadquery as cq
-import cq_warehouse.extensions
 from cq_warehouse.fastener import PanHeadScrew
 
-from cq_enclosure_builder.part import Part
+from cq_enclosure_builder.part import Part, PartSpec
 from cq_enclosure_builder.parts_factory import register_part
+from cq_enclosure_builder.parts.common.fastener_holes import threaded_hole
 
 M2_SIZE = 2
 
+USB_C_DEPTH = 10.2
+USB_C_ERROR_MARGIN = 0.4
+USB_C_W = 9.0 + USB_C_ERROR_MARGIN
+USB_C_L = 3.2 + USB_C_ERROR_MARGIN
+
+PCB_THICKNESS = 2
+
 
 @register_part("usb_c", "ChengHaoRan E")
 class UsbCChengHaoRanEPart(Part):
@@ -54,10 +61,9 @@ class UsbCChengHaoRanEPart(Part):
         half_length = length / 2
         half_slope_size = slope_size / 2
 
-        usb_c_depth = 10.2
+        usb_c_depth = USB_C_DEPTH
         usb_c_pos = (0, 1.4)
         usb_c_tilt = 0
-        usb_c_error_margin = 0.4
 
         wall_thickness = usb_c_depth - enclosure_wall_thickness
 
@@ -84,17 +90,17 @@ class UsbCChengHaoRanEPart(Part):
         )
 
         # Screws
-        board = (
+        board = threaded_hole(
             board
                 .faces(">Z")
                 .workplane()
-                .pushPoints(screws_pos)
-                .threadedHole(fastener=screw, depth=screw_hole_depth, counterSunk=False)
+                .pushPoints(screws_pos),
+            fastener=screw, depth=screw_hole_depth, counter_sunk=False
         )
 
         # USB C hole
-        usb_c_w = 9.0 + usb_c_error_margin
-        usb_c_l = 3.2 + usb_c_error_margin
+        usb_c_w = USB_C_W
+        usb_c_l = USB_C_L
         usb_c_ellipse_size = 1.8
         usb_c_middle_size = usb_c_w - (usb_c_ellipse_size*2)
         usb_c_l_half = usb_c_l / 2
@@ -204,7 +210,6 @@ class UsbCChengHaoRanEPart(Part):
         ubs_c_cavity = ubs_c_cavity.rotate((0, 0, 0), (0, 0, 1), rotate_by)
 
         # Huh, I really need to cleanup this class
-        reverse = -1 if rotate_180 else 1
         if rotate_180:
             # board = board.mirror("XZ")
             # mask = board.mirror("XZ")
@@ -218,17 +223,8 @@ class UsbCChengHaoRanEPart(Part):
         self.part = board
         self.mask = mask
 
-        self.size.width     = 18  # TODO unhardcode when rewriting
-        self.size.length    = 22
-        self.size.thickness = enclosure_wall_thickness + wall_thickness
-
-        pcb_thickness = 2
-        self.inside_footprint = (self.size.width, self.size.length)
-        self.inside_footprint_thickness = usb_c_depth - enclosure_wall_thickness + pcb_thickness
-        self.inside_footprint_offset = (0, reverse * -0.6) if not orientation_vertical else (reverse * -1.4, reverse * -2)
-
-        self.outside_footprint = (usb_c_w if not orientation_vertical else usb_c_l, usb_c_l if not orientation_vertical else usb_c_w)
-        self.outside_footprint_thickness = 3
+        self.apply_spec(UsbCChengHaoRanEPart.build_spec(
+            enclosure_wall_thickness, orientation_vertical, center_is_outward_facing_hole, rotate_180))
 
         footprint_in = (
             cq.Workplane("front")
@@ -248,4 +244,26 @@ class UsbCChengHaoRanEPart(Part):
         self.debug_objects.footprint.inside  = footprint_in
         self.debug_objects.footprint.outside = footprint_out
         
-        self.debug_objects.hole = usb_c_hole.add(ubs_c_cavity)
\ No newline at end of file
+        self.debug_objects.hole = usb_c_hole.add(ubs_c_cavity)
+
+    @staticmethod
+    def build_spec(
+        enclosure_wall_thickness: float,
+        orientation_vertical: bool = False,
+        center_is_outward_facing_hole: bool = True,
+        rotate_180: bool = True,
+    ) -> PartSpec:
+        wall_thickness = USB_C_DEPTH - enclosure_wall_thickness
+        reverse = -1 if rotate_180 else 1
+
+        width = 18  # TODO unhardcode when rewriting
+        length = 22
+
+        return PartSpec(
+            size=(width, length, enclosure_wall_thickness + wall_thickness),
+            inside_footprint=(width, length),
+            inside_footprint_thickness=USB_C_DEPTH - enclosure_wall_thickness + PCB_THICKNESS,
+            inside_footprint_offset=(0, reverse * -0.6) if not orientation_vertical else (reverse * -1.4, reverse * -2),
+            outside_footprint=(USB_C_W if not orientation_vertical else USB_C_L, USB_C_L if not orientation_vertical else USB_C_W),
+            outside_footprint_thickness=3,
+        )
\ No newline at end of file
@@ -14,13 +14,32 @@
    limitations under the License.
 """
 
+import os
 import sys
+import importlib
+import time
 import inspect
 import json
-from typing import List, Type, Tuple, Dict, Any, Callable
-
-from cq_enclosure_builder.part import Part
+import pickle
+import atexit
+import asyncio
+import threading
+import contextlib
+import contextvars
+from contextvars import ContextVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Type, Tuple, Dict, Set, Any, Callable, Hashable, Iterator, Union
+
+from cq_enclosure_builder.part import Part, PartSpec
+from cq_enclosure_builder.lazy_part import LazyPart
+from cq_enclosure_builder.part_cache import CACHE_DIR_ENV_VAR, LOCK_STALE_AFTER, DiskPartCache, PartLruCache, CacheInfo, estimate_part_bytes, serialize_part, deserialize_part, footprints_from_meta, clear_helper_caches
+from cq_enclosure_builder.build_stats import BuildStats
+from cq_enclosure_builder.cache_key import canonical_key, register_key_encoder
+from cq_enclosure_builder.part_fingerprint import part_fingerprint, part_uses_module
+from cq_enclosure_builder.detail_level import DETAIL_LEVEL_PARAMETER, FASTENER_HOLES_MODULE, DetailLevel, detail_level, get_detail_level, resolve_detail_level
+from cq_enclosure_builder.build_manifest import load_manifest, save_manifest
 from cq_enclosure_builder.parts_factory_protocol import PartsFactoryProtocol
+from cq_enclosure_builder.parts.manifest import PARTS_MANIFEST
 from . import PanelSize
 
 
@@ -33,29 +52,85 @@ class PartFactoryMeta(type):
     NO_DEFAULT_VALUE_IDENTIFIER: str = "(no default value)"
 
     def register_part(cls, category: str, part_type: str, part_class: Type[Part]) -> None:
-        if not category.isidentifier():
-            raise ValueError(f"'{category}' is not a valid category name. Category names should be valid Python identifiers.")
-        if category not in cls.part_registry:
-            cls.part_registry[category] = {}
-            # Add the dynamic build method
-            method_name = f"build_{category.lower()}"
-            setattr(cls, method_name, cls._build_method(category))
-
-            # Add the dynamic method for listing available types
-            list_method_name = f"list_types_of_{category.lower()}"
-            setattr(cls, list_method_name, cls._list_types_method(category))
-
-            # Add the dynamic method for listing available parameters
-            list_params_method_name = f"list_parameters_for_{category.lower()}"
-            setattr(cls, list_params_method_name, cls._list_parameters_method(category))
-        elif part_type in cls.part_registry[category]:
+        """
+        Registering the same part again from the same module (e.g. after `importlib.reload`) replaces it;
+        the parts built with the previous version of its code are then evicted from the memory cache.
+        """
+        cls._register_category(category)
+        reloaded = False
+        if part_type in cls.part_registry[category]:
             existing_class = cls.part_registry[category][part_type]
             module_name = existing_class.__module__
-            module = sys.modules[module_name]
-            file_path = getattr(module, '__file__', 'Unknown file')
-            raise ValueError(f"A part with type '{part_type}' has already been registered for category '{category}' "
-                            f"by the class '{existing_class.__name__}' in file '{file_path}'.")
+            if module_name != part_class.__module__ or existing_class.__qualname__ != part_class.__qualname__:
+                module = sys.modules[module_name]
+                file_path = getattr(module, '__file__', 'Unknown file')
+                raise ValueError(f"A part with type '{part_type}' has already been registered for category '{category}' "
+                                f"by the class '{existing_class.__name__}' in file '{file_path}'.")
+            reloaded = True
+        parameters = PartFactoryMeta._extract_parameters(part_class)
+        fingerprint = part_fingerprint(part_class)
         cls.part_registry[category][part_type] = part_class
+        cls.part_parameters.setdefault(category, {})[part_type] = parameters
+        cls.part_fingerprints.setdefault(category, {})[part_type] = fingerprint
+        cls.part_detail_levels.setdefault(category, {})[part_type] = part_uses_module(part_class, FASTENER_HOLES_MODULE)
+        cls.part_var_keyword.setdefault(category, {})[part_type] = PartFactoryMeta._has_var_keyword(part_class)
+        if reloaded:
+            # Keys: (category, part_type, fingerprint, parameters); without fingerprint, the code can't be told apart
+            cls._cache.discard_if(lambda key: key[:2] == (category, part_type) and (key[2] != fingerprint or fingerprint is None))
+        # The module has been imported, the part isn't lazy anymore
+        cls.lazy_part_registry.get(category, {}).pop(part_type, None)
+
+    def register_lazy_part(cls, category: str, part_type: str, module_name: str) -> None:
+        """
+        Declare a part without importing the module defining it; the module is imported (and the part
+        registered for real, with @register_part) the first time the part is built or its parameters listed.
+        """
+        cls._register_category(category)
+        if part_type not in cls.part_registry[category]:
+            cls.lazy_part_registry.setdefault(category, {})[part_type] = module_name
+
+    def _register_category(cls, category: str) -> None:
+        if not category.isidentifier():
+            raise ValueError(f"'{category}' is not a valid category name. Category names should be valid Python identifiers.")
+        if category in cls.part_registry:
+            return
+        cls.part_registry[category] = {}
+        # Add the dynamic build method
+        method_name = f"build_{category.lower()}"
+        setattr(cls, method_name, cls._build_method(category))
+
+        # Add the dynamic spec method
+        spec_method_name = f"spec_{category.lower()}"
+        setattr(cls, spec_method_name, cls._spec_method(category))
+
+        # Add the dynamic method for listing available types
+        list_method_name = f"list_types_of_{category.lower()}"
+        setattr(cls, list_method_name, cls._list_types_method(category))
+
+        # Add the dynamic method for listing available parameters
+        list_params_method_name = f"list_parameters_for_{category.lower()}"
+        setattr(cls, list_params_method_name, cls._list_parameters_method(category))
+
+    @staticmethod
+    def _extract_parameters(part_class: Type[Part]) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Introspect the constructor of a part once, at registration time.
+
+        Returns a frozen tuple of (name, default value) in declaration order, where parts
+        without default value have NO_DEFAULT_VALUE_IDENTIFIER as default.
+        """
+        signature = inspect.signature(part_class.__init__)
+        if 'self' not in signature.parameters:
+            raise ValueError(f"The '__init__' method of '{part_class.__name__}' must contain a 'self' parameter.")
+        return tuple(
+            (name, param.default if param.default is not param.empty else PartFactoryMeta.NO_DEFAULT_VALUE_IDENTIFIER)
+            for name, param in signature.parameters.items()
+            if name != 'self' and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        )
+
+    @staticmethod
+    def _has_var_keyword(part_class: Type[Part]) -> bool:
+        return any(param.kind == param.VAR_KEYWORD for param in inspect.signature(part_class.__init__).parameters.values())
 
     @staticmethod
     def _build_method(category: str):
@@ -64,6 +139,13 @@ class PartFactoryMeta(type):
             return cls.build(category, **kwargs)
         return classmethod(method)
 
+    @staticmethod
+    def _spec_method(category: str):
+        """Generate a dynamic `spec_x` method for a given category."""
+        def method(cls, **kwargs: Any) -> PartSpec:
+            return cls.spec(category, **kwargs)
+        return classmethod(method)
+
     @staticmethod
     def _list_types_method(category: str):
         """Generate a dynamic `list_types_of_` method for a given category."""
@@ -80,22 +162,19 @@ class PartFactoryMeta(type):
         if the parameter has no default value, it'll show NO_DEFAULT_VALUE_IDENTIFIER ("(no default value)")
         """
         def method(cls, part_type=None) -> List[dict[str, Any]]:
-            part_class = cls.part_registry.get(category, {}).get(part_type or cls.default_types.get(category))
-            if not part_class:
+            part_type = part_type or cls._current_default_types().get(category)
+            if part_type in cls.lazy_part_registry.get(category, {}):
+                cls._load_part(category, part_type)
+            parameters = cls.part_parameters.get(category, {}).get(part_type)
+            if parameters is None:
                 available_part_types_method = getattr(cls, f"list_types_of_{category}", None)
                 available_part_types = available_part_types_method() if available_part_types_method else ["COULDN'T RETRIEVE"]
                 raise ValueError(f"Unknown part type '{part_type}' for category '{category}'. Available types: {available_part_types}.")
 
-            signature = inspect.signature(part_class.__init__)
-            parameters = signature.parameters.items()
-            if 'self' not in signature.parameters:
-                raise ValueError(f"The '__init__' method of '{part_class.__name__}' must contain a 'self' parameter.")
-            parameters = {name: param for name, param in parameters if name != 'self'}
-
             return [{
                 "name": name,
-                "default_value": param.default if param.default != param.empty else PartFactoryMeta.NO_DEFAULT_VALUE_IDENTIFIER
-            } for name, param in parameters.items()]
+                "default_value": default_value
+            } for name, default_value in parameters]
         return classmethod(method)
 
 
@@ -118,6 +197,8 @@ class PartFactory(PartsFactoryProtocol, metaclass=PartFactoryMeta):
     - List parameters for a part: `PartFactory.list_parameters_for_<category>(part_type="your type")`
         (part_type can be omitted using set_default_types as shown below)
     - Build a part using: `PartFactory.build_<category>(part_type="<some type>", ...args)`
+    - Get the size and footprints of a part without building it: `PartFactory.spec_<category>(part_type="<some type>", ...args)`
+      (same arguments as build_<category>; parts implementing a static `build_spec` don't need to build any geometry)
     - A default part type can be set for each category, this way, building the main components for your project is as simple as:
       ```
         from parts import PartFactory as pf
@@ -136,75 +217,518 @@ class PartFactory(PartsFactoryProtocol, metaclass=PartFactoryMeta):
         class My635JackPart(Part):
             [...]
       ```
+    - The parts shipped with the library are declared in parts/manifest.py, and their modules are only imported
+      the first time they're built (or their parameters listed); see register_lazy_part.
+    - The defaults can also be scoped, e.g. to build two enclosures concurrently (from threads or asyncio tasks)
+      with different settings; the defaults set globally still apply to anything the context doesn't override:
+      ```
+        with pf.context(types={"jack": "my 6.35"}, parameters={"enclosure_wall_thickness": 2}):
+            jack_part = pf.build_jack()
+      ```
+    - Parts are cached in memory for the duration of the session; to also keep them across sessions
+      (e.g. for CI jobs or notebook restarts), enable the on-disk cache:
+      ```
+        pf.set_disk_cache_dir("~/.cache/cq_enclosure_builder")
+      ```
+      (or set the CQ_ENCLOSURE_BUILDER_CACHE_DIR environment variable); it can be shared by concurrent processes.
+    - Warm the caches up before a run with `pf.prefetch("manifest.json")`, where the manifest lists the parts to build;
+      record it from a previous run with `pf.record_manifest("manifest.json")` (see build_manifest.py).
     """
 
     # Nested dictionary for part registration: {<category> {<type 1>: Class1, <type 2>: Class2}}
     part_registry: Dict[str, Dict[str, Type[Part]]] = {}
 
-    # Stores the default types for each category
+    # Parts declared in the manifest (parts/manifest.py) whose module hasn't been imported yet: {<category> {<type>: <module name>}}
+    lazy_part_registry: Dict[str, Dict[str, str]] = {}
+
+    # Constructor parameters of each registered part, captured by register_part: {<category> {<type>: ((<name>, <default>), ...)}}
+    part_parameters: Dict[str, Dict[str, Tuple[Tuple[str, Any], ...]]] = {}
+
+    # Fingerprint of the code of each registered part, part of the cache keys (see part_fingerprint.py): {<category> {<type>: <hash or None>}}
+    part_fingerprints: Dict[str, Dict[str, Union[str, None]]] = {}
+
+    # Whether each registered part makes screw holes, and so is built at the current level of detail (see detail_level.py): {<category> {<type>: <bool>}}
+    part_detail_levels: Dict[str, Dict[str, bool]] = {}
+
+    # Whether the constructor of each registered part takes **kwargs, and so accepts any parameter: {<category> {<type>: <bool>}}
+    part_var_keyword: Dict[str, Dict[str, bool]] = {}
+
+    # Stores the default types for each category (global; see context for scoped defaults)
     default_types: Dict[str, str] = {}
 
-    # Stores default parameters when building parts
+    # Stores default parameters when building parts (global; see context for scoped defaults)
     default_parameters: Dict[str, Any] = {}
 
-    _cache: Dict[Tuple[str, str, Tuple[Tuple[Any, Any]]], Part] = {}
+    # Keys: (category, part_type, fingerprint, hashable kwargs, detail level or None); unbounded by default, see set_cache_limits.
+    #   Shared by all contexts and threads (the keys contain the resolved defaults, so sharing is safe)
+    _cache: PartLruCache = PartLruCache()
+
+    # Optional persistent tier, checked when a part isn't in `_cache`; see set_disk_cache_dir
+    _disk_cache: Union[DiskPartCache, None] = (
+        DiskPartCache(os.path.expanduser(os.environ[CACHE_DIR_ENV_VAR])) if os.environ.get(CACHE_DIR_ENV_VAR) else None
+    )
+
+    # (directory, category, part_type, fingerprint) whose stale disk cache entries have been deleted during this session
+    _pruned_disk_entries: Set[Tuple[str, str, str, str]] = set()
+
+    # Builds, cache hits and build time per cache key; see build_report
+    build_stats: BuildStats = BuildStats()
+
+    # Parts built (or taken from a cache) during this session, with all their parameters; see save_manifest
+    #   Written from the threads of build_many and abuild, so guarded by `_lock`
+    _built_requests: Dict[Hashable, Tuple[str, str, Dict[str, Any]]] = {}
+
+    # Guards the state of the factory written from several threads (the caches have their own locks)
+    _lock: threading.RLock = threading.RLock()
+
+    # Runs the builds of abuild (and Enclosure.aassemble); None for the event loop's default executor, see set_executor
+    _executor: Union[Executor, None] = None
+
+    # Builds started by abuild that haven't completed yet, so that identical concurrent requests share them: {(<event loop>, <cache key>): <task>}
+    _in_flight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[Part]"] = {}
 
     @classmethod
     def build(cls, category: str, **kwargs: Any) -> Part:
-        """Generic build method based on category and part type."""
+        """
+        Generic build method based on category and part type.
+
+        With `lazy=True`, returns a LazyPart: the geometry is only built when first accessed
+        (or when the panel it's added to is assembled). Parts already in the memory cache are returned as is.
+
+        Parts making screw holes are built at the current level of detail (see detail_level.py), or at the one
+        passed as `detail_level`. Lazy parts without an explicit `detail_level` take the level current when they're
+        resolved, e.g. the one of the Panel or Enclosure assembling them.
+        """
+        lazy = kwargs.pop('lazy', False)
+        request = cls._resolve_build_request(category, kwargs)
+        if lazy:
+            return cls._build_lazy(request)
+
+        part_instance = cls._get_cached(request)
+        if part_instance is None:
+            part_instance = cls._build_locally(request)
+
+        cls._validate(request, part_instance)
+        cls._record_built(request)
+        return part_instance
+
+    @classmethod
+    def spec(cls, category: str, **kwargs: Any) -> PartSpec:
+        """
+        Size and footprints of a part, e.g. to compute a layout before building anything.
+
+        Uses the static `build_spec` of the part class when it defines one itself (all the built-in parts do; one
+        inherited from a base part is ignored); otherwise, the part is built (or taken from the cache).
+        """
+        request = cls._resolve_build_request(category, kwargs)
+        spec = cls._build_spec(request)
+        if spec is None:
+            spec = PartSpec.from_part(cls._build_requests([request])[0])
+        return spec
+
+    @classmethod
+    async def abuild(cls, category: str, **kwargs: Any) -> Part:
+        """
+        Same as `build`, without blocking the event loop: the part is built in the executor set with set_executor.
+
+        Concurrent calls for the same part (same cache key) share a single build. Cancelling a call only cancels
+        that call: the build itself is never cancelled, it completes in the background and its part is added to the cache.
+        """
+        request = cls._resolve_build_request(category, kwargs)
+        return await cls._abuild_request(request)
+
+    @classmethod
+    def set_executor(cls, executor: Union[Executor, None]) -> None:
+        """
+        Executor used by abuild and Enclosure.aassemble; None (the default) for the event loop's default
+        ThreadPoolExecutor. With a ProcessPoolExecutor, the parts are built in the worker processes and sent back
+        as BREP (as with build_many), and the assembly of enclosures runs in the default executor.
+        """
+        cls._executor = executor
+
+    @classmethod
+    async def _abuild_request(cls, request: "_BuildRequest") -> Part:
+        part_instance = cls._cache.get(request.cache_key)
+        if part_instance is not None:
+            cls.build_stats.record_hit(request.cache_key, request.category, request.part_type, request.kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            in_flight_key = (loop, request.cache_key)
+            task = cls._in_flight.get(in_flight_key)
+            if task is None:
+                task = loop.create_task(cls._build_in_executor(request))
+                cls._in_flight[in_flight_key] = task
+                task.add_done_callback(lambda done: cls._forget_in_flight(in_flight_key, done))
+            else:
+                cls.build_stats.record_hit(request.cache_key, request.category, request.part_type, request.kwargs)
+            # Shielded: cancelling this call leaves the build running for the other calls, and for the cache
+            part_instance = await asyncio.shield(task)
+        cls._validate(request, part_instance)
+        cls._record_built(request)
+        return part_instance
+
+    @classmethod
+    def _forget_in_flight(cls, in_flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: "asyncio.Task[Part]") -> None:
+        cls._in_flight.pop(in_flight_key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved, in case all the calls waiting for it were cancelled
+
+    @classmethod
+    async def _build_in_executor(cls, request: "_BuildRequest") -> Part:
+        """Look the part up in the caches, and build it if needed, without validating it."""
+        loop = asyncio.get_running_loop()
+        if isinstance(cls._executor, ProcessPoolExecutor):
+            part_instance = await cls.run_in_executor(cls._get_cached, request)
+            if part_instance is not None:
+                return part_instance
+            if not cls._can_build_in_worker(request):
+                return await cls.run_in_executor(cls._build_locally, request)
+            try:
+                meta, breps, build_time = await loop.run_in_executor(cls._executor, _build_serialized_part, request.part_class, request.kwargs, request.detail_level)
+                part_instance = deserialize_part(request.part_class, meta, breps)
+                cls._store_built(request, part_instance, build_time)
+            finally:
+                cls._release_disk_lock(request)
+            return part_instance
+        return (await cls.run_in_executor(cls._build_requests, [request], None, None, False))[0]
+
+    @classmethod
+    async def run_in_executor(cls, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run `func(*args)` in the executor set with set_executor (or in the default executor, if it's a ProcessPoolExecutor),
+        in a copy of the current context, so that PartFactory.context applies; e.g. to run code building parts
+        from a coroutine, as Enclosure.aassemble does.
+        """
+        executor = cls._executor if not isinstance(cls._executor, ProcessPoolExecutor) else None
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(executor, context.run, func, *args)
+
+    @classmethod
+    def build_many(
+        cls,
+        specs: List[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+        max_workers: Union[int, None] = None,
+        executor: Union[Executor, None] = None,
+    ) -> List[Part]:
+        """
+        Build several parts at once, constructing the ones that aren't cached in parallel on a process pool.
+
+        Each spec is either a dict with a `category` key and the parameters you'd pass to `build`
+        (e.g. `{"category": "jack", "part_type": "6.35mm PJ-612A", "enclosure_wall_thickness": 2}`),
+        or a `(category, kwargs)` tuple. Identical specs are only built once.
+        The parts are sent back from the workers serialized as BREP, and added to the cache.
+
+        Returns the parts in the same order as `specs`.
+        An existing `executor` can be reused, otherwise a ProcessPoolExecutor with `max_workers` is created.
+        """
+        requests: List[_BuildRequest] = []
+        for spec in specs:
+            if isinstance(spec, dict):
+                spec = dict(spec)
+                category = spec.pop("category")
+                kwargs = spec
+            else:
+                category, kwargs = spec[0], dict(spec[1])
+            requests.append(cls._resolve_build_request(category, kwargs))
+        return cls._build_requests(requests, max_workers, executor)
+
+    @classmethod
+    def prefetch(
+        cls,
+        manifest: Union[str, os.PathLike, List[Any]],
+        max_workers: Union[int, None] = None,
+        executor: Union[Executor, None] = None,
+    ) -> List[Part]:
+        """
+        Build all the parts listed in `manifest` (the path of a JSON or YAML manifest, or its list of entries; see build_manifest.py)
+        in parallel, using build_many, so that they're in the cache by the time they're needed.
+        A manifest of the parts of a previous run can be written with save_manifest or record_manifest.
+
+        The parts are added to the in-memory cache, and to the disk cache if enabled; the latter is what makes
+        `python -m cq_enclosure_builder prefetch` useful ahead of a batch of runs.
+        """
+        return cls.build_many(load_manifest(manifest), max_workers, executor)
+
+    @classmethod
+    def save_manifest(cls, path: Union[str, os.PathLike]) -> int:
+        """
+        Write the manifest of the parts built so far during this session (with all their parameters, defaults included),
+        to be passed to prefetch later. Returns the number of parts written.
+        """
+        with cls._lock:
+            built_requests = list(cls._built_requests.values())
+        return save_manifest(path, built_requests)
+
+    @classmethod
+    def record_manifest(cls, path: Union[str, os.PathLike]) -> None:
+        """Save the manifest of the parts built during this session to `path` when the interpreter exits."""
+        atexit.register(cls.save_manifest, path)
+
+    @classmethod
+    def _record_built(cls, request: "_BuildRequest") -> None:
+        with cls._lock:
+            if request.cache_key not in cls._built_requests:
+                kwargs = request.kwargs
+                if request.detail_level is not None:
+                    kwargs = {**kwargs, DETAIL_LEVEL_PARAMETER: request.detail_level}
+                cls._built_requests[request.cache_key] = (request.category, request.part_type, kwargs)
+
+    @classmethod
+    def _build_requests(
+        cls,
+        requests: List["_BuildRequest"],
+        max_workers: Union[int, None] = None,
+        executor: Union[Executor, None] = None,
+        validate: bool = True,
+    ) -> List[Part]:
+        parts: Dict[Hashable, Part] = {}
+        to_build: Dict[Hashable, _BuildRequest] = {}
+        # Being built by another process sharing the disk cache; waited for once our own builds are done,
+        #   so that we never wait for a lock while holding others
+        built_elsewhere: Dict[Hashable, _BuildRequest] = {}
+        for request in requests:
+            if request.cache_key in parts or request.cache_key in to_build or request.cache_key in built_elsewhere:
+                continue
+            part_instance = cls._get_cached(request, wait_for_lock=False)
+            if part_instance is not None:
+                parts[request.cache_key] = part_instance
+            elif request.disk_cache_key is not None and request.disk_lock is None:
+                built_elsewhere[request.cache_key] = request
+            else:
+                to_build[request.cache_key] = request
+
+        if len(to_build) == 1 or max_workers == 1:
+            for key, request in to_build.items():
+                parts[key] = cls._build_locally(request)
+        elif len(to_build) > 1:
+            own_executor = executor is None
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            try:
+                futures = {}
+                for key, request in to_build.items():
+                    if not cls._can_build_in_worker(request):
+                        continue
+                    futures[key] = executor.submit(_build_serialized_part, request.part_class, request.kwargs, request.detail_level)
+
+                for key, request in to_build.items():
+                    if key in futures:
+                        meta, breps, build_time = futures[key].result()
+                        parts[key] = deserialize_part(request.part_class, meta, breps)
+                    else:
+                        start_time = time.perf_counter()
+                        parts[key] = _construct_part(request.part_class, request.kwargs, request.detail_level)
+                        build_time = time.perf_counter() - start_time
+                    cls._store_built(request, parts[key], build_time)
+                    cls._release_disk_lock(request)
+            finally:
+                for request in to_build.values():
+                    cls._release_disk_lock(request)
+                if own_executor:
+                    executor.shutdown()
+
+        for key, request in built_elsewhere.items():
+            parts[key] = cls._get_cached(request)
+            if parts[key] is None:
+                parts[key] = cls._build_locally(request)  # the other process failed
+
+        if validate:
+            for request in requests:
+                cls._validate(request, parts[request.cache_key])
+                cls._record_built(request)
+        return [parts[request.cache_key] for request in requests]
+
+    @classmethod
+    def _resolve_build_request(cls, category: str, kwargs: Dict[str, Any]) -> "_BuildRequest":
+        """Find the part class, fill in the default parameters, and compute the cache key."""
         part_type = kwargs.pop('part_type', None)
         if not part_type:
-            part_type = cls.default_types.get(category)
+            part_type = cls._current_default_types().get(category)
             if not part_type:
                 raise ValueError(f"No part_type provided to build method, and no default provided for category '{category}'. See PartFactory#list_types_of_{category}. See PartFactory#set_default_types.")
 
         throw_on_validation_error = kwargs.pop('throw_on_validation_error', False)  # TODO set to True
+        explicit_detail_level = kwargs.get(DETAIL_LEVEL_PARAMETER) is not None
+        level = resolve_detail_level(kwargs.pop(DETAIL_LEVEL_PARAMETER, None))
 
         if category not in cls.part_registry:
             raise ValueError(f"Unknown part category: {category}")
 
-        if part_type not in cls.part_registry[category]:
+        if part_type not in cls.part_registry[category] and part_type not in cls.lazy_part_registry.get(category, {}):
             available_part_types_method = getattr(cls, f"list_types_of_{category}", None)
             available_part_types = available_part_types_method() if available_part_types_method else ["COULDN'T RETRIEVE"]
             raise ValueError(f"Unknown part type '{part_type}' for category '{category}'. Available types: {available_part_types}.")
+        part_class = cls._load_part(category, part_type)
 
-        # Check the required parameters for that builder using the dynamically generated method
-        method_name = f"list_parameters_for_{category.lower()}"
-        required_parameters = getattr(cls, method_name)(part_type)
+        # Check the required parameters for that builder, using the table captured by register_part
+        parameters = cls.part_parameters[category][part_type]
 
-        for param in required_parameters:
-            param_name = param["name"]
+        default_parameters = cls._current_default_parameters()
+        for param_name, default_value in parameters:
             if param_name not in kwargs:
-                if param_name in cls.default_parameters:
-                    kwargs[param_name] = cls.default_parameters[param_name]
-                elif param["default_value"] == PartFactoryMeta.NO_DEFAULT_VALUE_IDENTIFIER:
+                if param_name in default_parameters:
+                    kwargs[param_name] = default_parameters[param_name]
+                elif default_value is PartFactoryMeta.NO_DEFAULT_VALUE_IDENTIFIER:
                     raise ValueError(f"{category}.{part_type}: missing required parameter '{param_name}' and no default is set. See PartFactory#set_default_parameters.")
                 else:
                     # Adding the default value (from the __init__), because otherwise, not passing a value for a parameter that has a default value,
                     #   and passing a value with explictly the same value as the default value, would result in two different cache entries.
-                    kwargs[param_name] = param["default_value"]
+                    kwargs[param_name] = default_value
 
-        part_instance = None
+        known_parameters = [name for name, _ in parameters]
+        extra_parameters = [name for name in kwargs if name not in known_parameters]
+        if len(extra_parameters) > 0 and not cls.part_var_keyword[category][part_type]:
+            raise ValueError(f"{category}.{part_type}: unknown parameters {extra_parameters}. Available parameters: {known_parameters}.")
 
-        # We need to cache lookup after we've added the default params to the kwargs
+        # We need to cache lookup after we've added the default params to the kwargs;
+        #   the key follows the order of the parameters, so it doesn't depend on the order the kwargs were passed in
         hashable_kwargs = PartFactory.hash_kwargs(kwargs)
-        cache_key = (category, part_type, tuple(hashable_kwargs.items()))
-        if cache_key in cls._cache:
-            part_instance = cls._cache[cache_key]
-        else:
-            part_instance = cls.part_registry[category][part_type](**kwargs)
-            cls._cache[cache_key] = part_instance
+        fingerprint = cls.part_fingerprints[category][part_type]
+        if not cls.part_detail_levels[category][part_type]:
+            level = None  # no screw holes, same part at every level
+        # Parameters going to **kwargs come after the named ones, by name
+        key_parameters = known_parameters + sorted(extra_parameters)
+        cache_key = (category, part_type, fingerprint, tuple((name, hashable_kwargs[name]) for name in key_parameters), level)
+        if level is not None:
+            hashable_kwargs[DETAIL_LEVEL_PARAMETER] = canonical_key(level)  # for the disk cache key
+        return _BuildRequest(category, part_type, part_class, kwargs, hashable_kwargs, fingerprint, cache_key,
+                             throw_on_validation_error, level, explicit_detail_level)
+
+    @classmethod
+    def _with_current_detail_level(cls, request: "_BuildRequest") -> "_BuildRequest":
+        """`request` (of a lazy part) at the level of detail current when it's resolved, unless its level was explicit."""
+        if request.detail_level is None or request.explicit_detail_level or request.detail_level == get_detail_level():
+            return request
+        kwargs = {**request.kwargs, 'part_type': request.part_type, 'throw_on_validation_error': request.throw_on_validation_error}
+        return cls._resolve_build_request(request.category, kwargs)
+
+    @classmethod
+    def _build_lazy(cls, request: "_BuildRequest") -> Union[Part, LazyPart]:
+        part_instance = cls._cache.get(request.cache_key)
+        if part_instance is not None:
+            cls.build_stats.record_hit(request.cache_key, request.category, request.part_type, request.kwargs)
+            cls._validate(request, part_instance)
+            cls._record_built(request)
+            return part_instance
+
+        footprints = None
+        spec = cls._build_spec(request)
+        if spec is not None:
+            footprints = vars(spec)
+        elif cls._disk_cache is not None:
+            disk_cache_key = DiskPartCache.build_key(request.category, request.part_type, request.hashable_kwargs, request.fingerprint)
+            meta = cls._disk_cache.load_meta(disk_cache_key) if disk_cache_key is not None else None
+            if meta is not None:
+                footprints = footprints_from_meta(meta)
+        return LazyPart(cls, request, footprints)
+
+    @staticmethod
+    def _build_spec(request: "_BuildRequest") -> Union[PartSpec, None]:
+        # Only the part's own build_spec: one inherited from a base part would describe the base part, not this one
+        if "build_spec" not in vars(request.part_class):
+            return None
+        return request.part_class.build_spec(**request.kwargs)
+
+    @classmethod
+    def _load_part(cls, category: str, part_type: str) -> Type[Part]:
+        """Return the class of a part, importing its module first if it's still lazy."""
+        module_name = cls.lazy_part_registry.get(category, {}).get(part_type)
+        if module_name is not None:
+            importlib.import_module(module_name)
+            if part_type in cls.lazy_part_registry.get(category, {}):
+                raise ValueError(f"Module '{module_name}' doesn't register the part type '{part_type}' for category '{category}'; check parts/manifest.py.")
+        return cls.part_registry[category][part_type]
+
+    @classmethod
+    def _get_cached(cls, request: "_BuildRequest", wait_for_lock: bool = True) -> Union[Part, None]:
+        """
+        Look the part up in the memory cache, then in the disk cache (if enabled).
 
+        On a disk cache miss, takes the lock for the part's key (`request.disk_lock`, released by _build_locally
+        or _release_disk_lock), waiting for any other process building it first; with `wait_for_lock=False`,
+        returns None without the lock if another process is building it.
+        """
+        part_instance = cls._cache.get(request.cache_key)
+        if part_instance is not None:
+            cls.build_stats.record_hit(request.cache_key, request.category, request.part_type, request.kwargs)
+            return part_instance
+
+        disk_cache = cls._disk_cache
+        if disk_cache is not None:
+            request.disk_cache_key = DiskPartCache.build_key(request.category, request.part_type, request.hashable_kwargs, request.fingerprint)
+            if request.disk_cache_key is not None:
+                request.disk_cache = disk_cache
+                part_instance = disk_cache.load(request.disk_cache_key, request.part_class)
+                if part_instance is None and disk_cache.acquire(request.disk_cache_key, wait=wait_for_lock):
+                    request.disk_lock = disk_cache
+                    # Double-checked: the part may have been stored between the first lookup and the lock
+                    part_instance = disk_cache.load(request.disk_cache_key, request.part_class)
+                    if part_instance is not None:
+                        cls._release_disk_lock(request)
+                elif part_instance is None and wait_for_lock:
+                    # Built by another process while we were waiting
+                    part_instance = disk_cache.load(request.disk_cache_key, request.part_class)
+        if part_instance is not None:
+            cls.build_stats.record_hit(request.cache_key, request.category, request.part_type, request.kwargs, from_disk=True)
+            cls._cache.put(request.cache_key, part_instance)
+        return part_instance
+
+    @classmethod
+    def _build_locally(cls, request: "_BuildRequest") -> Part:
+        """Build a part in this process, and add it to the caches."""
+        try:
+            start_time = time.perf_counter()
+            part_instance = _construct_part(request.part_class, request.kwargs, request.detail_level)
+            cls._store_built(request, part_instance, time.perf_counter() - start_time)
+        finally:
+            cls._release_disk_lock(request)
+        return part_instance
+
+    @staticmethod
+    def _can_build_in_worker(request: "_BuildRequest") -> bool:
+        """Whether the part class and its parameters can be sent to a worker process; warns if they can't (e.g. lambdas)."""
+        try:
+            pickle.dumps((request.part_class, request.kwargs))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            print(f"WARNING: {request.category}/{request.part_type} can't be built in a worker process ({e}); building it in this process.")
+            return False
+        return True
+
+    @staticmethod
+    def _release_disk_lock(request: "_BuildRequest") -> None:
+        if request.disk_lock is not None:
+            request.disk_lock.release(request.disk_cache_key)
+            request.disk_lock = None
+
+    @classmethod
+    def _store_built(cls, request: "_BuildRequest", part_instance: Part, build_time: float) -> None:
+        """Add a freshly built part to the caches, and record its build statistics."""
+        geometry_bytes = None
+        if request.disk_cache_key is not None:
+            disk_cache = request.disk_cache
+            geometry_bytes = disk_cache.store(request.disk_cache_key, part_instance, request.category, request.part_type, request.fingerprint)
+            pruned_key = (disk_cache.directory, request.category, request.part_type, request.fingerprint)
+            if pruned_key not in cls._pruned_disk_entries:
+                # A part was built, so the entries for this part type may be from an older version of its code
+                cls._pruned_disk_entries.add(pruned_key)
+                disk_cache.prune(request.category, request.part_type, request.fingerprint)
+        cls._cache.put(request.cache_key, part_instance)
+        if geometry_bytes is None:
+            geometry_bytes = cls._cache.size_of(request.cache_key)
+        if geometry_bytes is None and cls.build_stats.record_geometry_size:
+            geometry_bytes = estimate_part_bytes(part_instance)
+        cls.build_stats.record_build(request.cache_key, request.category, request.part_type, request.kwargs, build_time, geometry_bytes)
+
+    @staticmethod
+    def _validate(request: "_BuildRequest", part_instance: Part) -> None:
         errors = part_instance.validate()
         if len(errors) > 0:
-            message = f"Part {category}/{part_type} failed the validation: {str(errors)}"
-            if throw_on_validation_error:
+            message = f"Part {request.category}/{request.part_type} failed the validation: {str(errors)}"
+            if request.throw_on_validation_error:
                 raise ValueError(message)
             else:
                 print("WARNING: " + message)
 
-        return part_instance
-
     @classmethod
     def list_categories(cls) -> List[str]:
         """List all registered categories."""
@@ -212,12 +736,53 @@ class PartFactory(PartsFactoryProtocol, metaclass=PartFactoryMeta):
 
     @classmethod
     def list_types_for_category(cls, category: str) -> List[str]:
-        """List all registered types for a given category."""
-        return list(cls.part_registry.get(category, {}).keys())
+        """List all registered types for a given category (including the ones whose module isn't imported yet)."""
+        return list(cls.part_registry.get(category, {}).keys()) + list(cls.lazy_part_registry.get(category, {}).keys())
+
+    @classmethod
+    @contextlib.contextmanager
+    def context(cls, types: Union[Dict[str, str], None] = None, parameters: Union[Dict[str, Any], None] = None) -> Iterator[None]:
+        """
+        Scope in which `types` and `parameters` are added to the default types and parameters, without affecting
+        other threads or asyncio tasks. Contexts can be nested; calling the `set_default_*` methods within
+        a context only changes the defaults of that context.
+        """
+        types = types or {}
+        cls._check_default_types(types)
+        enclosing = _scoped_defaults.get()
+        scope = _ScopedDefaults(
+            {**(enclosing.types if enclosing is not None else {}), **types},
+            {**(enclosing.parameters if enclosing is not None else {}), **(parameters or {})},
+        )
+        token = _scoped_defaults.set(scope)
+        try:
+            yield
+        finally:
+            _scoped_defaults.reset(token)
+
+    @classmethod
+    def _current_default_types(cls) -> Dict[str, str]:
+        scope = _scoped_defaults.get()
+        return cls.default_types if scope is None else {**cls.default_types, **scope.types}
+
+    @classmethod
+    def _current_default_parameters(cls) -> Dict[str, Any]:
+        scope = _scoped_defaults.get()
+        return cls.default_parameters if scope is None else {**cls.default_parameters, **scope.parameters}
 
     @classmethod
     def set_default_types(cls, defaults: Dict[str, str]) -> None:
-        """Sets the default part type for each category."""
+        """Sets the default part type for each category (only for the current context, if within one)."""
+        cls._check_default_types(defaults)
+        scope = _scoped_defaults.get()
+        if scope is not None:
+            # A new scope rather than an update, as the current one may be shared with tasks started within the context
+            _scoped_defaults.set(_ScopedDefaults({**scope.types, **defaults}, scope.parameters))
+        else:
+            cls.default_types.update(defaults)
+
+    @classmethod
+    def _check_default_types(cls, defaults: Dict[str, str]) -> None:
         available_categories = cls.list_categories()
 
         for category, part_type in defaults.items():
@@ -229,12 +794,14 @@ class PartFactory(PartsFactoryProtocol, metaclass=PartFactoryMeta):
             if part_type not in available_part_types:
                 raise ValueError(f"Unknown part type '{part_type}' for category '{category}'. Available types: {available_part_types}.")
 
-        cls.default_types.update(defaults)
-
     @classmethod
     def set_default_parameters(cls, defaults: Dict[str, Any]) -> None:
-        """Sets the default parameters for parts."""
-        cls.default_parameters.update(defaults)
+        """Sets the default parameters for parts (only for the current context, if within one)."""
+        scope = _scoped_defaults.get()
+        if scope is not None:
+            _scoped_defaults.set(_ScopedDefaults(scope.types, {**scope.parameters, **defaults}))
+        else:
+            cls.default_parameters.update(defaults)
 
     @classmethod
     def set_panel_size(cls, panel_size: PanelSize) -> None:
@@ -248,16 +815,128 @@ class PartFactory(PartsFactoryProtocol, metaclass=PartFactoryMeta):
         cls.set_default_types(defaults["types"])
         cls.set_default_parameters(defaults["parameters"])
 
+    @classmethod
+    def set_cache_limits(cls, max_entries: Union[int, None] = None, max_bytes: Union[int, None] = None) -> None:
+        """
+        Bound the in-memory cache; least recently used parts are evicted first. None means no limit.
+        `max_bytes` is compared to the size of the parts once serialized as BREP (an estimate of their memory use).
+        """
+        cls._cache.set_limits(max_entries, max_bytes)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Empty the in-memory cache, and the caches of the helpers of the parts (e.g. the blocks of ScrewBlock);
+        the on-disk cache, if any, is left untouched.
+        """
+        cls._cache.clear()
+        clear_helper_caches()
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Hits, misses, evictions, and current size of the in-memory cache."""
+        return cls._cache.info()
+
+    @classmethod
+    def build_report(cls, format: str = "table", sort_by: str = "total_build_time") -> str:
+        """
+        Report of the number of builds, cache hits and build time per part and parameters, as a `table` or `json`.
+        Set `PartFactory.build_stats.record_geometry_size = True` to also measure the size of each part.
+        """
+        return cls.build_stats.report(format, sort_by)
+
+    @classmethod
+    def set_disk_cache_dir(cls, directory: Union[str, None], lock_stale_after: float = LOCK_STALE_AFTER) -> None:
+        """
+        Enable the persistent cache, storing built parts as BREP files (plus a JSON sidecar) in `directory`.
+        Entries are keyed on the category, part type, parameters, and the fingerprint of the part's code (see part_fingerprint.py);
+        entries built from an older version of a part are deleted the next time it's built (or with prune_disk_cache).
+        Pass None to disable it.
+
+        The directory can be shared by several processes (e.g. the workers of a parameter sweep): each part is only built
+        by one of them, the others wait for it and load it. If the builder crashed, its lock is taken over as soon as its process
+        is gone, or, for a builder on another host (e.g. a network drive), after `lock_stale_after` seconds.
+        It defaults to the value of the CQ_ENCLOSURE_BUILDER_CACHE_DIR environment variable, if set.
+        """
+        cls._disk_cache = DiskPartCache(os.path.expanduser(directory), lock_stale_after) if directory is not None else None
+
+    @classmethod
+    def prune_disk_cache(cls) -> int:
+        """
+        Delete the entries of the disk cache built from another version of the code of their part, including the parts
+        not built during this session (see set_disk_cache_dir); imports all the registered parts to compute their fingerprint.
+        Returns the number of entries deleted.
+        """
+        if cls._disk_cache is None:
+            raise ValueError("The disk cache isn't enabled; see set_disk_cache_dir.")
+        pruned = 0
+        for category in set(cls.part_registry.keys()) | set(cls.lazy_part_registry.keys()):
+            for part_type in cls.list_types_for_category(category):
+                cls._load_part(category, part_type)
+                fingerprint = cls.part_fingerprints[category][part_type]
+                if fingerprint is not None:
+                    pruned += cls._disk_cache.prune(category, part_type, fingerprint)
+        return pruned
+
+    @classmethod
+    def register_key_encoder(cls, value_type: Type, encoder: Callable[[Any], Any]) -> None:
+        """
+        Tell the cache how to compare a custom parameter type by value; `encoder` returns a representation
+        of the parameter made of basic types (lists, dicts, floats, etc.). See cache_key.py.
+        """
+        register_key_encoder(value_type, encoder)
+
     @staticmethod
     def hash_kwargs(kwargs):
-        hashable_kwargs = {}
-        for k, v in kwargs.items():
-            if isinstance(v, list):
-                v = tuple(v)
-            elif isinstance(v, dict):
-                v = PartFactory.hash_kwargs(v)
-            hashable_kwargs[k] = v
-        return hashable_kwargs
+        """Canonical, value-based version of the parameters, used for the cache keys (see cache_key.py)."""
+        return {k: canonical_key(v) for k, v in kwargs.items()}
+
+
+class _ScopedDefaults:
+    """Default types and parameters of a PartFactory.context, applied on top of the global ones."""
+
+    def __init__(self, types: Dict[str, str], parameters: Dict[str, Any]):
+        self.types = types
+        self.parameters = parameters
+
+
+# Innermost PartFactory.context of the current thread or asyncio task; None outside of any context
+_scoped_defaults: ContextVar[Union[_ScopedDefaults, None]] = ContextVar("cq_enclosure_builder_scoped_defaults", default=None)
+
+
+class _BuildRequest:
+    """A call to PartFactory.build, with the part class and all its parameters resolved."""
+
+    def __init__(self, category: str, part_type: str, part_class: Type[Part], kwargs: Dict[str, Any],
+                 hashable_kwargs: Dict[str, Hashable], fingerprint: Union[str, None], cache_key: Hashable,
+                 throw_on_validation_error: bool, detail_level: Union[DetailLevel, None], explicit_detail_level: bool):
+        self.category = category
+        self.part_type = part_type
+        self.part_class = part_class
+        self.kwargs = kwargs
+        self.hashable_kwargs = hashable_kwargs
+        self.fingerprint = fingerprint
+        self.cache_key = cache_key
+        self.throw_on_validation_error = throw_on_validation_error
+        self.detail_level = detail_level  # None if the part doesn't make screw holes
+        self.explicit_detail_level = explicit_detail_level
+        self.disk_cache_key: Union[str, None] = None  # only set when the disk cache is enabled
+        self.disk_cache: Union[DiskPartCache, None] = None  # the disk cache `disk_cache_key` applies to
+        self.disk_lock: Union[DiskPartCache, None] = None  # set while this process holds the lock for building the part
+
+
+def _construct_part(part_class: Type[Part], kwargs: Dict[str, Any], level: Union[DetailLevel, None]) -> Part:
+    with detail_level(level):
+        return part_class(**kwargs)
+
+
+def _build_serialized_part(part_class: Type[Part], kwargs: Dict[str, Any], level: Union[DetailLevel, None]) -> Tuple[Dict[str, Any], Dict[str, bytes], float]:
+    """Runs in a worker process of PartFactory.build_many; the part is sent back as BREP (see part_cache.py)."""
+    start_time = time.perf_counter()
+    part_instance = _construct_part(part_class, kwargs, level)
+    build_time = time.perf_counter() - start_time
+    meta, breps = serialize_part(part_instance)
+    return meta, breps, build_time
 
 
 def register_part(category: str, part_type: str) -> Callable[[Type[Part]], Type[Part]]:
@@ -266,3 +945,8 @@ def register_part(category: str, part_type: str) -> Callable[[Type[Part]], Type[
         PartFactory.register_part(category, part_type, cls)
         return cls
     return decorator
+
+
+for _category, _part_types in PARTS_MANIFEST.items():
+    for _part_type, _module_name in _part_types.items():
+        PartFactory.register_lazy_part(_category, _part_type, _module_name)
@@ -15,7 +15,10 @@
 """
 
 import cadquery as cq
-from typing import Optional
+from OCP.gp import gp_Trsf
+from typing import Iterable, List, Optional, Tuple, Union
+
+from cq_enclosure_builder.boolean_options import BooleanOptions, DEFAULT_BOOLEAN_OPTIONS
 
 def scale(workplane: cq.Workplane, x: float, y: Optional[float] = None, z: Optional[float] = None) -> cq.Workplane:
     y = y if y is not None else x
@@ -29,4 +32,69 @@ def scale(workplane: cq.Workplane, x: float, y: Optional[float] = None, z: Optio
     return workplane.newObject([
         o.transformGeometry(t) if isinstance(o, cq.Shape) else o
         for o in workplane.objects
-    ])
\ No newline at end of file
+    ])
+
+def moved(workplane: cq.Workplane, location: cq.Location) -> cq.Workplane:
+    """
+    New workplane with the shapes of `workplane` placed at `location`; unlike translate/rotate, the geometry isn't copied,
+    the new shapes are instances of the same ones.
+    """
+    return workplane.newObject([
+        o.moved(location) if isinstance(o, cq.Shape) else o
+        for o in workplane.objects
+    ])
+
+def transformed(workplane: Union[cq.Workplane, cq.Shape], trsf: gp_Trsf) -> Union[cq.Workplane, cq.Shape]:
+    """
+    `workplane` (a workplane, or a bare shape) transformed by `trsf`, at the cost of a single copy of each shape however
+    many translations, rotations, and mirrors `trsf` is made of. Like `mirror`, only the shapes are kept; if there are
+    none on the stack, the solid found in the parent chain is transformed.
+    """
+    matrix = cq.Matrix(trsf)
+    if isinstance(workplane, cq.Shape):
+        return workplane.transformShape(matrix)
+    shapes = [o for o in workplane.objects if isinstance(o, cq.Shape)]
+    if len(shapes) == 0:
+        try:
+            shapes = [workplane.findSolid(searchStack=True, searchParents=True)]
+        except ValueError:  # nothing to transform
+            pass
+    return workplane.newObject([shape.transformShape(matrix) for shape in shapes])
+
+def translated(workplane: cq.Workplane, offset: Tuple[float, float, float]) -> cq.Workplane:
+    """Same as `workplane.translate(offset)`, but without copying the geometry; see `moved`."""
+    return moved(workplane, cq.Location(cq.Vector(*offset)))
+
+def instances(workplane: cq.Workplane, locations: Iterable[cq.Location]) -> List[cq.Shape]:
+    """The shapes of `workplane` placed at each of `locations`, without copying the geometry; see `moved`."""
+    shapes = [o for o in workplane.objects if isinstance(o, cq.Shape)]
+    return [shape.moved(location) for location in locations for shape in shapes]
+
+def cut_all(
+    workplane: cq.Workplane,
+    tools: Iterable[cq.Workplane],
+    options: Union[BooleanOptions, None] = None,  # None -> DEFAULT_BOOLEAN_OPTIONS
+) -> cq.Workplane:
+    """
+    Same as cutting each of `tools` from `workplane` in turn, but with a single boolean operation (one BRepAlgoAPI_Cut
+    with all the tools), so that the solid doesn't get more complex, and slower to cut, after each tool.
+    """
+    shapes = [o for tool in tools for o in tool.objects if isinstance(o, cq.Shape)]
+    if len(shapes) == 0:
+        return workplane
+    options = options if options is not None else DEFAULT_BOOLEAN_OPTIONS
+    solid = workplane.findSolid(searchStack=True, searchParents=True)
+    return workplane.newObject([options.cut(solid, shapes).clean()])
+
+def overlaps(a: cq.Workplane, b: cq.Workplane) -> bool:
+    """Whether the bounding boxes of the shapes of `a` and `b` intersect."""
+    boxes = []
+    for workplane in (a, b):
+        shapes = [o for o in workplane.objects if isinstance(o, cq.Shape)]
+        if len(shapes) == 0:
+            return False
+        boxes.append(cq.Compound.makeCompound(shapes).BoundingBox())
+    box_a, box_b = boxes
+    return (box_a.xmin <= box_b.xmax and box_b.xmin <= box_a.xmax
+            and box_a.ymin <= box_b.ymax and box_b.ymin <= box_a.ymax
+            and box_a.zmin <= box_b.zmax and box_b.zmin <= box_a.zmax)
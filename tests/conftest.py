@@ -0,0 +1,35 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import pytest
+
+import cq_warehouse.extensions  # Assembly.translate, used by Panel.assemble
+
+from cq_enclosure_builder import PartFactory
+
+
+@pytest.fixture(autouse=True)
+def isolated_part_factory():
+    """Each test starts with empty caches, no disk cache, and no cache limits."""
+    disk_cache = PartFactory._disk_cache
+    PartFactory.set_disk_cache_dir(None)
+    PartFactory.clear_cache()
+    PartFactory._pruned_disk_entries.clear()
+    PartFactory.build_stats.reset()
+    yield
+    PartFactory.clear_cache()
+    PartFactory.set_cache_limits(None, None)
+    PartFactory._disk_cache = disk_cache
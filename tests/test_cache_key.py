@@ -0,0 +1,91 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import gc
+import weakref
+import dataclasses
+
+from cq_enclosure_builder.cache_key import canonical_key, is_persistable, register_key_encoder
+
+
+class Knob:
+    def __init__(self, diameter, height):
+        self.diameter = diameter
+        self.height = height
+
+
+@dataclasses.dataclass
+class Cap:
+    diameter: float
+
+
+class Millimetres:
+    def __init__(self, value):
+        self._value = value
+
+
+def test_values_equal_by_value_share_a_key():
+    assert canonical_key(Knob(18, 10.5)) == canonical_key(Knob(18, 10.5))
+    assert canonical_key(Knob(18, 10.5)) != canonical_key(Knob(18, 11))
+    assert canonical_key(Cap(18)) == canonical_key(Cap(18.0))
+    assert canonical_key({"a": 1, "b": [1, 2]}) == canonical_key({"b": (1, 2), "a": 1})
+    assert canonical_key({1, 2, 3}) == canonical_key(frozenset({3, 2, 1}))
+
+
+def test_floats_are_normalized():
+    assert canonical_key(0.1 + 0.2) == canonical_key(0.3)
+    assert canonical_key(-0.0) == canonical_key(0.0)
+
+
+def test_value_keys_are_persistable():
+    assert is_persistable(canonical_key((1, 2.5, "a", None, Knob(1, 2), Cap(3))))
+
+
+def test_lambdas_are_keyed_by_identity_and_never_persisted():
+    callback = lambda: 1
+    assert canonical_key(callback) == canonical_key(callback)
+    assert canonical_key(callback) != canonical_key(lambda: 1)
+    assert not is_persistable(canonical_key(callback))
+    assert not is_persistable(canonical_key([1, callback]))
+
+
+def test_objects_only_hashable_by_identity_are_never_persisted():
+    value = object()
+    assert canonical_key(value) == canonical_key(value)
+    assert canonical_key(value) != canonical_key(object())
+    assert not is_persistable(canonical_key(value))
+
+
+def test_identity_keys_release_their_value_with_the_key():
+    callback = lambda: 1
+    reference = weakref.ref(callback)
+    key = canonical_key(callback)
+    del callback
+    gc.collect()
+    assert reference() is not None  # kept alive by the key
+    del key
+    gc.collect()
+    assert reference() is None
+
+
+def test_custom_encoders_apply_to_subclasses():
+    class Inches(Millimetres):
+        pass
+
+    register_key_encoder(Millimetres, lambda value: value._value)
+    assert canonical_key(Inches(2)) == canonical_key(Inches(2.0))
+    assert canonical_key(Inches(2)) != canonical_key(Inches(3))
+    assert is_persistable(canonical_key(Inches(2)))
@@ -0,0 +1,192 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import threading
+import subprocess
+import multiprocessing
+
+import pytest
+
+from cq_enclosure_builder import PartFactory
+from cq_enclosure_builder.part_cache import META_FILE_NAME, DiskPartCache
+
+
+def build_vent(thickness: float):
+    return PartFactory.build("air_vent", part_type="basic rectangular", enclosure_wall_thickness=thickness)
+
+
+def entry_keys(disk_cache):
+    return sorted(os.listdir(disk_cache._index_dir("air_vent", "basic rectangular")))
+
+
+def edit_meta(disk_cache, key, **changes):
+    meta_path = os.path.join(disk_cache._entry_dir(key), META_FILE_NAME)
+    with open(meta_path, "r") as f:
+        meta = json.load(f)
+    meta.update(changes)
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+
+def test_built_parts_are_loaded_from_disk(tmp_path):
+    PartFactory.set_disk_cache_dir(str(tmp_path))
+    built = build_vent(2)
+    PartFactory.clear_cache()
+    loaded = build_vent(2)
+    assert loaded is not built
+    assert loaded.part.val().Volume() == pytest.approx(built.part.val().Volume())
+    assert [entry.disk_hits for entry in PartFactory.build_stats.entries()] == [1]
+
+
+def test_stale_entries_are_pruned_on_the_next_build(tmp_path):
+    PartFactory.set_disk_cache_dir(str(tmp_path))
+    disk_cache = PartFactory._disk_cache
+    build_vent(2)
+    build_vent(3)
+    build_vent(4)
+    stale, other_version, unreadable = entry_keys(disk_cache)
+    edit_meta(disk_cache, stale, fingerprint="older code")
+    edit_meta(disk_cache, other_version, fingerprint="older code", package_version="another version")
+    edit_meta(disk_cache, unreadable, format_version=-1)
+
+    # A new session building the part again
+    PartFactory._pruned_disk_entries.clear()
+    PartFactory.clear_cache()
+    build_vent(5)
+
+    remaining = entry_keys(disk_cache)
+    assert stale not in remaining and not os.path.exists(disk_cache._entry_dir(stale))
+    assert other_version in remaining and unreadable in remaining
+    assert os.path.exists(disk_cache._entry_dir(unreadable))
+    assert len(remaining) == 3
+
+
+def test_prune_disk_cache_covers_parts_not_built(tmp_path):
+    PartFactory.set_disk_cache_dir(str(tmp_path))
+    disk_cache = PartFactory._disk_cache
+    build_vent(2)
+    (key,) = entry_keys(disk_cache)
+    edit_meta(disk_cache, key, fingerprint="older code")
+    assert PartFactory.prune_disk_cache() == 1
+    assert entry_keys(disk_cache) == []
+
+
+def write_lock(disk_cache, key, host, pid, age=0.0):
+    lock_path = disk_cache._lock_path(key)
+    with open(lock_path, "w") as f:
+        json.dump({"host": host, "pid": pid}, f)
+    if age > 0:
+        mtime = os.path.getmtime(lock_path) - age
+        os.utime(lock_path, (mtime, mtime))
+    return lock_path
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_lock_of_a_live_process_is_never_stale(tmp_path):
+    disk_cache = DiskPartCache(str(tmp_path), lock_stale_after=1)
+    lock_path = write_lock(disk_cache, "key", socket.gethostname(), os.getpid(), age=3600)
+    assert not disk_cache._is_stale(lock_path)
+    assert not disk_cache.acquire("key", wait=False)
+
+
+def test_lock_of_a_dead_process_is_stale_at_once(tmp_path):
+    disk_cache = DiskPartCache(str(tmp_path), lock_stale_after=3600)
+    write_lock(disk_cache, "key", socket.gethostname(), dead_pid())
+    assert disk_cache.acquire("key", wait=False)
+
+
+def test_lock_of_another_host_is_stale_after_lock_stale_after(tmp_path):
+    disk_cache = DiskPartCache(str(tmp_path), lock_stale_after=60)
+    lock_path = write_lock(disk_cache, "key", "another-host", 1)
+    assert not disk_cache._is_stale(lock_path)
+    write_lock(disk_cache, "key", "another-host", 1, age=120)
+    assert disk_cache._is_stale(lock_path)
+
+
+def hold_lock(directory, key, hold=0.05):
+    """Take the lock for `key`, hold it for `hold` seconds, and record when it was held, in a file of its own."""
+    disk_cache = DiskPartCache(directory, lock_stale_after=0.2)
+    assert disk_cache.acquire(key)
+    start = time.time()
+    time.sleep(hold)
+    end = time.time()
+    with open(os.path.join(directory, f"held-{os.getpid()}-{threading.get_ident()}"), "w") as f:
+        f.write(f"{start} {end}")
+    disk_cache.release(key)
+
+
+def hold_lock_in_threads(directory, key, threads):
+    workers = [threading.Thread(target=hold_lock, args=(directory, key)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def test_stale_lock_is_taken_over_by_one_waiter_at_a_time(tmp_path):
+    directory = str(tmp_path)
+    disk_cache = DiskPartCache(directory, lock_stale_after=0.2)
+    write_lock(disk_cache, "key", "another-host", 1, age=60)
+
+    processes = [multiprocessing.Process(target=hold_lock_in_threads, args=(directory, "key", 2)) for _ in range(3)]
+    for process in processes:
+        process.start()
+    hold_lock_in_threads(directory, "key", 2)
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    held = []
+    for name in os.listdir(directory):
+        if name.startswith("held-"):
+            with open(os.path.join(directory, name)) as f:
+                held.append(tuple(float(t) for t in f.read().split()))
+    held.sort()
+    assert len(held) == 8
+    for (_, previous_end), (start, _) in zip(held, held[1:]):
+        assert start >= previous_end  # never held by two waiters at once
+    assert os.listdir(os.path.join(directory, ".locks")) == []
+
+
+def test_lock_taken_after_being_found_stale_is_put_back(tmp_path):
+    disk_cache = DiskPartCache(str(tmp_path), lock_stale_after=0.2)
+    lock_path = write_lock(disk_cache, "key", "another-host", 1, age=60)
+    assert disk_cache._is_stale(lock_path)
+    # Taken over by another waiter, which then took the lock, before this one breaks it
+    os.remove(lock_path)
+    assert disk_cache.acquire("key", wait=False)
+    disk_cache._break_stale_lock(lock_path)
+    assert os.path.exists(lock_path)
+    disk_cache.release("key")
+    assert not os.path.exists(lock_path)
+
+
+def test_release_leaves_the_lock_of_another_process_alone(tmp_path):
+    disk_cache = DiskPartCache(str(tmp_path))
+    assert disk_cache.acquire("key")
+    lock_path = write_lock(disk_cache, "key", "another-host", 1)  # e.g. taken over after a link-back failure
+    disk_cache.release("key")
+    assert os.path.exists(lock_path)
@@ -0,0 +1,75 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import math
+
+import pytest
+
+from cq_enclosure_builder.footprint_index import FootprintIndex, intersects, distance, MASK, INSIDE
+
+
+def test_touching_rectangles_dont_intersect():
+    assert intersects((0, 0, 10, 10), (5, 5, 15, 15))
+    assert not intersects((0, 0, 10, 10), (10, 0, 20, 10))
+
+
+def test_distance():
+    assert distance((0, 0, 10, 10), (13, 0, 20, 10)) == 3
+    assert distance((0, 0, 10, 10), (13, 14, 20, 20)) == 5
+    assert distance((0, 0, 10, 10), (8, 0, 20, 10)) == -2
+
+
+def test_query_only_matches_rectangles_of_the_same_kind():
+    index = FootprintIndex(cell_size=10)
+    index.insert("a", "A", {MASK: (0, 0, 10, 10), INSIDE: (-5, -5, 15, 15)})
+    index.insert("b", "B", {MASK: (50, 50, 60, 60)})
+    assert index.query((5, 5, 6, 6)) == [("a", "A", MASK), ("a", "A", INSIDE)]
+    assert index.query((12, 12, 13, 13), [MASK]) == []
+    assert index.query((55, 55, 56, 56), [MASK], exclude="b") == []
+
+
+def test_find_overlaps_reports_each_pair_once_in_insertion_order():
+    index = FootprintIndex(cell_size=10)
+    index.insert("a", "A", {MASK: (0, 0, 10, 10)})
+    index.insert("b", "B", {MASK: (5, 5, 15, 15)})
+    index.insert("c", "C", {MASK: (8, 8, 30, 30)})
+    assert index.find_overlaps() == [("A", "B", MASK), ("A", "C", MASK), ("B", "C", MASK)]
+
+
+def test_remove_and_reinsert():
+    index = FootprintIndex(cell_size=10)
+    index.insert("a", "A", {MASK: (0, 0, 10, 10)})
+    index.insert("b", "B", {MASK: (5, 5, 15, 15)})
+    index.insert("b", "B", {MASK: (100, 100, 110, 110)})  # moved
+    assert index.find_overlaps() == []
+    index.remove("b")
+    assert len(index) == 1 and "b" not in index
+    assert index._cells.keys() == {(MASK, i, j) for i in (0, 1) for j in (0, 1)}
+
+
+def test_clearance_finds_rectangles_several_cells_away():
+    index = FootprintIndex(cell_size=5)
+    index.insert("a", "A", {MASK: (0, 0, 10, 10)})
+    assert index.clearance("a") == math.inf
+    index.insert("far", "Far", {MASK: (100, 0, 110, 10)})
+    index.insert("near", "Near", {MASK: (0, 40, 10, 50)})
+    assert index.clearance("a") == 30
+    assert index.clearance("far") == pytest.approx(90)
+
+
+def test_cell_size_must_be_positive():
+    with pytest.raises(ValueError):
+        FootprintIndex(cell_size=0)
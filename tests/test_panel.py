@@ -0,0 +1,89 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import pytest
+import cadquery as cq
+
+from cq_enclosure_builder import Face, Panel, PanelSize, PartFactory
+
+
+def vent():
+    return PartFactory.build("air_vent", part_type="basic rectangular", enclosure_wall_thickness=2)
+
+
+def wall_volume(panel: Panel) -> float:
+    return round(cq.Compound.makeCompound([o for o in panel.wall.objects if isinstance(o, cq.Shape)]).Volume(), 3)
+
+
+def assembled(layout, **panel_kwargs) -> Panel:
+    panel = Panel(Face.TOP, PanelSize(160, 120, 2), **panel_kwargs)
+    for label, pos in layout:
+        panel.add(label, vent(), rel_pos=pos)
+    return panel.assemble()
+
+
+def test_assemble_is_a_no_op_when_nothing_changed():
+    panel = assembled([("a", (0, 0))])
+    wall = panel.wall
+    assert not panel.dirty
+    assert panel.assemble().wall is wall
+
+
+def test_add_move_and_remove_match_a_fresh_panel():
+    panel = assembled([("a", (-40, 0)), ("b", (0, 0))])
+    panel.add("c", vent(), rel_pos=(40, 30))
+    panel.move("a", rel_pos=(-40, -30))
+    panel.remove("b")
+    assert panel.dirty
+    panel.assemble()
+    assert wall_volume(panel) == wall_volume(assembled([("a", (-40, -30)), ("c", (40, 30))]))
+    assert [child.name for child in panel.panel.children] == ["a", "c", "Wall"]
+
+
+def test_move_unknown_part_raises():
+    panel = assembled([("a", (0, 0))])
+    with pytest.raises(ValueError):
+        panel.move("nope", rel_pos=(0, 0))
+
+
+def test_overlaps_are_found_without_assembling():
+    panel = Panel(Face.TOP, PanelSize(160, 120, 2))
+    panel.add("a", vent(), rel_pos=(-40, 0))
+    panel.add("b", vent(), rel_pos=(-10, 0))   # masks 37 mm wide: overlapping "a"
+    panel.add("c", vent(), rel_pos=(60, 0))
+    assert ("a", "b", "mask") in panel.find_overlaps()
+    assert not any("c" in overlap[:2] for overlap in panel.find_overlaps())
+    assert panel.clearance("c", ["mask"]) == pytest.approx(70 - 37)
+    panel.move("b", rel_pos=(10, 40))
+    assert ("a", "b", "mask") not in panel.find_overlaps()
+    assert panel.overlaps_with(vent(), rel_pos=(60, 10), kinds=["mask"]) == [("c", "mask")]
+    assert panel.panel is None
+
+
+@pytest.mark.parametrize("change", [
+    lambda panel: setattr(panel, "add_chamfer", True),
+    lambda panel: setattr(panel.true_size, "wall_thickness", 3),
+])
+def test_changing_a_setting_after_assemble_rebuilds_the_wall(change):
+    panel = assembled([("a", (0, 0))])
+    change(panel)
+    assert panel.dirty
+    panel.assemble()
+
+    expected = Panel(Face.TOP, PanelSize(160, 120, 2))
+    expected.add("a", vent(), rel_pos=(0, 0))
+    change(expected)
+    assert wall_volume(panel) == wall_volume(expected.assemble())
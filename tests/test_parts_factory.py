@@ -0,0 +1,144 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import json
+import asyncio
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+from cq_enclosure_builder import PartFactory
+from cq_enclosure_builder.part_cache import PartLruCache
+
+
+def vent_spec(thickness: float):
+    return ("air_vent", {"part_type": "basic rectangular", "enclosure_wall_thickness": thickness})
+
+
+def build_vent(thickness: float):
+    return PartFactory.build("air_vent", part_type="basic rectangular", enclosure_wall_thickness=thickness)
+
+
+def test_lru_cache_evicts_the_least_recently_used_entry():
+    cache = PartLruCache(max_entries=2)
+    cache.put("a", "part a")
+    cache.put("b", "part b")
+    assert cache.get("a") == "part a"  # "b" is now the least recently used
+    cache.put("c", "part c")
+    assert "b" not in cache and "a" in cache and "c" in cache
+    info = cache.info()
+    assert (info.hits, info.evictions, info.entries) == (1, 1, 2)
+
+
+def test_lru_cache_limits_can_be_lowered():
+    cache = PartLruCache()
+    for key in "abcd":
+        cache.put(key, "part " + key)
+    cache.set_limits(max_entries=1)
+    assert len(cache) == 1 and "d" in cache
+
+
+def test_cache_limits_bound_the_part_factory_cache():
+    PartFactory.set_cache_limits(max_entries=2)
+    first = build_vent(2)
+    build_vent(3)
+    build_vent(4)
+    assert PartFactory.cache_info().evictions == 1
+    assert build_vent(2) is not first  # evicted, so built again
+    assert build_vent(4) is build_vent(4)
+
+
+def test_cache_limits_in_bytes():
+    build_vent(2)
+    PartFactory.set_cache_limits(max_bytes=1)
+    assert PartFactory.cache_info().entries == 0
+    PartFactory.set_cache_limits(max_bytes=10**9)
+    build_vent(2)
+    info = PartFactory.cache_info()
+    assert info.entries == 1 and 0 < info.bytes <= info.max_bytes
+
+
+def test_contexts_only_apply_to_their_own_thread():
+    resolved = {}
+    ready = threading.Barrier(2)
+
+    def resolve(name, thickness):
+        with PartFactory.context(parameters={"enclosure_wall_thickness": thickness}):
+            ready.wait()  # both contexts are entered before either resolves its request
+            request = PartFactory._resolve_build_request("air_vent", {"part_type": "basic rectangular"})
+            resolved[name] = request.kwargs["enclosure_wall_thickness"]
+
+    threads = [threading.Thread(target=resolve, args=(name, thickness)) for name, thickness in (("a", 2), ("b", 3))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resolved == {"a": 2, "b": 3}
+    assert "enclosure_wall_thickness" not in PartFactory.default_parameters
+
+
+def test_nested_contexts_override_the_enclosing_ones():
+    with PartFactory.context(parameters={"enclosure_wall_thickness": 2, "width": 20}):
+        with PartFactory.context(parameters={"enclosure_wall_thickness": 3}):
+            kwargs = PartFactory._resolve_build_request("air_vent", {"part_type": "basic rectangular"}).kwargs
+    assert (kwargs["enclosure_wall_thickness"], kwargs["width"]) == (3, 20)
+
+
+def test_concurrent_abuild_calls_share_one_build():
+    async def build_twice():
+        return await asyncio.gather(
+            PartFactory.abuild("air_vent", part_type="basic rectangular", enclosure_wall_thickness=2),
+            PartFactory.abuild("air_vent", part_type="basic rectangular", enclosure_wall_thickness=2),
+        )
+
+    first, second = asyncio.run(build_twice())
+    assert first is second
+    assert [entry.builds for entry in PartFactory.build_stats.entries()] == [1]
+    assert PartFactory._in_flight == {}
+
+
+def test_cancelled_abuild_call_leaves_the_build_running():
+    async def cancel_then_build():
+        call = asyncio.ensure_future(PartFactory.abuild("air_vent", part_type="basic rectangular", enclosure_wall_thickness=2))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        try:
+            await call
+        except asyncio.CancelledError:
+            pass
+        for task in list(PartFactory._in_flight.values()):
+            await task
+
+    asyncio.run(cancel_then_build())
+    assert PartFactory.cache_info().entries == 1  # stored by the build of the cancelled call
+
+
+def test_manifest_records_each_part_built_from_threads_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(PartFactory, "_built_requests", {})
+    specs = [vent_spec(thickness) for thickness in (2, 3, 4)] * 4
+    PartFactory.build_many(specs, executor=ThreadPoolExecutor(max_workers=4))
+    manifest_path = tmp_path / "manifest.json"
+    assert PartFactory.save_manifest(str(manifest_path)) == 3
+    with open(manifest_path) as f:
+        thicknesses = sorted(entry["kwargs"]["enclosure_wall_thickness"] for entry in json.load(f))
+    assert thicknesses == [2, 3, 4]
+
+
+def test_parts_with_unpicklable_parameters_are_built_in_this_process(capsys):
+    request = SimpleNamespace(part_class=dict, kwargs={"callback": lambda: 1}, category="category", part_type="type")
+    assert not PartFactory._can_build_in_worker(request)
+    assert capsys.readouterr().out.count("WARNING: category/type can't be built in a worker process") == 1
+    assert PartFactory._can_build_in_worker(SimpleNamespace(part_class=dict, kwargs={"width": 1}))
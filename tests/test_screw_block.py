@@ -0,0 +1,44 @@
+"""
+   Copyright 2025 Raphaël Isvelin
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from cq_enclosure_builder import PartFactory
+from cq_enclosure_builder.parts.common.screw_block import ScrewBlock
+from cq_enclosure_builder.parts.common.generic_screw_provider import GenericScrewProvider
+
+
+def test_blocks_are_reused_and_returned_as_new_workplanes():
+    first = ScrewBlock().m3(5)
+    second = ScrewBlock().m3(5)
+    assert first["block"] is not second["block"]
+    assert first["block"].val().Volume() == second["block"].val().Volume()
+    assert len(ScrewBlock._geometry_cache) == 1
+
+
+def test_geometry_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(ScrewBlock, "GEOMETRY_CACHE_MAX_ENTRIES", 2)
+    for thickness in (4, 5, 6):
+        ScrewBlock().m3(thickness)
+    ScrewBlock().m3(5)  # most recently used
+    ScrewBlock().m3(7)
+    assert [key[2][1] for key in ScrewBlock._geometry_cache] == [5, 7]
+
+
+def test_part_factory_clear_cache_empties_the_geometry_cache_and_the_fastener_pool():
+    ScrewBlock().m3(5)
+    assert len(GenericScrewProvider._fastener_pool) > 0
+    PartFactory.clear_cache()
+    assert len(ScrewBlock._geometry_cache) == 0
+    assert len(GenericScrewProvider._fastener_pool) == 0